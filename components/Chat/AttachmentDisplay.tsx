@@ -58,6 +58,12 @@ export const AttachmentDisplay: React.FC<AttachmentDisplayProps> = ({
     return !documentStates || (documentStates && documentStates[document.id] == 100);
   };
 
+  // Exposed as data-upload-state: uploading to storage, processing (95%) or ready
+  const getUploadState = (document: AttachedDocument) => {
+    if (isFileComplete(document)) return 'ready';
+    return (documentStates?.[document.id] ?? 0) >= 95 ? 'processing' : 'uploading';
+  };
+
   const getFileProgress = (document: AttachedDocument) => {
     if (documentStates && documentStates[document.id]) {
       const percentage = documentStates[document.id];
@@ -171,6 +177,9 @@ export const AttachmentDisplay: React.FC<AttachmentDisplayProps> = ({
           return (
             <div
               key={attachment.id}
+              id="attachedFile"
+              data-file-name={document.name}
+              data-upload-state={getUploadState(document)}
               className={`${isComplete ? 'bg-white' : 'bg-yellow-400'} flex flex-row items-center justify-between border bg-white rounded-md px-1 py-1 shadow-md dark:shadow-lg`}
               style={{ maxWidth: DISPLAY_CONFIG.MAX_ATTACHMENT_WIDTH }}
               onMouseEnter={() => setHoveredItem(attachment.id)}
@@ -847,6 +847,7 @@ export const ChatMessage: FC<Props> = memo(({
                                     {!isEditing && !isHighlightDisplay && (
                                       <>
                                           <div className="flex flex-grow"
+                                               id={`assistantMessage${messageIndex}`}
                                                ref={setContentRef}
                                           >
                                             <ChatContentBlock
@@ -55,6 +55,12 @@ export const FileList: FC<Props> = ({ documents, setDocuments , documentStates,
         return !documentStates || (documentStates && documentStates[document.id] == 100);
     }
 
+    // Exposed as data-upload-state: uploading to storage, processing (95%) or ready
+    const getUploadState = (document:AttachedDocument) => {
+        if (isComplete(document)) return 'ready';
+        return (documentStates?.[document.id] ?? 0) >= 95 ? 'processing' : 'uploading';
+    }
+
     const getProgress = (document:AttachedDocument) => {
 
         if (documentStates && documentStates[document.id]) {
@@ -107,6 +113,9 @@ export const FileList: FC<Props> = ({ documents, setDocuments , documentStates,
             {documents?.map((document, i) => (
                 <div
                     key={i}
+                    id="attachedFile"
+                    data-file-name={document.name}
+                    data-upload-state={getUploadState(document)}
                     className={`${isComplete(document) ? 'bg-white' : 'bg-yellow-400'} flex flex-row items-center justify-between border bg-white rounded-md px-1 py-1 ml-1 mr-1 shadow-md dark:shadow-lg`}
                     style={{ maxWidth: '220px' }}
                 >
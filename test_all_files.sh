@@ -27,6 +27,11 @@ export ENV_FILE="$SCRIPT_DIR/.env.local"
 # Navigate to the project directory
 cd "$SCRIPT_DIR" || { echo "Directory not found"; exit 1; }
 
+# Hand off to the parallel runner when a worker count is given
+if [ -n "$TEST_WORKERS" ]; then
+  exec python3 -m tests.runner "$1" --workers "$TEST_WORKERS"
+fi
+
 # Function to run tests in a specific directory
 run_tests_in_directory() {
   local dir=$1
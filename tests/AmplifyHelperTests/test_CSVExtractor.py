@@ -17,26 +17,7 @@ class CSVExtractorTests(BaseTest):
         super().setUp(headless=True)
         
     def click_assistants_tab(self):
-        
-        time.sleep(5)
-        
-        tab_buttons = self.wait.until(
-            EC.presence_of_all_elements_located((By.ID, "tabSelection"))
-        )
-
-        # Search for the one with title including 'Assistants'
-        assistants_button = next(
-            (btn for btn in tab_buttons if "Assistants" in btn.get_attribute("title")),
-            None
-        )
-
-        self.assertIsNotNone(assistants_button, "'Assistants' tab button not found")
-
-        # Click the Assistants button
-        assistants_button.click()
-
-        # Wait briefly for UI to respond
-        time.sleep(2)
+        self.right_sidebar.open()
 
     # ----------------- Test CSV Extractor can be clicked -----------------
     """Ensure the CSV Extractor button in the Amplify Helpers folder can be clicked 
@@ -359,7 +340,7 @@ class CSVExtractorTests(BaseTest):
         
         save_button.click()
         
-        time.sleep(15)
+        self.wait_for_assistant_reply()
 
 
 if __name__ == "__main__":
@@ -9,6 +9,7 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.support.ui import Select
 from tests.base_test import BaseTest
+from tests import documents
 
 
 class SummaryWithQuotationsTests(BaseTest):
@@ -18,26 +19,7 @@ class SummaryWithQuotationsTests(BaseTest):
         super().setUp(headless=True)
         
     def click_assistants_tab(self):
-        
-        time.sleep(5)
-        
-        tab_buttons = self.wait.until(
-            EC.presence_of_all_elements_located((By.ID, "tabSelection"))
-        )
-
-        # Search for the one with title including 'Assistants'
-        assistants_button = next(
-            (btn for btn in tab_buttons if "Assistants" in btn.get_attribute("title")),
-            None
-        )
-
-        self.assertIsNotNone(assistants_button, "'Assistants' tab button not found")
-
-        # Click the Assistants button
-        assistants_button.click()
-
-        # Wait briefly for UI to respond
-        time.sleep(2)
+        self.right_sidebar.open()
         
     def upload_file(self, filename: str):
         try:
@@ -45,15 +27,8 @@ class SummaryWithQuotationsTests(BaseTest):
             current_dir = os.path.dirname(os.path.abspath(__file__))  # tests/AmplifyHelperTests/
             file_path = os.path.abspath(os.path.join(current_dir, "..", "test_files", filename))
 
-            # Locate the hidden file input element
-            file_input = self.wait.until(
-                EC.presence_of_element_located((By.ID, "__idVarFile0"))
-            )
-
-            # Send the full path to the input
-            file_input.send_keys(file_path)
-
-            time.sleep(20)  # Give it a sec to process the upload
+            # Send the full path to the file input and wait until it is processed
+            self.upload_test_file(file_path, input_id="__idVarFile0")
 
         except Exception as e:
             self.fail(f"Failed to upload file '{filename}': {e}")
@@ -455,7 +430,7 @@ class SummaryWithQuotationsTests(BaseTest):
         
         save_button.click()
         
-        time.sleep(15)
+        self.wait_for_assistant_reply()
         
         
         
@@ -540,7 +515,30 @@ class SummaryWithQuotationsTests(BaseTest):
         
         save_button.click()
         
-        time.sleep(15)
+        self.wait_for_assistant_reply()
+
+    # ----------------- Test Summary with Quotations Document Size -----------------
+    """Ensure Summary with Quotations answers for generated documents of growing
+       size and report how long extraction and the summary take per size"""
+
+    def test_summary_with_quotations_document_size(self):
+        # One small document unless AMPLIFY_DOCUMENT_SIZES=all; the largest
+        # generated sizes do not fit in the model's context
+        for fmt, params in documents.configured_sizes(("txt", "pdf", "docx"), per_format=2):
+            with self.subTest(format=fmt, **params):
+                self.right_sidebar.open().expand_folder("Amplify Helpers")
+                self.right_sidebar.click("promptName", "Summary with Quotations")
+                self.wait_for_text("modalTitle", "Summary with Quotations")
+
+                record = self.upload_generated_file(fmt, input_id="__idVarFile0", **params)
+                self.addCleanup(self.delete_uploaded_file, record["file"])
+                started = time.monotonic()
+                self.right_sidebar.click("confirmationButton", "Submit")
+                self.wait_for_assistant_reply(timeout=300)
+                print(
+                    f"{record['file']} ({record['bytes'] / 1e6:.2f} MB): ready in "
+                    f"{record['total_seconds']:.2f}s, summarized in {time.monotonic() - started:.2f}s"
+                )
 
 
 if __name__ == "__main__":
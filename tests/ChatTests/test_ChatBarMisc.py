@@ -39,46 +39,11 @@ class ChatBarMiscTests(BaseTest):
             expand_sidebar_button.click()
         
     def click_assistants_tab(self):
-        time.sleep(5)
-        tab_buttons = self.wait.until(EC.presence_of_all_elements_located((By.ID, "tabSelection")))
-        assistants_button = next((btn for btn in tab_buttons if "Assistants" in btn.get_attribute("title")), None)
-        self.assertIsNotNone(assistants_button, "'Assistants' tab button not found")
-        assistants_button.click()
-
-        time.sleep(2)
+        self.right_sidebar.open()
         
     # ----------------- Setup Test Data ------------------  
     def create_assistant(self, assistant_name):
-        self.click_assistants_tab()
-        assistant_add_button = self.wait.until(EC.element_to_be_clickable((By.ID, "addAssistantButton")))
-        self.assertIsNotNone(assistant_add_button, "Add Assistant button should be initialized and clickable")
-        assistant_add_button.click()
-        
-        assistant_name_input = self.wait.until(EC.presence_of_element_located((By.ID, "assistantName")))
-        self.assertIsNotNone(assistant_name_input, "Assistant Name input should be present")
-        assistant_name_input.clear()
-        assistant_name_input.send_keys(assistant_name)
-        
-        assistant_save_button = self.wait.until(EC.presence_of_all_elements_located((By.ID, "confirmationButton")))
-        self.assertIsNotNone(assistant_save_button, "Save button should be initialized and clickable")
-        assistant_save_button[-1].click()
-        
-        time.sleep(5)
-        drop_name_elements = self.wait.until(EC.presence_of_all_elements_located((By.ID, "dropName")))
-        self.assertTrue(drop_name_elements, "Drop name elements should be initialized")
-        assistant_dropdown_button = next((el for el in drop_name_elements if el.text == "Assistants"), None)
-        self.assertIsNotNone(assistant_dropdown_button, "Assistants button should be present")
-        
-        # Ensure the parent button's title is "Collapse folder" before clicking
-        parent_button = assistant_dropdown_button.find_element(By.XPATH, "./ancestor::button")
-        button_title = parent_button.get_attribute("title")
-        if button_title != "Collapse folder":
-            assistant_dropdown_button.click()
-        
-        prompt_name_elements = self.wait.until(EC.presence_of_all_elements_located((By.ID, "promptName")))
-        self.assertTrue(prompt_name_elements, "Prompt name elements should be initialized")
-        assistant_in_list = next((el for el in prompt_name_elements if el.text == assistant_name), None)
-        self.assertIsNotNone(assistant_in_list, f"{assistant_name} should be visible in the dropdown")
+        self.right_sidebar.open().create_assistant(assistant_name)
     
     # ----------------- Test Upload Files -----------------
     """This test ensures that the upolad files button can be hit and that the system-generated 
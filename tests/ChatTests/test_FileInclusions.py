@@ -2,6 +2,7 @@ import unittest
 import time
 import os
 import re
+import urllib.error
 from dotenv import load_dotenv
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -14,6 +15,7 @@ from selenium.common.exceptions import NoAlertPresentException
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import Select
 from tests.base_test import BaseTest
+from tests import documents, mocks, uploads
 
 class FileInclusionTests(BaseTest):
     
@@ -41,12 +43,8 @@ class FileInclusionTests(BaseTest):
         
         # print(f"Uploading file: {file_path}")
         
-        file_input = self.driver.find_element(By.ID, "__attachFile")
-        self.driver.execute_script("arguments[0].classList.remove('sr-only');", file_input)
-        self.driver.execute_script("arguments[0].style.display = 'block';", file_input)
-        # print("Sending file to input field...")
-        file_input.send_keys(file_path)
-        time.sleep(35) 
+        # Returns once the attached file is processed and ready to use
+        self.upload_test_file(file_path)
         
     def sidebar_press(self):
         time.sleep(1)  # Optional; remove if not strictly necessary
@@ -66,18 +64,7 @@ class FileInclusionTests(BaseTest):
             expand_sidebar_button.click()
         
     def send_message(self, message):
-        # Locate the chatbar to input in messageChatInputText
-        chat_input_bar = self.wait.until(EC.presence_of_element_located((By.ID, "messageChatInputText")))
-        self.assertTrue(chat_input_bar, "Chat bar input should be initialized")
-        chat_input_bar.send_keys(message)
-        
-        time.sleep(2)
-        
-        # Locate the send message button
-        chat_send_message = self.wait.until(EC.presence_of_element_located((By.ID, "sendMessage")))
-        self.assertTrue(chat_send_message, "Send message button should be initialized")
-        chat_send_message.click()
-        time.sleep(30)
+        self.chat.send_message(message)
         
     # ----------------- Test Files Inclusion -----------------
     """This test ensures that an uploaded txt file can be viewed in the Files Menu"""
@@ -485,6 +472,35 @@ class FileInclusionTests(BaseTest):
                 break
 
         self.assertFalse(found, "Test_10.csv should not be present in the files table.")
+
+    # ----------------- Test Upload Throughput -----------------
+    """This test uploads generated documents of growing size in every supported
+       format and reports how upload and processing time scale with file size
+       (one small document unless AMPLIFY_DOCUMENT_SIZES=all)"""
+
+    def test_file_inclusions_upload_throughput(self):
+        # One small document unless AMPLIFY_DOCUMENT_SIZES=all, see tests/documents.py
+        records = []
+        for fmt, params in documents.configured_sizes():
+            with self.subTest(format=fmt, **params):
+                record = self.upload_generated_file(fmt, **params)
+                self.addCleanup(self.delete_uploaded_file, record["file"])
+                records.append(record)
+                print(f"{record['file']}: {record['bytes'] / 1e6 / record['total_seconds']:.2f} MB/s")
+            # Start the next upload without the previous chips attached
+            self.driver.refresh()
+            self.wait_for("messageChatInputText", timeout=30)
+
+        for file_type, stats in uploads.summarize(records).items():
+            print(f"{file_type}: {stats['seconds_per_mb']} s/MB over {stats['uploads']} uploads")
+
+        # With the storage mock the receiving side measured the throughput too
+        try:
+            received = mocks.control("storage", "/__mock/uploads", timeout=2)
+        except (urllib.error.URLError, OSError):
+            received = []
+        for upload in received:
+            print(f"{upload['name']}: received at {upload['mb_per_second']} MB/s, processed in {upload['processing_seconds']}s")
     
     
     # visibleTypes={["Word", "PDF", "Markdown", "Text", "HTML"]}
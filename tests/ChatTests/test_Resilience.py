@@ -0,0 +1,75 @@
+import unittest
+import urllib.error
+from tests.base_test import BaseTest
+from tests import mocks, resilience
+
+
+class ResilienceBenchmarkTests(BaseTest):
+    """Measures how the chat UI copes with slow and failing backends.
+
+    Needs the chat mock (and optionally the backend mock) from tests/mocks,
+    e.g. ``python3 -m tests.runner 3 --mocks chat,backend``; the profiles are
+    the ones in tests/mocks/faults.py.
+    """
+
+    def setUp(self):
+        self.mocked = []
+        # Call the parent setUp with headless=True (or False for debugging)
+        super().setUp(headless=True)
+
+    def tearDown(self):
+        # Leave the mocks without injected faults for the next test
+        for name in self.mocked:
+            mocks.control(name, "/__mock/profile", {"rules": []})
+        super().tearDown()
+
+    # ----------------- Setup Test Data ------------------
+    def use_profile(self, profile):
+        for name in self.mocked:
+            mocks.control(name, "/__mock/profile", {"profile": profile})
+
+    def running_mocks(self):
+        running = []
+        for name in ("chat", "backend"):
+            try:
+                mocks.control(name, "/__mock/health", timeout=2)
+                running.append(name)
+            except (urllib.error.URLError, OSError):
+                pass
+        return running
+
+    # ----------------- Test Resilience Benchmark -----------------
+    """Sends a message under every fault profile and records how long until
+       the chat input is usable again and how much of the reply the UI kept"""
+
+    def test_resilience_benchmark(self):
+        self.mocked = self.running_mocks()
+        if "chat" not in self.mocked:
+            self.skipTest("The chat mock is not running, start it with --mocks chat")
+
+        self.reset_state("conversations")
+        records = []
+        for profile in resilience.benchmark_profiles():
+            with self.subTest(profile=profile):
+                self.use_profile(profile)
+                self.left_sidebar.create_chat(f"Resilience {profile}")
+                message = f"Resilience check under the {profile} profile"
+                result = resilience.measure_send(self.driver, message)
+                # Injected errors never reach the chat mock, so there is no reply to compare with
+                sent = [c for c in mocks.control("chat", "/__mock/chats") if message in (c["message"] or "")]
+                reply = sent[-1].get("reply", "") if sent else ""
+                records.append(resilience.record_result(profile, result, len(reply) or None))
+
+                # Whatever happened to the stream, the chat has to accept a new message
+                input_box = self.wait_for("messageChatInputText")
+                self.assertTrue(input_box.is_enabled(), f"Chat input disabled after the {profile} profile")
+
+        for profile, stats in resilience.summarize(records).items():
+            print(
+                f"{profile}: interactive after {stats['median_interactive_seconds']}s, "
+                f"kept {stats['mean_kept']} of the reply"
+            )
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
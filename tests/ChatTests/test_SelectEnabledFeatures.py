@@ -80,18 +80,7 @@ class SelectEnabledFeaturesTests(BaseTest):
             raise ValueError("Failed to extract final X position")
         
     def send_message(self, message):
-        # Locate the chatbar to input in messageChatInputText
-        chat_input_bar = self.wait.until(EC.presence_of_element_located((By.ID, "messageChatInputText")))
-        self.assertTrue(chat_input_bar, "Chat bar input should be initialized")
-        chat_input_bar.send_keys(message)
-        
-        time.sleep(2)
-        
-        # Locate the send message button
-        chat_send_message = self.wait.until(EC.presence_of_element_located((By.ID, "sendMessage")))
-        self.assertTrue(chat_send_message, "Send message button should be initialized")
-        chat_send_message.click()
-        time.sleep(15)
+        self.chat.send_message(message)
 
     # ----------------- Test Select Enabled Features -----------------
     """This test ensures that the Select Enabled Features Movable Button is selectable and that
@@ -204,7 +193,6 @@ class SelectEnabledFeaturesTests(BaseTest):
         select_enabled_features_list[0].click() # Clicks the Code Interpretor button
         
         self.send_message("Interpret this code: std::cout << 'Hello, world!' << std::endl;")
-        time.sleep(20) # Extra 30 seconds since Code Interpretor is Long
     
     # ----------------- Test Select Enabled Features Clear All Enabled Features -----------------
     """This test ensures the Select Enabled Features Clear All Enabled Features button is selectable."""
@@ -231,7 +219,6 @@ class SelectEnabledFeaturesTests(BaseTest):
         time.sleep(2)
         
         self.send_message("Interpret this code: std::cout << 'Hello, world!' << std::endl;")
-        time.sleep(20) # Extra 30 seconds since Code Interpretor is Long
         
         select_enabled_features_list = self.wait.until(EC.presence_of_all_elements_located((By.ID, "enabledFeatureIndex")))
         select_enabled_features_list[3].click() # Clicks the Code Interpretor button
@@ -0,0 +1,52 @@
+import time
+from selenium.webdriver.common.by import By
+from tests.base_test import BaseTest
+from tests import datasets, reset, waits
+
+
+class LargeAccountTests(BaseTest):
+
+    def setUp(self):
+        # Call the parent setUp with headless=True (or False for debugging)
+        super().setUp(headless=True)
+        # Leave no seeded dataset behind in the shared browser storage for the next test;
+        # a cleanup, so a failed reset does not hide the test's own result
+        self.addCleanup(self.reset_state, "conversations", "folders", "prompts")
+
+    # ----------------- Test Search Large Account -----------------
+    """This test ensures a chat can still be found with the Left Side Bar search
+       once the account holds as many conversations as a production user"""
+
+    def test_search_large_account(self):
+        for size in datasets.configured_sizes():
+            with self.subTest(size=size):
+                dataset = self.seed_dataset(size)
+                target = dataset["conversations"][-1]["name"]
+
+                started = time.monotonic()
+                search_bar = self.wait_for("SearchBar")
+                search_bar.clear()
+                search_bar.send_keys(target)
+                self.wait_for_text("chatName", target, timeout=60)
+                print(f"Found {target!r} among {size} chats in {time.monotonic() - started:.2f}s")
+
+    # ----------------- Test Mass Delete Large Account -----------------
+    """This test ensures every chat of a large account can be deleted at once
+       via the three dots handler on the Left Side Bar"""
+
+    def test_delete_large_account(self):
+        for size in datasets.configured_sizes():
+            with self.subTest(size=size):
+                self.seed_dataset(size)
+
+                started = time.monotonic()
+                self.left_sidebar.delete_chats()
+                waits.poll(self.driver, 120).until(
+                    lambda d: not reset.leftovers(d, ("conversations",)),
+                    f"Not every one of {size} chats was deleted within 120s",
+                )
+                self.assertFalse(
+                    [el for el in self.driver.find_elements(By.ID, "chatName") if el.text != "New Conversation"],
+                    "Deleted chats should be gone from the Left Side Bar",
+                )
+                print(f"Deleted {size} chats in {time.monotonic() - started:.2f}s")
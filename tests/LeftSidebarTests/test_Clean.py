@@ -15,6 +15,7 @@ from selenium.common.exceptions import TimeoutException
 from selenium.common.exceptions import NoAlertPresentException
 from selenium.webdriver.common.keys import Keys
 from tests.base_test import BaseTest
+from tests import seeding
 
 
 class MassDeleteTests(BaseTest):
@@ -23,72 +24,18 @@ class MassDeleteTests(BaseTest):
         # Call the parent setUp with headless=True (or False for debugging)
         super().setUp(headless=True)
 
-    # ----------------- Setup Test Data ------------------
-    def create_chat(self, chat_name):
-        prompt_buttons = self.wait.until(
-            EC.presence_of_all_elements_located((By.ID, "promptButton"))
-        )
-        self.assertTrue(prompt_buttons, "New Chat elements should be initialized")
-        chat_add_button = next(
-            (el for el in prompt_buttons if el.text == "New Chat"), None
-        )
-        self.assertIsNotNone(chat_add_button, "New Chat button should be present")
-        chat_add_button.click()
-
-        time.sleep(2)
-
-        chat_name_elements = self.wait.until(
-            EC.presence_of_all_elements_located((By.ID, "chatName"))
-        )
-        self.assertTrue(chat_name_elements, "Drop name elements should be initialized")
-        chats = next(
-            (el for el in chat_name_elements if el.text == "New Conversation"), None
-        )
-        self.assertIsNotNone(chats, "New Conversation button should be present")
-        chat_click = chats.find_element(By.XPATH, "./ancestor::button")
-        button_id = chat_click.get_attribute("id")
-        self.assertEqual(button_id, "chatClick", "Button should be called chatClick")
-        chat_click.click()
-
-        rename_button = self.wait.until(
-            EC.element_to_be_clickable((By.ID, "isRenaming"))
-        )
-        self.assertIsNotNone(
-            rename_button, "Rename button should be initialized and clicked"
-        )
-        rename_button.click()
-
-        rename_field = self.wait.until(
-            EC.presence_of_element_located((By.ID, "isRenamingInput"))
-        )
-        rename_field.clear()
-        rename_field.send_keys(chat_name)
-        rename_confirm_button = self.wait.until(
-            EC.element_to_be_clickable((By.ID, "handleConfirm"))
-        )
-        self.assertIsNotNone(
-            rename_confirm_button,
-            "Rename confirm button should be initialized and clicked",
-        )
-        rename_confirm_button.click()
-        drop_name_elements = self.wait.until(
-            EC.presence_of_all_elements_located((By.ID, "chatName"))
-        )
-        self.assertTrue(drop_name_elements, "Drop name elements should be initialized")
-
-        time.sleep(2)
-
-        folder = next((el for el in drop_name_elements if el.text == chat_name), None)
-        self.assertIsNotNone(folder, "New Conversation button should be present")
-
     # ----------------- Test Clean Chats -----------------
     def test_clean_chats(self):
 
-        self.create_chat("Gricko")
-        self.create_chat("Frost")
-        self.create_chat("Torbek")
-        self.create_chat("Gideon")
-        self.create_chat("Kremy")
+        self.seed(
+            conversations=[
+                seeding.conversation("Gricko"),
+                seeding.conversation("Frost"),
+                seeding.conversation("Torbek"),
+                seeding.conversation("Gideon"),
+                seeding.conversation("Kremy"),
+            ]
+        )
 
         # Click the promptHandler Button
         prompt_handler_button = self.wait.until(
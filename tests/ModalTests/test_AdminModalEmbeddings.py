@@ -28,26 +28,7 @@ class AccountModalTests(BaseTest):
     
     # ----------------- Setup Test Data ------------------
     def settings_admin_interface(self):
-
-        time.sleep(5)
-
-        user_menu = self.wait.until(EC.presence_of_element_located((By.ID, "userMenu")))
-        self.assertTrue(user_menu, "User Menu button is present")
-        user_menu.click()
-        time.sleep(3)
-
-        settings_select = self.wait.until(EC.presence_of_element_located((By.ID, "adminInterface")))
-        self.assertTrue(settings_select, "The Admin button should be present")
-        settings_select.click()
-        time.sleep(7)
-        
-        admin_tabs = self.wait.until(EC.presence_of_all_elements_located((By.ID, "tabName")))
-        self.assertGreater(len(admin_tabs), 1, "Expected multiple buttons with ID 'tabName'")
-        admin_supported_models_tab = next((tab for tab in admin_tabs if tab.text == "Embeddings"), None)
-        self.assertIsNotNone(admin_supported_models_tab, "The 'Embeddings' tab should be present")
-        admin_supported_models_tab.click()
-        
-        time.sleep(5)
+        self.admin_modal.open("Embeddings")
     
     # ----------------- Test Embeddings -----------------
     def test_presence_of_embeddings(self):
@@ -28,26 +28,7 @@ class AccountModalTests(BaseTest):
     
     # ----------------- Setup Test Data ------------------
     def settings_admin_interface(self):
-
-        time.sleep(5)
-
-        user_menu = self.wait.until(EC.presence_of_element_located((By.ID, "userMenu")))
-        self.assertTrue(user_menu, "User Menu button is present")
-        user_menu.click()
-        time.sleep(3)
-
-        settings_select = self.wait.until(EC.presence_of_element_located((By.ID, "adminInterface")))
-        self.assertTrue(settings_select, "The Admin button should be present")
-        settings_select.click()
-        time.sleep(7)
-        
-        admin_tabs = self.wait.until(EC.presence_of_all_elements_located((By.ID, "tabName")))
-        self.assertGreater(len(admin_tabs), 1, "Expected multiple buttons with ID 'tabName'")
-        admin_supported_models_tab = next((tab for tab in admin_tabs if tab.text == "Integrations"), None)
-        self.assertIsNotNone(admin_supported_models_tab, "The 'Integrations' tab should be present")
-        admin_supported_models_tab.click()
-        
-        time.sleep(5)
+        self.admin_modal.open("Integrations")
     
     # ----------------- Test Integrations Google -----------------
     def test_presence_of_integrations_google(self):
@@ -72,37 +53,37 @@ class AccountModalTests(BaseTest):
         self.assertIsNotNone(integrations_client_tenant_label, "Integrations tenant id should be present")
         
         integration_id_google_calendar = self.wait.until(
-            EC.presence_of_element_located((By.ID, "google_calendar"))
+            EC.presence_of_element_located((By.ID, "google_calendar"))  # locator: dynamic
         )
         self.assertIsNotNone(integration_id_google_calendar, "Integration id google calendar should be present")
         
         integration_id_google_sheets = self.wait.until(
-            EC.presence_of_element_located((By.ID, "google_sheets"))
+            EC.presence_of_element_located((By.ID, "google_sheets"))  # locator: dynamic
         )
         self.assertIsNotNone(integration_id_google_sheets, "Integration id google sheets should be present")
         
         integration_id_google_docs = self.wait.until(
-            EC.presence_of_element_located((By.ID, "google_docs"))
+            EC.presence_of_element_located((By.ID, "google_docs"))  # locator: dynamic
         )
         self.assertIsNotNone(integration_id_google_docs, "Integration id google docs should be present")
         
         integration_id_google_drive = self.wait.until(
-            EC.presence_of_element_located((By.ID, "google_drive"))
+            EC.presence_of_element_located((By.ID, "google_drive"))  # locator: dynamic
         )
         self.assertIsNotNone(integration_id_google_drive, "Integration id google drive should be present")
         
         integration_id_google_forms = self.wait.until(
-            EC.presence_of_element_located((By.ID, "google_forms"))
+            EC.presence_of_element_located((By.ID, "google_forms"))  # locator: dynamic
         )
         self.assertIsNotNone(integration_id_google_forms, "Integration id google forms should be present")
         
         integration_id_google_gmail = self.wait.until(
-            EC.presence_of_element_located((By.ID, "google_gmail"))
+            EC.presence_of_element_located((By.ID, "google_gmail"))  # locator: dynamic
         )
         self.assertIsNotNone(integration_id_google_gmail, "Integration id google gmail should be present")
         
         integration_id_google_contacts = self.wait.until(
-            EC.presence_of_element_located((By.ID, "google_contacts"))
+            EC.presence_of_element_located((By.ID, "google_contacts"))  # locator: dynamic
         )
         self.assertIsNotNone(integration_id_google_contacts, "Integration id google contacts should be present")
         
@@ -129,57 +110,57 @@ class AccountModalTests(BaseTest):
         self.assertIsNotNone(integrations_client_tenant_label, "Integrations tenant id should be present")
         
         integration_id_microsoft_calendar = self.wait.until(
-            EC.presence_of_element_located((By.ID, "microsoft_calendar"))
+            EC.presence_of_element_located((By.ID, "microsoft_calendar"))  # locator: dynamic
         )
         self.assertIsNotNone(integration_id_microsoft_calendar, "Integration id microsoft calendar should be present")
         
         integration_id_microsoft_drive = self.wait.until(
-            EC.presence_of_element_located((By.ID, "microsoft_drive"))
+            EC.presence_of_element_located((By.ID, "microsoft_drive"))  # locator: dynamic
         )
         self.assertIsNotNone(integration_id_microsoft_drive, "Integration id microsoft drive should be present")
         
         integration_id_microsoft_excel = self.wait.until(
-            EC.presence_of_element_located((By.ID, "microsoft_excel"))
+            EC.presence_of_element_located((By.ID, "microsoft_excel"))  # locator: dynamic
         )
         self.assertIsNotNone(integration_id_microsoft_excel, "Integration id microsoft excel should be present")
         
         integration_id_microsoft_onenote = self.wait.until(
-            EC.presence_of_element_located((By.ID, "microsoft_onenote"))
+            EC.presence_of_element_located((By.ID, "microsoft_onenote"))  # locator: dynamic
         )
         self.assertIsNotNone(integration_id_microsoft_onenote, "Integration id microsoft onenote should be present")
         
         integration_id_microsoft_outlook = self.wait.until(
-            EC.presence_of_element_located((By.ID, "microsoft_outlook"))
+            EC.presence_of_element_located((By.ID, "microsoft_outlook"))  # locator: dynamic
         )
         self.assertIsNotNone(integration_id_microsoft_outlook, "Integration id microsoft outlook should be present")
         
         integration_id_microsoft_word = self.wait.until(
-            EC.presence_of_element_located((By.ID, "microsoft_word"))
+            EC.presence_of_element_located((By.ID, "microsoft_word"))  # locator: dynamic
         )
         self.assertIsNotNone(integration_id_microsoft_word, "Integration id microsoft word should be present")
         
         integration_id_microsoft_planner = self.wait.until(
-            EC.presence_of_element_located((By.ID, "microsoft_planner"))
+            EC.presence_of_element_located((By.ID, "microsoft_planner"))  # locator: dynamic
         )
         self.assertIsNotNone(integration_id_microsoft_planner, "Integration id microsoft planner should be present")
         
         integration_id_microsoft_sharepoint = self.wait.until(
-            EC.presence_of_element_located((By.ID, "microsoft_sharepoint"))
+            EC.presence_of_element_located((By.ID, "microsoft_sharepoint"))  # locator: dynamic
         )
         self.assertIsNotNone(integration_id_microsoft_sharepoint, "Integration id microsoft sharepoint should be present")
         
         integration_id_microsoft_teams = self.wait.until(
-            EC.presence_of_element_located((By.ID, "microsoft_teams"))
+            EC.presence_of_element_located((By.ID, "microsoft_teams"))  # locator: dynamic
         )
         self.assertIsNotNone(integration_id_microsoft_teams, "Integration id microsoft teams should be present")
         
         integration_id_microsoft_contacts = self.wait.until(
-            EC.presence_of_element_located((By.ID, "microsoft_contacts"))
+            EC.presence_of_element_located((By.ID, "microsoft_contacts"))  # locator: dynamic
         )
         self.assertIsNotNone(integration_id_microsoft_contacts, "Integration id microsoft contacts should be present")
         
         integration_id_microsoft_user_groups = self.wait.until(
-            EC.presence_of_element_located((By.ID, "microsoft_user_groups"))
+            EC.presence_of_element_located((By.ID, "microsoft_user_groups"))  # locator: dynamic
         )
         self.assertIsNotNone(integration_id_microsoft_user_groups, "Integration id microsoft user groups should be present")
 
@@ -22,47 +22,7 @@ class AssistantModalTests(BaseTest):
  
     # ----------------- Setup Test Data ------------------  
     def create_assistant(self, assistant_name):
-        time.sleep(5)
-        tab_buttons = self.wait.until(EC.presence_of_all_elements_located((By.ID, "tabSelection")))
-        assistants_button = next((btn for btn in tab_buttons if "Assistants" in btn.get_attribute("title")), None)
-        self.assertIsNotNone(assistants_button, "'Assistants' tab button not found")
-        assistants_button.click()
-        time.sleep(2)
-        
-        assistant_add_button = self.wait.until(EC.element_to_be_clickable((By.ID, "addAssistantButton")))
-        self.assertIsNotNone(assistant_add_button, "Add Assistant button should be initialized and clickable")
-        assistant_add_button.click()
-        time.sleep(2)
-        
-        assistant_name_input = self.wait.until(EC.presence_of_element_located((By.ID, "assistantNameInput")))
-        self.assertIsNotNone(assistant_name_input, "Assistant Name input should be present")
-        assistant_name_input.clear()
-        assistant_name_input.send_keys(assistant_name)
-        time.sleep(2)
-        
-        # Locate and click the Save button
-        confirmation_button = self.wait.until(EC.presence_of_all_elements_located((By.ID, "confirmationButton")))
-        self.assertTrue(confirmation_button, "Drop name elements should be initialized")
-        save_button = next((el for el in confirmation_button if el.text == "Save"), None)
-        self.assertIsNotNone(save_button, "Submit button should be present")
-        save_button.click()
-        
-        time.sleep(5)
-        drop_name_elements = self.wait.until(EC.presence_of_all_elements_located((By.ID, "dropName")))
-        self.assertTrue(drop_name_elements, "Drop name elements should be initialized")
-        assistant_dropdown_button = next((el for el in drop_name_elements if el.text == "Assistants"), None)
-        self.assertIsNotNone(assistant_dropdown_button, "Assistants button should be present")
-        
-        # Ensure the parent button's title is "Collapse folder" before clicking
-        parent_button = assistant_dropdown_button.find_element(By.XPATH, "./ancestor::button")
-        button_title = parent_button.get_attribute("title")
-        if button_title != "Collapse folder":
-            assistant_dropdown_button.click()
-        
-        prompt_name_elements = self.wait.until(EC.presence_of_all_elements_located((By.ID, "assistantName")))
-        self.assertTrue(prompt_name_elements, "Prompt name elements should be initialized")
-        assistant_in_list = next((el for el in prompt_name_elements if el.text == assistant_name), None)
-        self.assertIsNotNone(assistant_in_list, f"{assistant_name} should be visible in the dropdown")
+        self.right_sidebar.open().create_assistant(assistant_name)
         
 
     def upload_file(self, filename):
@@ -93,40 +53,10 @@ class AssistantModalTests(BaseTest):
         
         
     def send_message(self, message):
-        # Locate the chatbar to input in messageChatInputText
-        chat_input_bar = self.wait.until(EC.presence_of_element_located((By.ID, "messageChatInputText")))
-        self.assertTrue(chat_input_bar, "Chat bar input should be initialized")
-        chat_input_bar.send_keys(message)
-        
-        time.sleep(2)
-        
-        # Locate the send message button
-        chat_send_message = self.wait.until(EC.presence_of_element_located((By.ID, "sendMessage")))
-        self.assertTrue(chat_send_message, "Send message button should be initialized")
-        chat_send_message.click()
-        time.sleep(30)
+        self.chat.send_message(message)
         
     def delete_all_assistants(self):
-
-        prompt_handler_button = self.wait.until(EC.presence_of_element_located((By.ID, "promptHandler")))
-        prompt_handler_button.click()
-        time.sleep(2)
-        
-        delete_button = self.wait.until(EC.presence_of_element_located((By.ID, "Delete")))
-        delete_button.click()
-        time.sleep(2)  # Give time for the menu to appear
-
-        select_all_check = self.wait.until(EC.presence_of_element_located((By.ID, "selectAllCheck")))
-
-        checkbox = select_all_check.find_element(By.XPATH, ".//input[@type='checkbox']")
-        self.assertIsNotNone(checkbox, f"Checkbox for prompt All should be present")
-        checkbox.click()
-        time.sleep(2)
-
-        confirm_delete_button = self.wait.until(EC.element_to_be_clickable((By.ID, "confirmItem")))
-        self.assertTrue(confirm_delete_button, "Delete Button should be initialized")
-        confirm_delete_button.click()
-        time.sleep(2)
+        self.reset_state("prompts", "assistants")
 
     # ----------------- Test Assistant Fields -----------------
     """This test goes through to create an Assistant and testing all the fields"""
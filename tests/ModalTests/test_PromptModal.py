@@ -22,47 +22,10 @@ class PromptModalTests(BaseTest):
             
     # ----------------- Setup Test Data ------------------  
     def create_assistant(self, assistant_name):
-        assistant_add_button = self.wait.until(EC.element_to_be_clickable((By.ID, "addAssistantButton")))
-        self.assertIsNotNone(assistant_add_button, "Add Assistant button should be initialized and clickable")
-        assistant_add_button.click()
-        
-        assistant_name_input = self.wait.until(EC.presence_of_element_located((By.ID, "assistantNameInput")))
-        self.assertIsNotNone(assistant_name_input, "Assistant Name input should be present")
-        assistant_name_input.clear()
-        assistant_name_input.send_keys(assistant_name)
-        
-        # Locate and click the Save button
-        confirmation_button = self.wait.until(EC.presence_of_all_elements_located((By.ID, "confirmationButton")))
-        self.assertTrue(confirmation_button, "Drop name elements should be initialized")
-        save_button = next((el for el in confirmation_button if el.text == "Save"), None)
-        self.assertIsNotNone(save_button, "Submit button should be present")
-        save_button.click()
-        
-        time.sleep(5)
-        drop_name_elements = self.wait.until(EC.presence_of_all_elements_located((By.ID, "dropName")))
-        self.assertTrue(drop_name_elements, "Drop name elements should be initialized")
-        assistant_dropdown_button = next((el for el in drop_name_elements if el.text == "Assistants"), None)
-        self.assertIsNotNone(assistant_dropdown_button, "Assistants button should be present")
-        
-        # Ensure the parent button's title is "Collapse folder" before clicking
-        parent_button = assistant_dropdown_button.find_element(By.XPATH, "./ancestor::button")
-        button_title = parent_button.get_attribute("title")
-        if button_title != "Collapse folder":
-            assistant_dropdown_button.click()
-        
-        prompt_name_elements = self.wait.until(EC.presence_of_all_elements_located((By.ID, "assistantName")))
-        self.assertTrue(prompt_name_elements, "Prompt name elements should be initialized")
-        assistant_in_list = next((el for el in prompt_name_elements if el.text == assistant_name), None)
-        self.assertIsNotNone(assistant_in_list, f"{assistant_name} should be visible in the dropdown")
+        self.right_sidebar.create_assistant(assistant_name)
         
     def click_assistants_tab(self):
-        time.sleep(5)
-        tab_buttons = self.wait.until(EC.presence_of_all_elements_located((By.ID, "tabSelection")))
-        assistants_button = next((btn for btn in tab_buttons if "Assistants" in btn.get_attribute("title")), None)
-        self.assertIsNotNone(assistants_button, "'Assistants' tab button not found")
-        assistants_button.click()
-
-        time.sleep(2)
+        self.right_sidebar.open()
 
     # Temporarily depricated, Prompt Optimizer button not working, or really slow 
 
@@ -236,7 +199,7 @@ class PromptModalTests(BaseTest):
         expand_button.click()
         time.sleep(5)
         
-        optional = self.wait.until(EC.presence_of_element_located((By.ID, "optional")))
+        optional = self.wait.until(EC.presence_of_element_located((By.ID, "optional")))  # locator: dynamic
         self.assertTrue(optional, "Optional should be present")
         
         # Locate the checkbox within the parent container
@@ -246,7 +209,7 @@ class PromptModalTests(BaseTest):
         
         time.sleep(2)
         
-        line_numbers = self.wait.until(EC.presence_of_element_located((By.ID, "lineNumbers")))
+        line_numbers = self.wait.until(EC.presence_of_element_located((By.ID, "lineNumbers")))  # locator: dynamic
         self.assertTrue(line_numbers, "Line Numbers should be present")
         
         # Locate the checkbox within the parent container
@@ -256,7 +219,7 @@ class PromptModalTests(BaseTest):
         
         time.sleep(2)
         
-        escape = self.wait.until(EC.presence_of_element_located((By.ID, "escape")))
+        escape = self.wait.until(EC.presence_of_element_located((By.ID, "escape")))  # locator: dynamic
         self.assertTrue(escape, "Escape should be present")
         
         # Locate the checkbox within the parent container
@@ -266,7 +229,7 @@ class PromptModalTests(BaseTest):
         
         time.sleep(2)
         
-        truncate = self.wait.until(EC.presence_of_element_located((By.ID, "truncate")))
+        truncate = self.wait.until(EC.presence_of_element_located((By.ID, "truncate")))  # locator: dynamic
         self.assertTrue(truncate, "Truncate should be present")
         
         # Locate the checkbox within the parent container
@@ -281,7 +244,7 @@ class PromptModalTests(BaseTest):
         
         time.sleep(3)
         
-        truncate_from_end = self.wait.until(EC.presence_of_element_located((By.ID, "truncateFromEnd")))
+        truncate_from_end = self.wait.until(EC.presence_of_element_located((By.ID, "truncateFromEnd")))  # locator: dynamic
         self.assertTrue(truncate_from_end, "Truncate From End should be present")
         
         # Locate the checkbox within the parent container
@@ -291,7 +254,7 @@ class PromptModalTests(BaseTest):
         
         time.sleep(2)
         
-        regex = self.wait.until(EC.presence_of_element_located((By.ID, "regex")))
+        regex = self.wait.until(EC.presence_of_element_located((By.ID, "regex")))  # locator: dynamic
         self.assertTrue(regex, "Regex should be present")
         
         # Locate the checkbox within the parent container
@@ -27,31 +27,7 @@ class SettingsModalTests(BaseTest):
     
     # ----------------- Setup Test Data ------------------
     def settings_settings(self):
-
-        time.sleep(5)
-
-        user_menu = self.wait.until(EC.presence_of_element_located((By.ID, "userMenu")))
-        self.assertTrue(user_menu, "User Menu button is present")
-        user_menu.click()
-        time.sleep(3)
-
-        settings_select = self.wait.until(EC.presence_of_element_located((By.ID, "settingsInterface")))
-        self.assertTrue(settings_select, "The Settings button should be present")
-        settings_select.click()
-        time.sleep(7)
-
-        settings_modal_element = self.wait.until(EC.presence_of_element_located((By.ID, "modalTitle")))
-        self.assertTrue(settings_modal_element.is_displayed(), "Settings window element is visible")
-        modal_text = settings_modal_element.text
-        self.assertEqual(modal_text, "Settings", "Modal title should be 'Settings'")
-        time.sleep(2)
-        
-        tabs = self.wait.until(EC.presence_of_all_elements_located((By.ID, "tabName")))
-        self.assertGreater(len(tabs), 1, "Expected multiple buttons with ID 'tabName'")
-        admin_supported_models_tab = next((tab for tab in tabs if tab.text == "Configurations"), None)
-        self.assertIsNotNone(admin_supported_models_tab, "The 'Configurations' tab should be present")
-        admin_supported_models_tab.click()
-        time.sleep(5)
+        self.settings_modal.open("Configurations")
     
     # ----------------- Test Settings Theme -----------------
     def test_settings_theme(self):
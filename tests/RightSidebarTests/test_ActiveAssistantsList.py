@@ -18,34 +18,10 @@ class ActiveAssistantsListTests(BaseTest):
         super().setUp(headless=True)
         
     def click_assistants_tab(self):
-        time.sleep(5)
-        tab_buttons = self.wait.until(EC.presence_of_all_elements_located((By.ID, "tabSelection")))
-        assistants_button = next((btn for btn in tab_buttons if "Assistants" in btn.get_attribute("title")), None)
-        self.assertIsNotNone(assistants_button, "'Assistants' tab button not found")
-        assistants_button.click()
-        time.sleep(5)
+        self.right_sidebar.open()
         
     def delete_all_assistants(self):
-
-        prompt_handler_button = self.wait.until(EC.presence_of_element_located((By.ID, "promptHandler")))
-        prompt_handler_button.click()
-        time.sleep(2)
-        
-        delete_button = self.wait.until(EC.presence_of_element_located((By.ID, "Delete")))
-        delete_button.click()
-        time.sleep(2)  # Give time for the menu to appear
-
-        select_all_check = self.wait.until(EC.presence_of_element_located((By.ID, "selectAllCheck")))
-
-        checkbox = select_all_check.find_element(By.XPATH, ".//input[@type='checkbox']")
-        self.assertIsNotNone(checkbox, f"Checkbox for prompt All should be present")
-        checkbox.click()
-        time.sleep(2)
-
-        confirm_delete_button = self.wait.until(EC.element_to_be_clickable((By.ID, "confirmItem")))
-        self.assertTrue(confirm_delete_button, "Delete Button should be initialized")
-        confirm_delete_button.click()
-        time.sleep(2)
+        self.reset_state("prompts", "assistants")
 
     # ----------------- Test drop down collapses -----------------
     """This test goes through to test that the Assistant's drop down menu is clickable 
@@ -34,12 +34,7 @@ class ActiveAssistantsListTests(BaseTest):
         # self.assertEqual(title_text, 'Donkey Kong', "Assistant title should be 'Donkey Kong'")
         
     def click_assistants_tab(self):
-        time.sleep(5)
-        tab_buttons = self.wait.until(EC.presence_of_all_elements_located((By.ID, "tabSelection")))
-        assistants_button = next((btn for btn in tab_buttons if "Assistants" in btn.get_attribute("title")), None)
-        self.assertIsNotNone(assistants_button, "'Assistants' tab button not found")
-        assistants_button.click()
-        time.sleep(5)
+        self.right_sidebar.open()
 
     # ----------------- Test Publish Assistant Path is visibile -----------------
     """This test goes through to ensure the Publish Assistant Path option is interactable"""
@@ -273,7 +268,7 @@ class ActiveAssistantsListTests(BaseTest):
         self.assertTrue(send_message, "The send message button is clickable and clicked")
         send_message.click()
         
-        time.sleep(20) # process message
+        self.wait_for_assistant_reply()
         
         # id="userMessage0"
         user_message = self.wait.until(
@@ -309,7 +304,7 @@ class ActiveAssistantsListTests(BaseTest):
         self.assertTrue(send_message, "The send message button is clickable and clicked")
         send_message.click()
         
-        time.sleep(20) # process message
+        self.wait_for_assistant_reply()
         
         # id="userMessage0"
         user_message = self.wait.until(
@@ -338,7 +333,7 @@ class ActiveAssistantsListTests(BaseTest):
         self.assertTrue(send_message, "The send message button is clickable and clicked")
         send_message.click()
         
-        time.sleep(20) # process message
+        self.wait_for_assistant_reply()
         
         # id="userMessage2"
         user_message = self.wait.until(
@@ -374,7 +369,7 @@ class ActiveAssistantsListTests(BaseTest):
         self.assertTrue(send_message, "The send message button is clickable and clicked")
         send_message.click()
         
-        time.sleep(20) # process message
+        self.wait_for_assistant_reply()
         
         # id="userMessage0"
         user_message = self.wait.until(
@@ -441,7 +436,7 @@ class ActiveAssistantsListTests(BaseTest):
         self.assertTrue(send_message, "The send message button is clickable and clicked")
         send_message.click()
         
-        time.sleep(20) # process message
+        self.wait_for_assistant_reply()
         
         # id="userMessage0"
         user_message = self.wait.until(
@@ -519,7 +514,7 @@ class ActiveAssistantsListTests(BaseTest):
         self.assertTrue(send_message, "The send message button is clickable and clicked")
         send_message.click()
         
-        time.sleep(20) # process message
+        self.wait_for_assistant_reply()
         
         # id="userMessage0"
         user_message = self.wait.until(
@@ -574,7 +569,7 @@ class ActiveAssistantsListTests(BaseTest):
         self.assertTrue(send_message, "The send message button is clickable and clicked")
         send_message.click()
         
-        time.sleep(20) # process message
+        self.wait_for_assistant_reply()
         
         # id="userMessage0"
         user_message = self.wait.until(
@@ -603,7 +598,7 @@ class ActiveAssistantsListTests(BaseTest):
         self.assertTrue(send_message, "The send message button is clickable and clicked")
         send_message.click()
         
-        time.sleep(20) # process message
+        self.wait_for_assistant_reply()
         
         # id="userMessage2"
         user_message = self.wait.until(
@@ -660,7 +655,7 @@ class ActiveAssistantsListTests(BaseTest):
         self.assertTrue(send_message, "The send message button is clickable and clicked")
         send_message.click()
         
-        time.sleep(20) # process message
+        self.wait_for_assistant_reply()
         
         # id="userMessage0"
         user_message = self.wait.until(
@@ -731,7 +726,7 @@ class ActiveAssistantsListTests(BaseTest):
         self.assertTrue(send_message, "The send message button is clickable and clicked")
         send_message.click()
         
-        time.sleep(20) # process message
+        self.wait_for_assistant_reply()
         
         # id="userMessage0"
         user_message = self.wait.until(
@@ -778,7 +773,7 @@ class ActiveAssistantsListTests(BaseTest):
         self.assertTrue(send_message, "The send message button is clickable and clicked")
         send_message.click()
         
-        time.sleep(20) # process message
+        self.wait_for_assistant_reply()
         
         # id="userMessage0"
         user_message = self.wait.until(
@@ -25,57 +25,10 @@ class CreateFolderTests(BaseTest):
         super().setUp(headless=True)
         
     def click_assistants_tab(self):
-        time.sleep(5)
-        tab_buttons = self.wait.until(EC.presence_of_all_elements_located((By.ID, "tabSelection")))
-        assistants_button = next((btn for btn in tab_buttons if "Assistants" in btn.get_attribute("title")), None)
-        self.assertIsNotNone(assistants_button, "'Assistants' tab button not found")
-        assistants_button.click()
-        time.sleep(5)
+        self.right_sidebar.open()
         
     def delete_all_folders(self):
-        prompt_handler_button = self.wait.until(
-            EC.presence_of_element_located((By.ID, "promptHandler"))
-        )
-        prompt_handler_button.click()
-        time.sleep(2)
-        
-        # Select First Submenu
-        sub_menu = self.wait.until(EC.presence_of_element_located((By.ID, "subMenu")))
-        self.assertTrue(sub_menu, "Element with id='subMenu' is present")
-        time.sleep(1)  # Give time for the menu to appear
-        
-        # Click the id="folderSort"
-        visible_sub_menu = self.wait.until(
-            EC.presence_of_element_located((By.ID, "folderSort"))
-        )
-        self.assertTrue(visible_sub_menu, "Element with id='folderSort' is present")
-        visible_sub_menu.click()
-        time.sleep(1)
-
-        # Click the button with ID "Delete"
-        delete_button = self.wait.until(
-            EC.presence_of_all_elements_located((By.ID, "Delete"))
-        )
-        delete_button[-1].click()
-        time.sleep(2)  # Give time for the menu to appear
-
-        # Click the select all checkbox
-        select_all_check = self.wait.until(
-            EC.presence_of_element_located((By.ID, "selectAllCheck"))
-        )
-        # Locate the checkbox within the parent container
-        checkbox = select_all_check.find_element(By.XPATH, ".//input[@type='checkbox']")
-        self.assertIsNotNone(checkbox, f"Checkbox for prompt All should be present")
-        checkbox.click()
-        time.sleep(2)
-
-        # Click the Delete Button
-        confirm_delete_button = self.wait.until(
-            EC.element_to_be_clickable((By.ID, "confirmItem"))
-        )
-        self.assertTrue(confirm_delete_button, "Delete Button should be initialized")
-        confirm_delete_button.click()
-        time.sleep(2)
+        self.reset_state("folders")
 
     # ----------------- Test add Folder and that it appears -----------------
     """This test goes through to create a new folder and then check for the specific one
@@ -8,7 +8,6 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.common.exceptions import (
-    UnexpectedAlertPresentException,
     NoSuchElementException,
 )
 from selenium.common.exceptions import TimeoutException
@@ -17,6 +16,13 @@ from selenium.webdriver.common.keys import Keys
 from tests.base_test import BaseTest
 
 
+def mario_folders(test):
+    """Three prompt folders, the starting point of most tests below (see tests/snapshots.py)"""
+    test.right_sidebar.open()
+    test.reset_state("folders")
+    test.right_sidebar.create_folders(["Luigi's Mansion", "Baby Park", "Admiral Bobbery's Ship"])
+
+
 class FolderHandlerTests(BaseTest):
 
     def setUp(self):
@@ -25,133 +31,23 @@ class FolderHandlerTests(BaseTest):
 
     # ----------------- Setup Test Data ------------------
     def create_folder(self, folder_name):
-        time.sleep(5)
-        folder_add_button = self.wait.until(EC.presence_of_element_located((By.ID, "createFolderButton")))
-        self.assertTrue(folder_add_button, "Expected multiple buttons with ID 'createFolderButton'")
-        folder_add_button.click()
-
-        try:
-            alert = self.wait.until(EC.alert_is_present())
-            self.assertIsNotNone(alert, "Alert prompt should be present")
-            time.sleep(3)
-            alert.send_keys(folder_name)
-            time.sleep(3)
-            alert.accept()
-        except UnexpectedAlertPresentException as e:
-            self.fail(f"Unexpected alert present: {str(e)}")
+        self.right_sidebar.create_folder(folder_name)
             
     def click_assistants_tab(self):
-        time.sleep(5)
-        tab_buttons = self.wait.until(EC.presence_of_all_elements_located((By.ID, "tabSelection")))
-        assistants_button = next((btn for btn in tab_buttons if "Assistants" in btn.get_attribute("title")), None)
-        self.assertIsNotNone(assistants_button, "'Assistants' tab button not found")
-        assistants_button.click()
-        time.sleep(5)
+        self.right_sidebar.open()
             
     def delete_all_folders(self):
-        prompt_handler_button = self.wait.until(
-            EC.presence_of_element_located((By.ID, "promptHandler"))
-        )
-        prompt_handler_button.click()
-        time.sleep(2)
-        
-        # Select First Submenu
-        sub_menu = self.wait.until(EC.presence_of_element_located((By.ID, "subMenu")))
-        self.assertTrue(sub_menu, "Element with id='subMenu' is present")
-        time.sleep(1)  # Give time for the menu to appear
-        
-        # Click the id="folderSort"
-        visible_sub_menu = self.wait.until(
-            EC.presence_of_element_located((By.ID, "folderSort"))
-        )
-        self.assertTrue(visible_sub_menu, "Element with id='folderSort' is present")
-        visible_sub_menu.click()
-        time.sleep(1)
-
-        # Click the button with ID "Delete"
-        delete_button = self.wait.until(
-            EC.presence_of_all_elements_located((By.ID, "Delete"))
-        )
-        delete_button[-1].click()
-        time.sleep(2)  # Give time for the menu to appear
-
-        # Click the select all checkbox
-        select_all_check = self.wait.until(
-            EC.presence_of_element_located((By.ID, "selectAllCheck"))
-        )
-        # Locate the checkbox within the parent container
-        checkbox = select_all_check.find_element(By.XPATH, ".//input[@type='checkbox']")
-        self.assertIsNotNone(checkbox, f"Checkbox for prompt All should be present")
-        checkbox.click()
-        time.sleep(2)
-
-        # Click the Delete Button
-        confirm_delete_button = self.wait.until(
-            EC.element_to_be_clickable((By.ID, "confirmItem"))
-        )
-        self.assertTrue(confirm_delete_button, "Delete Button should be initialized")
-        confirm_delete_button.click()
-        time.sleep(2)
+        self.reset_state("folders")
 
     def create_assistant(self, assistant_name):
-        assistant_add_button = self.wait.until(
-            EC.element_to_be_clickable((By.ID, "addAssistantButton"))
-        )
-        self.assertIsNotNone(
-            assistant_add_button,
-            "Add Assistant button should be initialized and clickable",
-        )
-        assistant_add_button.click()
-
-        assistant_name_input = self.wait.until(
-            EC.presence_of_element_located((By.ID, "assistantNameInput"))
-        )
-        self.assertIsNotNone(
-            assistant_name_input, "Assistant Name input should be present"
-        )
-        time.sleep(2)
-        assistant_name_input.clear()
-        time.sleep(2)
-        assistant_name_input.send_keys(assistant_name)
-        time.sleep(2)
-
-        # Locate and click the Save button
-        confirmation_button = self.wait.until(EC.presence_of_all_elements_located((By.ID, "confirmationButton")))
-        self.assertTrue(confirmation_button, "Drop name elements should be initialized")
-        
-        save_button = next((el for el in confirmation_button if el.text == "Save"), None)
-        self.assertIsNotNone(save_button, "Save button should be present")
-        
-        save_button.click()
-
-        time.sleep(5)
-        drop_name_elements = self.wait.until(
-            EC.presence_of_all_elements_located((By.ID, "dropName"))
-        )
-        self.assertTrue(drop_name_elements, "Drop name elements should be initialized")
-
-        prompt_name_elements = self.wait.until(
-            EC.presence_of_all_elements_located((By.ID, "assistantName"))
-        )
-        self.assertTrue(
-            prompt_name_elements, "Prompt name elements should be initialized"
-        )
-        assistant_in_list = next(
-            (el for el in prompt_name_elements if el.text == assistant_name), None
-        )
-        self.assertIsNotNone(
-            assistant_in_list, f"{assistant_name} should be visible in the dropdown"
-        )
+        self.right_sidebar.create_assistant(assistant_name)
 
     # ----------------- Test Folder Sort Name -----------------
     """Test the three button handler can sort the created folders by name"""
 
     def test_folder_sort_name(self):
+        self.restore_snapshot(mario_folders)
         self.click_assistants_tab()
-        self.delete_all_folders()
-        self.create_folder("Luigi's Mansion")
-        self.create_folder("Baby Park")
-        self.create_folder("Admiral Bobbery's Ship")
 
         prompt_handler_button = self.wait.until(
             EC.presence_of_element_located((By.ID, "promptHandler"))
@@ -220,11 +116,8 @@ class FolderHandlerTests(BaseTest):
     """Test the three button handler can delete a folder"""
 
     def test_folder_delete(self):
+        self.restore_snapshot(mario_folders)
         self.click_assistants_tab()
-        self.delete_all_folders()
-        self.create_folder("Luigi's Mansion")
-        self.create_folder("Baby Park")
-        self.create_folder("Admiral Bobbery's Ship")
 
         prompt_handler_button = self.wait.until(
             EC.presence_of_element_located((By.ID, "promptHandler"))
@@ -319,11 +212,8 @@ class FolderHandlerTests(BaseTest):
     """Test the three button handler can delete all created folders"""
 
     def test_folder_all_delete(self):
+        self.restore_snapshot(mario_folders)
         self.click_assistants_tab()
-        self.delete_all_folders()
-        self.create_folder("Luigi's Mansion")
-        self.create_folder("Baby Park")
-        self.create_folder("Admiral Bobbery's Ship")
 
         prompt_handler_button = self.wait.until(
             EC.presence_of_element_located((By.ID, "promptHandler"))
@@ -388,11 +278,8 @@ class FolderHandlerTests(BaseTest):
     """Test the three button handler can share the specified folder"""
 
     def test_folder_share(self):
+        self.restore_snapshot(mario_folders)
         self.click_assistants_tab()
-        self.delete_all_folders()
-        self.create_folder("Luigi's Mansion")
-        self.create_folder("Baby Park")
-        self.create_folder("Admiral Bobbery's Ship")
 
         prompt_handler_button = self.wait.until(
             EC.presence_of_element_located((By.ID, "promptHandler"))
@@ -528,11 +415,8 @@ class FolderHandlerTests(BaseTest):
     """Test the three button handler can share all folders"""
 
     def test_folder_all_share(self):
+        self.restore_snapshot(mario_folders)
         self.click_assistants_tab()
-        self.delete_all_folders()
-        self.create_folder("Luigi's Mansion")
-        self.create_folder("Baby Park")
-        self.create_folder("Admiral Bobbery's Ship")
 
         prompt_handler_button = self.wait.until(
             EC.presence_of_element_located((By.ID, "promptHandler"))
@@ -829,11 +713,8 @@ class FolderHandlerTests(BaseTest):
     """Test the three button handler can open all folders to see contents inside"""
 
     def test_folder_open_all(self):
+        self.restore_snapshot(mario_folders)
         self.click_assistants_tab()
-        self.delete_all_folders()
-        self.create_folder("Luigi's Mansion")
-        self.create_folder("Baby Park")
-        self.create_folder("Admiral Bobbery's Ship")
 
         prompt_handler_button = self.wait.until(
             EC.presence_of_element_located((By.ID, "promptHandler"))
@@ -895,11 +776,8 @@ class FolderHandlerTests(BaseTest):
     """Test the three button handler can close all folders"""
 
     def test_folder_close_all(self):
+        self.restore_snapshot(mario_folders)
         self.click_assistants_tab()
-        self.delete_all_folders()
-        self.create_folder("Luigi's Mansion")
-        self.create_folder("Baby Park")
-        self.create_folder("Admiral Bobbery's Ship")
 
         prompt_handler_button = self.wait.until(
             EC.presence_of_element_located((By.ID, "promptHandler"))
@@ -17,12 +17,7 @@ class PromptTemplateTests(BaseTest):
         super().setUp(headless=True)
         
     def click_assistants_tab(self):
-        time.sleep(5)
-        tab_buttons = self.wait.until(EC.presence_of_all_elements_located((By.ID, "tabSelection")))
-        assistants_button = next((btn for btn in tab_buttons if "Assistants" in btn.get_attribute("title")), None)
-        self.assertIsNotNone(assistants_button, "'Assistants' tab button not found")
-        assistants_button.click()
-        time.sleep(5)
+        self.right_sidebar.open()
 
     # ----------------- Prompt created, saved, and appeared in list -----------------
     """This test goes through to create a prompt and ensure that it appears in the list below."""
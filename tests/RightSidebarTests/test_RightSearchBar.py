@@ -26,133 +26,16 @@ class SearchBarRightTests(BaseTest):
     # ----------------- Setup Test Data ------------------
         
     def click_assistants_tab(self):
-        time.sleep(5)
-        tab_buttons = self.wait.until(EC.presence_of_all_elements_located((By.ID, "tabSelection")))
-        assistants_button = next((btn for btn in tab_buttons if "Assistants" in btn.get_attribute("title")), None)
-        self.assertIsNotNone(assistants_button, "'Assistants' tab button not found")
-        assistants_button.click()
-        time.sleep(5)
+        self.right_sidebar.open()
 
     def create_assistant(self, assistant_name):
-        assistant_add_button = self.wait.until(
-            EC.element_to_be_clickable((By.ID, "addAssistantButton"))
-        )
-        self.assertIsNotNone(
-            assistant_add_button,
-            "Add Assistant button should be initialized and clickable",
-        )
-        assistant_add_button.click()
-        time.sleep(5)
-
-        assistant_name_input = self.wait.until(
-            EC.presence_of_element_located((By.ID, "assistantNameInput"))
-        )
-        self.assertIsNotNone(
-            assistant_name_input, "Assistant Name input should be present"
-        )
-        time.sleep(2)
-        assistant_name_input.clear()
-        time.sleep(2)
-        assistant_name_input.send_keys(assistant_name)
-        time.sleep(2)
-
-        # Locate and click the Save button
-        confirmation_button = self.wait.until(EC.presence_of_all_elements_located((By.ID, "confirmationButton")))
-        self.assertTrue(confirmation_button, "Drop name elements should be initialized")
-        
-        save_button = next((el for el in confirmation_button if el.text == "Save"), None)
-        self.assertIsNotNone(save_button, "Save button should be present")
-        
-        save_button.click()
-
-        time.sleep(5)
-        drop_name_elements = self.wait.until(
-            EC.presence_of_all_elements_located((By.ID, "dropName"))
-        )
-        self.assertTrue(drop_name_elements, "Drop name elements should be initialized")
-
-        prompt_name_elements = self.wait.until(
-            EC.presence_of_all_elements_located((By.ID, "assistantName"))
-        )
-        self.assertTrue(
-            prompt_name_elements, "Prompt name elements should be initialized"
-        )
-        assistant_in_list = next(
-            (el for el in prompt_name_elements if el.text == assistant_name), None
-        )
-        self.assertIsNotNone(
-            assistant_in_list, f"{assistant_name} should be visible in the dropdown"
-        )
+        self.right_sidebar.create_assistant(assistant_name)
 
     def create_prompt(self, prompt_name):
-        prompt_buttons = self.wait.until(
-            EC.presence_of_all_elements_located((By.ID, "promptButton"))
-        )
-        self.assertTrue(prompt_buttons, "Prompt elements should be initialized")
-        prompt_add_button = next(
-            (el for el in prompt_buttons if el.text == "Prompt Template"), None
-        )
-        self.assertIsNotNone(prompt_add_button, "Prompt button should be present")
-        prompt_add_button.click()
-        time.sleep(5)
-
-        time.sleep(2)
-        prompt_name_input = self.wait.until(
-            EC.presence_of_element_located((By.ID, "promptModalName"))
-        )
-        self.assertIsNotNone(prompt_name_input, "Prompt Name input should be present")
-        time.sleep(2)
-        prompt_name_input.clear()
-        time.sleep(2)
-        prompt_name_input.send_keys(prompt_name)
-        time.sleep(2)
-
-        time.sleep(2)
-        confirmation_button = self.wait.until(
-            EC.presence_of_all_elements_located((By.ID, "confirmationButton"))
-        )
-        self.assertTrue(confirmation_button, "Drop name elements should be initialized")
-        save_button = next(
-            (el for el in confirmation_button if el.text == "Save"), None
-        )
-        self.assertIsNotNone(save_button, "Save button should be present")
-        save_button.click()
-
-        time.sleep(2)
-        prompt_name_elements = self.wait.until(
-            EC.presence_of_all_elements_located((By.ID, "promptName"))
-        )
-        self.assertTrue(
-            prompt_name_elements, "Prompt name elements should be initialized"
-        )
-        prompt_in_list = next(
-            (el for el in prompt_name_elements if el.text == prompt_name), None
-        )
-        self.assertIsNotNone(
-            prompt_in_list, f"{prompt_name} should be visible in the dropdown"
-        )
+        self.right_sidebar.create_prompt(prompt_name)
 
     def delete_all_assistants(self):
-
-        prompt_handler_button = self.wait.until(EC.presence_of_element_located((By.ID, "promptHandler")))
-        prompt_handler_button.click()
-        time.sleep(2)
-        
-        delete_button = self.wait.until(EC.presence_of_element_located((By.ID, "Delete")))
-        delete_button.click()
-        time.sleep(2)  # Give time for the menu to appear
-
-        select_all_check = self.wait.until(EC.presence_of_element_located((By.ID, "selectAllCheck")))
-
-        checkbox = select_all_check.find_element(By.XPATH, ".//input[@type='checkbox']")
-        self.assertIsNotNone(checkbox, f"Checkbox for prompt All should be present")
-        checkbox.click()
-        time.sleep(2)
-
-        confirm_delete_button = self.wait.until(EC.element_to_be_clickable((By.ID, "confirmItem")))
-        self.assertTrue(confirm_delete_button, "Delete Button should be initialized")
-        confirm_delete_button.click()
-        time.sleep(2)
+        self.reset_state("prompts", "assistants")
 
     # ----------------- Test Search Assistants -----------------
     """Ensure the Assistants searched in the Right Search Bar appear"""
@@ -161,8 +44,7 @@ class SearchBarRightTests(BaseTest):
         
         self.click_assistants_tab()
         self.delete_all_assistants()
-        self.create_assistant("Hammer Bro 1")
-        self.create_assistant("Hammer Bro 2")
+        self.right_sidebar.create_assistants(["Hammer Bro 1", "Hammer Bro 2"])
         
         # Click the searchBar Button
         search_bar = self.wait.until(
@@ -251,8 +133,7 @@ class SearchBarRightTests(BaseTest):
         
         self.click_assistants_tab()
         self.delete_all_assistants()
-        self.create_prompt("Dry Bones 1")
-        self.create_prompt("Dry Bones 2")
+        self.right_sidebar.create_prompts(["Dry Bones 1", "Dry Bones 2"])
         
         # Click the searchBar Button
         search_bar = self.wait.until(
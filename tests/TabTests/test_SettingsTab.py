@@ -203,31 +203,16 @@ class SettingsTabTests(BaseTest):
         # Click the button
         target_button.click()
 
-        time.sleep(2)
-
-        # Define Download Path
-        download_dir = os.path.expanduser(
-            "~/Downloads"
-        )  # Adjust if using a different directory
-
         # Generate the expected filename with MM-DD format
         current_date = datetime.now().strftime("%-m-%-d")  # Format MM-DD
         expected_filename = f"chatbot_ui_history_{current_date}.json"
-        expected_filepath = os.path.join(download_dir, expected_filename)
-
-        # Wait for the file to appear
-        timeout = 30  # Max wait time in seconds
-        start_time = time.time()
-
-        while time.time() - start_time < timeout:
-            if os.path.exists(expected_filepath):
-                print(f"Download successful! File found: {expected_filepath}")
-                break
-            time.sleep(1)
-        else:
-            self.fail(
-                f"Download failed: Expected file '{expected_filename}' not found in {download_dir}"
-            )
+
+        # Wait for the file to finish downloading into this browser's download directory
+        try:
+            expected_filepath, size = self.wait_for_download(expected_filename, timeout=30)
+        except TimeoutError as e:
+            self.fail(f"Download failed: {e}")
+        print(f"Download successful! File found: {expected_filepath} ({size} bytes)")
 
         # Assert file exists
         self.assertTrue(
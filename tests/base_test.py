@@ -1,18 +1,55 @@
+import atexit
+import shutil
+import tempfile
 import unittest
-import time
 import os
 from dotenv import load_dotenv
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.action_chains import ActionChains
-from selenium.common.exceptions import UnexpectedAlertPresentException
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.service import Service
+from selenium.common.exceptions import (
+    NoAlertPresentException,
+    TimeoutException,
+    WebDriverException,
+)
+from tests import datasets, documents, downloads, driver_factory, pages, reset, seeding, session_cache, snapshots, timing, uploads, waits
+
+
+# How long a browser lives: "test" starts a fresh one for every test method,
+# "class" shares one across a test class and "worker" shares one across every
+# class run by the same process (see tests/runner.py --session)
+SESSION_MODES = ("test", "class", "worker")
+
+# Browser shared by every class in this process when running in "worker" mode
+_worker_driver = None
+
+
+def quit_driver(driver):
+    """Quit a browser started by BaseTest and remove its download directory"""
+    try:
+        driver.quit()
+    except WebDriverException:
+        pass
+    download_dir = getattr(driver, "download_dir", None)
+    if download_dir:
+        shutil.rmtree(download_dir, ignore_errors=True)
+
+
+def _quit_worker_driver():
+    global _worker_driver
+    if _worker_driver is not None:
+        quit_driver(_worker_driver)
+        _worker_driver = None
+
+
+atexit.register(_quit_worker_driver)
 
 
 class BaseTest(unittest.TestCase):
+    # Set on a subclass to override AMPLIFY_SESSION_MODE for that class
+    session_mode = None
+    _class_driver = None
+
     @classmethod
     def setUpClass(cls):
         """Setup that runs once per test class"""
@@ -23,16 +60,77 @@ class BaseTest(unittest.TestCase):
 
         # Store configuration for tests
         cls.base_url = os.getenv("NEXTAUTH_URL", "http://localhost:3000")
-        cls.username = os.getenv("SELENIUM_USERNAME", "default_username")
+        # Parallel workers logging in through the local OIDC provider each get their own user
+        cls.username = os.getenv("AMPLIFY_TEST_USER") or os.getenv("SELENIUM_USERNAME", "default_username")
         cls.password = os.getenv("SELENIUM_PASSWORD", "default_password")
+        cls._class_driver = None
+
+    @classmethod
+    def tearDownClass(cls):
+        """Quit the browser shared by the class, if there is one"""
+        if cls._class_driver is not None:
+            quit_driver(cls._class_driver)
+            cls._class_driver = None
+
+    @classmethod
+    def get_session_mode(cls):
+        mode = cls.session_mode or os.getenv("AMPLIFY_SESSION_MODE", "test")
+        if mode not in SESSION_MODES:
+            raise ValueError(
+                f"Unknown session mode '{mode}', expected one of {SESSION_MODES}"
+            )
+        return mode
 
     def setUp(self, headless=True):
         """Setup that runs before each test method"""
+        # Record where the time goes, see tests/timing.py
+        timing.instrument_sleep()
+        timing.recorder.start_test(self.id())
+        self.addCleanup(timing.recorder.finish_test)
+
+        # Strict mode flags every raw time.sleep left in the test
+        strict = waits.strict_mode()
+        if strict:
+            guard = waits.SleepGuard()
+            guard.install()
+            self.addCleanup(guard.check, strict)
+            self.addCleanup(guard.uninstall)
+
+        mode = self.get_session_mode()
+
+        # Reuse the already authenticated browser when the session mode allows it
+        shared_driver = self._get_shared_driver(mode)
+        if shared_driver is not None:
+            self.driver = shared_driver
+            self.wait = timing.TimedWebDriverWait(self.driver, 10)
+            self.reset_to_home()
+            return
+
+        self.driver = self.start_driver(headless)
+        if mode == "test":
+            # A cleanup instead of tearDown, so the cleanups a test registers
+            # (they run first) still have the browser
+            self.addCleanup(quit_driver, self.driver)
+        self.driver.get(self.base_url)
+        self.wait = timing.TimedWebDriverWait(self.driver, 10)
+
+        # # Login before each test
+        # self.login()
+        
+        self.ensure_logged_in()
+
+        self._set_shared_driver(mode, self.driver)
+
+    def start_driver(self, headless=True):
+        """Start a new Chrome instance"""
         # Configure Chrome options
         options = webdriver.ChromeOptions()
         
-        # ⬇️ Use a persistent user profile
-        profile_dir = os.path.join(os.path.dirname(__file__), "chrome_profile")
+        # ⬇️ Use a persistent user profile (parallel workers each get their own copy)
+        profile_dir = os.getenv(
+            "AMPLIFY_CHROME_PROFILE",
+            os.path.join(os.path.dirname(__file__), "chrome_profile"),
+        )
         options.add_argument(f"--user-data-dir={profile_dir}")
     
         if headless:
@@ -40,32 +138,262 @@ class BaseTest(unittest.TestCase):
             options.add_argument("--disable-gpu")
             options.add_argument("--window-size=1920,1080")
 
-        # Initialize WebDriver with ChromeDriverManager
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=options)
+        # Every browser downloads into its own directory so parallel workers
+        # never collide on ~/Downloads
+        download_dir = tempfile.mkdtemp(prefix="amplify-downloads-")
+        options.add_experimental_option(
+            "prefs",
+            {
+                "download.default_directory": download_dir,
+                "download.prompt_for_download": False,
+                "download.directory_upgrade": True,
+            },
+        )
+
+        # Chromedriver is resolved once per process, not once per test
+        driver = driver_factory.start_chrome(options)
+        self.driver_startup = driver_factory.startup_times[-1]
+        timing.recorder.record("driver_start", "webdriver.Chrome", self.driver_startup)
+        timing.instrument_driver(driver)
+
+        # Headless Chrome ignores the download prefs unless told explicitly
+        driver.execute_cdp_cmd(
+            "Browser.setDownloadBehavior",
+            {"behavior": "allow", "downloadPath": download_dir},
+        )
+        driver.download_dir = download_dir
+        return driver
+
+    def _get_shared_driver(self, mode):
+        if mode == "class":
+            driver = type(self)._class_driver
+        elif mode == "worker":
+            driver = _worker_driver
+        else:
+            return None
+        if driver is None:
+            return None
+
+        # A crashed browser cannot be reused, start over with a new one
+        try:
+            driver.current_url
+        except WebDriverException:
+            self._set_shared_driver(mode, None)
+            return None
+        return driver
+
+    def _set_shared_driver(self, mode, driver):
+        global _worker_driver
+        if mode == "class":
+            type(self)._class_driver = driver
+        elif mode == "worker":
+            _worker_driver = driver
+
+    def reset_to_home(self):
+        """Bring a reused browser back to the home screen between tests"""
+        # Dismiss alerts and close extra tabs left behind by the previous test
+        try:
+            self.driver.switch_to.alert.dismiss()
+        except NoAlertPresentException:
+            pass
+        handles = self.driver.window_handles
+        for handle in handles[1:]:
+            self.driver.switch_to.window(handle)
+            self.driver.close()
+        self.driver.switch_to.window(handles[0])
+
         self.driver.get(self.base_url)
-        self.wait = WebDriverWait(self.driver, 10)
+        downloads.clear(self.download_dir)
 
-        # # Login before each test
-        # self.login()
-        
+        # The previous test may have logged out
         if not self.is_logged_in():
-            self.login()
+            self.ensure_logged_in()
 
-    def tearDown(self):
-        """Cleanup after each test method"""
-        if hasattr(self, "driver") and self.driver:
-            self.driver.quit()
-            
-    def is_logged_in(self):
-        time.sleep(7)
+    def ensure_logged_in(self):
+        """Log in, reusing the session cached by an earlier login when possible"""
+        with timing.recorder.measure("login", "ensure_logged_in"):
+            self._ensure_logged_in()
+
+    def _ensure_logged_in(self):
+        if self.restore_cached_session():
+            return
+
+        with session_cache.login_lock():
+            # Another worker may have logged in while we waited for the lock
+            if self.restore_cached_session():
+                return
+            if not self.is_logged_in():
+                self.login()
+            session_cache.save_session(self.driver, self.base_url)
+
+    def restore_cached_session(self):
+        """Inject the cached session, returns False if it is missing, expired or rejected"""
+        session = session_cache.load_session(self.base_url)
+        if session is None:
+            return False
+
+        session_cache.inject_session(self.driver, session)
+        if self.is_logged_in():
+            return True
+
+        session_cache.clear_session(session)
+        return False
+
+    # ----------------- Waits -----------------
+    def settle(self, quiet=0.3, timeout=waits.DEFAULT_TIMEOUT):
+        """Wait until the page stops changing, see tests/waits.py"""
+        waits.settle(self.driver, quiet, timeout)
+
+    def wait_for(self, element_id, timeout=waits.DEFAULT_TIMEOUT):
+        return waits.wait_for(self.driver, element_id, timeout)
+
+    def wait_for_clickable(self, element_id, timeout=waits.DEFAULT_TIMEOUT):
+        return waits.wait_for_clickable(self.driver, element_id, timeout)
+
+    def wait_for_gone(self, element_id, timeout=waits.DEFAULT_TIMEOUT):
+        waits.wait_for_gone(self.driver, element_id, timeout)
+
+    def wait_for_text(self, element_id, text, timeout=waits.DEFAULT_TIMEOUT):
+        return waits.wait_for_text(self.driver, element_id, text, timeout)
+
+    def wait_for_count(self, element_id, count, timeout=waits.DEFAULT_TIMEOUT):
+        return waits.wait_for_count(self.driver, element_id, count, timeout)
+
+    def wait_until_stable(self, element_id, quiet=0.5, timeout=waits.DEFAULT_TIMEOUT):
+        return waits.wait_until_stable(self.driver, element_id, quiet, timeout)
+
+    def wait_for_assistant_reply(self, index=None, quiet=1.0, timeout=120, sent_at=None):
+        """Wait for the LLM to finish answering and record its streaming times, see tests/waits.py"""
+        reply = waits.wait_for_assistant_reply(self.driver, index, quiet, timeout, sent_at)
+        timing.recorder.record_reply(reply)
+        return reply
+
+    def upload_test_file(self, filename, input_id="__attachFile", timeout=120):
+        """Upload a file (relative to tests/test_files) and wait until it is ready to use"""
+        return uploads.upload_file(self.driver, filename, input_id, timeout)
+
+    def delete_uploaded_file(self, name):
+        """Delete every file named ``name`` from the user's files, see tests/uploads.py"""
+        return uploads.delete_uploaded(self.driver, name)
+
+    def upload_generated_file(self, fmt, input_id="__attachFile", timeout=600, **params):
+        """Upload a generated document (see tests/documents.py), e.g. ``upload_generated_file("pdf", pages=200)``"""
+        return self.upload_test_file(documents.document(fmt, **params), input_id, timeout)
+
+    @property
+    def download_dir(self):
+        """Directory this test's browser downloads into"""
+        return self.driver.download_dir
+
+    def wait_for_download(self, pattern="*", timeout=30):
+        """Wait for a completed download matching ``pattern``, returns (path, size)"""
+        return downloads.wait_for_download(self.download_dir, pattern, timeout)
+
+    # ----------------- Pages -----------------
+    @property
+    def left_sidebar(self):
+        return pages.LeftSidebar(self.driver)
+
+    @property
+    def right_sidebar(self):
+        return pages.RightSidebar(self.driver)
+
+    @property
+    def chat(self):
+        return pages.ChatPane(self.driver)
+
+    @property
+    def assistant_modal(self):
+        return pages.AssistantModal(self.driver)
+
+    @property
+    def admin_modal(self):
+        return pages.AdminModal(self.driver)
+
+    @property
+    def settings_modal(self):
+        return pages.SettingsModal(self.driver)
+
+    # ----------------- Fixtures -----------------
+    def seed(self, conversations=(), folders=(), prompts=(), replace=False):
+        """Write chats, folders and prompts into client storage and reload once, see tests/seeding.py"""
+        with timing.recorder.measure("setup", "seed"):
+            counts = seeding.seed(self.driver, conversations, folders, prompts, replace)
+            self.driver.refresh()
+            self.wait_for("messageChatInputText", timeout=30)
+            self.settle()
+        return counts
+
+    def seed_dataset(self, size, seed=datasets.DEFAULT_SEED, replace=True, timeout=120, **options):
+        """Fill the account with a generated dataset of ``size`` conversations and
+        reload once; returns the dataset, see tests/datasets.py
+        """
+        dataset = datasets.generate(size, seed=seed, **options)
+        with timing.recorder.measure("setup", f"seed_dataset_{size}"):
+            seeding.seed(self.driver, dataset["conversations"], dataset["folders"], dataset["prompts"], replace)
+            self.driver.refresh()
+            self.wait_for("messageChatInputText", timeout=timeout)
+            self.settle(timeout=timeout)
+        print(f"Seeded {datasets.describe(dataset)}")
+        return dataset
+
+    def reset_state(self, *kinds):
+        """Delete every chat, folder, prompt and assistant (or only ``kinds``) and
+        check that none are left, see tests/reset.py
+        """
+        kinds = kinds or reset.KINDS
+        with timing.recorder.measure("setup", "reset_state"):
+            removed = reset.reset(self.driver, kinds)
+            self.driver.refresh()
+            self.wait_for("messageChatInputText", timeout=30)
+            left = reset.leftovers(self.driver, kinds)
+        if removed["failed"] or left:
+            self.fail(f"Reset left items behind: {removed['failed'] + left}")
+        print(
+            f"Reset {removed['conversations']} conversations, {removed['folders']} folders, "
+            f"{removed['prompts']} prompts and {removed['assistants']} assistants in {removed['seconds']}s"
+        )
+        return removed
+
+    def restore_snapshot(self, builder):
+        """Load the world ``builder(self)`` creates, building it only when its cached
+        snapshot is missing, outdated or refers to deleted assistants, see tests/snapshots.py
+        """
+        path = snapshots.snapshot_path(builder, self.username)
+        with timing.recorder.measure("setup", "restore_snapshot"):
+            snapshot = snapshots.load(path)
+            if snapshot is None or snapshots.missing_server_items(self.driver, snapshot):
+                with snapshots.build_lock(path):
+                    # Another worker may have built it while this one waited for the lock
+                    snapshot = snapshots.load(path)
+                    missing = snapshots.missing_server_items(self.driver, snapshot) if snapshot else []
+                    if snapshot is None or missing:
+                        print(f"Building snapshot {os.path.basename(path)}" + (f", missing {missing}" if missing else ""))
+                        builder(self)
+                        self.settle()
+                        snapshot = snapshots.capture(self.driver)
+                        snapshots.save(path, snapshot)
+            snapshots.restore(self.driver, snapshot)
+            self.driver.refresh()
+            self.wait_for("messageChatInputText", timeout=30)
+            self.settle()
+        return snapshot
+
+    # ----------------- Login -----------------
+    def is_logged_in(self, timeout=20):
+        """True once the chat input shows up, False as soon as the login button does"""
         try:
-            self.wait.until(
-                EC.presence_of_element_located((By.ID, "messageChatInputText"))
+            element = timing.TimedWebDriverWait(
+                self.driver, timeout, poll_frequency=waits.POLL_INTERVAL
+            ).until(
+                EC.any_of(
+                    EC.presence_of_element_located((By.ID, "messageChatInputText")),
+                    EC.presence_of_element_located((By.ID, "loginButton")),
+                )
             )
-            return True
-        except:
+        except TimeoutException:
             return False
+        return element.get_attribute("id") == "messageChatInputText"
 
     def login(self):
         """Shared login method"""
@@ -76,20 +404,24 @@ class BaseTest(unittest.TestCase):
             )
             login_button.click()
 
-            # Wait for the identifier and password fields to appear
+            # Wait for the identifier field, or the user list of the local
+            # OIDC provider (tests/mocks/oidc.py)
             username_field = self.wait.until(
                 lambda d: next(
                     (
                         e
                         for e in d.find_elements(By.NAME, "identifier")
+                        + d.find_elements(By.ID, "mockOidcLogin")
                         if e.is_displayed()
                     ),
                     None,
                 )
             )
-            
-            remember_me_label = self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "label[data-se-for-name='rememberMe']")))
-            time.sleep(1)
+            if username_field.get_attribute("id") == "mockOidcLogin":
+                self.mock_login()
+                return
+
+            remember_me_label = self.wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, "label[data-se-for-name='rememberMe']")))
             remember_me_label.click()
             
 
@@ -101,8 +433,6 @@ class BaseTest(unittest.TestCase):
             form = self.driver.find_element(By.TAG_NAME, "form")
             form.submit()
             
-            time.sleep(2)
-            
             # password_field = self.wait.until(
             #     lambda d: next(
             #         (
@@ -114,14 +444,26 @@ class BaseTest(unittest.TestCase):
             #     )
             # )
 
-            # Add a short delay to wait for the loading screen
-            time.sleep(35)  # Wait for 8 seconds before proceeding
-
-            # Wait for a post-login element to ensure login was successful
-            self.wait.until(
+            # Wait through the loading screen for a post-login element,
+            # the redirect and "Setting Up Amplify..." can take a while
+            timing.TimedWebDriverWait(
+                self.driver, 60, poll_frequency=waits.POLL_INTERVAL
+            ).until(
                 EC.visibility_of_element_located(
                     (By.ID, "messageChatInputText")  # Sidebar appears
                 )
             )
         except Exception as e:
             self.fail(f"Login failed: {e}")
+
+    def mock_login(self):
+        """Log in as this worker's user on the local OIDC provider's page"""
+        buttons = self.driver.find_elements(
+            By.CSS_SELECTOR, f"#mockOidcLogin button[data-user='{self.username}']"
+        )
+        if not buttons:
+            self.fail(f"{self.username} is not a user of the OIDC mock, see AMPLIFY_OIDC_USERS")
+        buttons[0].click()
+        timing.TimedWebDriverWait(
+            self.driver, 60, poll_frequency=waits.POLL_INTERVAL
+        ).until(EC.visibility_of_element_located((By.ID, "messageChatInputText")))
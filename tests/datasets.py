@@ -0,0 +1,189 @@
+"""Generate large, reproducible accounts to test the app at production scale.
+
+Real users have thousands of conversations and hundreds of folders and tags,
+while the tests otherwise run against a nearly empty account. ``generate``
+builds a whole account from a seed, using the builders in tests/seeding.py,
+and BaseTest.seed_dataset writes it into client storage in one batch:
+
+    self.seed_dataset(1000)                          # 1k conversations
+    self.seed_dataset(10000, messages=(1, 3), seed=7)
+
+The same size, seed and options always produce the same names, ids, texts
+and folder/tag assignments, so a failure at 10k conversations can be replayed
+exactly. Presets scale the other counts with the number of conversations:
+
+    size     folders  prompt folders  prompts  tags
+    100      5        2               10       10
+    1000     50       10              100      20
+    10000    500      100             1000     200
+
+The scale tests (ConversationsTests/test_LargeAccount.py) run at 100 and 1k
+conversations; set AMPLIFY_DATASET_SIZES=100,1000,10000 to include 10k.
+To check what a size produces without a browser:
+
+    python3 -m tests.datasets 10000 --seed 7
+"""
+
+import argparse
+import copy
+import functools
+import json
+import os
+import random
+import sys
+import uuid
+
+from tests import seeding
+
+SIZES = (100, 1000, 10000)
+DEFAULT_SEED = 0
+
+
+def configured_sizes():
+    """Sizes the scale tests run at; AMPLIFY_DATASET_SIZES=100,1000,10000 adds the 10k run"""
+    raw = os.getenv("AMPLIFY_DATASET_SIZES", "100,1000")
+    return tuple(int(size) for size in raw.split(",") if size.strip())
+
+
+_WORDS = (
+    "amplify assistant budget cache campus chart cluster data deadline deploy draft "
+    "email estimate feedback folder grant handbook index insight invoice kernel lab "
+    "lecture ledger metric model notes outline pipeline policy proposal query quota "
+    "report research review roster schedule script semester slide summary syllabus "
+    "survey table template thesis ticket timeline transcript upload vendor workflow"
+).split()
+
+
+def counts_for(size):
+    """Folder, prompt and tag counts that go with ``size`` conversations"""
+    return {
+        "conversations": size,
+        "folders": max(5, size // 20),
+        "prompt_folders": max(2, size // 100),
+        "prompts": max(10, size // 10),
+        "tags": max(10, size // 50),
+    }
+
+
+class TextGenerator:
+    """Seeded ids, words and sentences, shared with tests/documents.py"""
+
+    def __init__(self, seed):
+        self.random = random.Random(seed)
+
+    def id(self):
+        return str(uuid.UUID(int=self.random.getrandbits(128), version=4))
+
+    def words(self, count):
+        return " ".join(self.random.choice(_WORDS) for _ in range(count))
+
+    def text(self, length):
+        """Roughly ``length`` characters of sentences"""
+        sentences = []
+        size = 0
+        while size < length:
+            sentence = self.words(self.random.randint(4, 14)).capitalize() + "."
+            sentences.append(sentence)
+            size += len(sentence) + 1
+        return " ".join(sentences)
+
+    def title(self, index):
+        return f"{self.words(self.random.randint(1, 3)).title()} {index}"
+
+
+@functools.lru_cache(maxsize=4)
+def _generate(size, seed, messages, message_length, tags_per_chat, counts):
+    counts = dict(counts)
+    gen = TextGenerator(seed)
+
+    tags = [f"{gen.words(1)}-{i}" for i in range(counts["tags"])]
+    folders = [
+        {**seeding.folder(f"{gen.title(i)} Folder"), "id": gen.id()}
+        for i in range(counts["folders"])
+    ]
+    prompt_folders = [
+        {**seeding.folder(f"{gen.title(i)} Prompts", type="prompt"), "id": gen.id()}
+        for i in range(counts["prompt_folders"])
+    ]
+
+    conversations = []
+    for i in range(size):
+        built = []
+        for m in range(gen.random.randint(*messages)):
+            role = "user" if m % 2 == 0 else "assistant"
+            content = gen.text(gen.random.randint(*message_length))
+            built.append({**seeding.message(content, role), "id": gen.id()})
+        # About one chat in ten stays in today's folder, like chats nobody filed
+        folder = gen.random.choice(folders)["name"] if gen.random.random() > 0.1 else seeding.TODAY
+        chat_tags = gen.random.sample(tags, min(len(tags), gen.random.randint(*tags_per_chat)))
+        conversations.append(
+            seeding.conversation(gen.title(i), built, folder=folder, tags=chat_tags, id=gen.id())
+        )
+
+    prompts = []
+    for i in range(counts["prompts"]):
+        folder = gen.random.choice(prompt_folders)["name"] if gen.random.random() > 0.3 else None
+        prompts.append({
+            **seeding.prompt(
+                f"{gen.title(i)} Template",
+                content=f"{gen.text(80)} {{{{{gen.words(1)}}}}}",
+                description=gen.words(8),
+                folder=folder,
+            ),
+            "id": gen.id(),
+        })
+
+    return {
+        "conversations": conversations,
+        "folders": folders + prompt_folders,
+        "prompts": prompts,
+        "tags": tags,
+    }
+
+
+def generate(size, seed=DEFAULT_SEED, messages=(2, 6), message_length=(40, 400), tags_per_chat=(0, 3), **counts):
+    """Build an account with ``size`` conversations.
+
+    ``messages`` and ``message_length`` are (min, max) ranges for the messages
+    per conversation and the characters per message, ``tags_per_chat`` for the
+    tags on each conversation. Keyword ``counts`` (folders, prompt_folders,
+    prompts, tags) override the preset that goes with ``size``.
+
+    Returns a dict with the conversations, folders and prompts to pass to
+    seeding.seed, and the tag names used.
+    """
+    unknown = set(counts) - set(counts_for(size))
+    if unknown:
+        raise ValueError(f"Unknown dataset counts: {sorted(unknown)}")
+    merged = {**counts_for(size), **counts}
+    del merged["conversations"]
+    cached = _generate(
+        size, seed, tuple(messages), tuple(message_length), tuple(tags_per_chat),
+        tuple(sorted(merged.items())),
+    )
+    # Every caller gets its own copy, so changing it cannot alter later uses of the dataset
+    return copy.deepcopy(cached)
+
+
+def describe(dataset):
+    messages = sum(len(c["messages"]) for c in dataset["conversations"])
+    size = len(json.dumps(dataset))
+    return (
+        f"{len(dataset['conversations'])} conversations ({messages} messages), "
+        f"{len(dataset['folders'])} folders, {len(dataset['prompts'])} prompts, "
+        f"{len(dataset['tags'])} tags, {size / 1e6:.1f} MB of JSON"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Preview a generated dataset")
+    parser.add_argument("size", type=int, help=f"number of conversations, e.g. {', '.join(map(str, SIZES))}")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--output", help="also write the dataset to this JSON file")
+    args = parser.parse_args()
+    data = generate(args.size, seed=args.seed)
+    print(describe(data))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+    sys.exit(0)
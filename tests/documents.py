@@ -0,0 +1,449 @@
+"""Generate documents of any size to measure upload and extraction throughput.
+
+tests/test_files only holds small fixed samples, so a slow document pipeline
+hardly shows up in the upload timings. ``document`` writes a file of the
+requested format and size and returns its absolute path, which
+BaseTest.upload_test_file accepts like any test file:
+
+    path = documents.document("csv", columns=40, megabytes=5)
+    path = documents.document("pdf", pages=200)
+    self.upload_test_file(documents.document("pptx", slides=60))
+
+Formats and their parameters (defaults in FORMATS):
+
+    csv    columns, megabytes      rows of ids, numbers, dates and text
+    txt    megabytes               paragraphs of sentences
+    md     sections                headings, paragraphs, lists and tables
+    html   sections                the same structure as md, as HTML
+    pdf    pages                   one page of text per page
+    docx   pages                   headings and paragraphs, page breaks
+    pptx   slides, bullets         a title and bullets per slide
+
+Everything is written with the standard library (csv, zipfile and a minimal
+PDF writer), so no Office or PDF package is needed to run the tests. The
+content is generated from ``seed`` and the files are cached in
+tests/.documents/ under their parameters, so a size is only written once
+and every worker uploads exactly the same bytes. To build or inspect files
+without a browser:
+
+    python3 -m tests.documents pdf pages=200
+    python3 -m tests.documents csv columns=40 megabytes=5
+"""
+
+import argparse
+import csv
+import datetime
+import io
+import os
+import sys
+import zipfile
+from xml.sax.saxutils import escape
+
+from tests.datasets import DEFAULT_SEED, TextGenerator
+
+DOCUMENT_DIR = os.getenv(
+    "AMPLIFY_DOCUMENT_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".documents"),
+)
+
+# Bump when a writer changes, so every cached document is written again
+FORMAT_VERSION = 1
+
+FORMATS = {
+    "csv": {"columns": 10, "megabytes": 1},
+    "txt": {"megabytes": 1},
+    "md": {"sections": 50},
+    "html": {"sections": 50},
+    "pdf": {"pages": 10},
+    "docx": {"pages": 10},
+    "pptx": {"slides": 10, "bullets": 5},
+}
+
+# Sizes the throughput tests upload per format, smallest first. Only the
+# smallest is uploaded unless AMPLIFY_DOCUMENT_SIZES=all, see configured_sizes()
+SIZES = {
+    "csv": [{"columns": 10, "megabytes": 0.1}, {"columns": 10, "megabytes": 1}, {"columns": 40, "megabytes": 5}],
+    "txt": [{"megabytes": 0.1}, {"megabytes": 1}, {"megabytes": 5}],
+    "md": [{"sections": 20}, {"sections": 200}, {"sections": 1000}],
+    "html": [{"sections": 20}, {"sections": 200}, {"sections": 1000}],
+    "pdf": [{"pages": 5}, {"pages": 50}, {"pages": 200}],
+    "docx": [{"pages": 5}, {"pages": 50}, {"pages": 200}],
+    "pptx": [{"slides": 5}, {"slides": 30}, {"slides": 100}],
+}
+
+
+def configured_sizes(formats=None, per_format=None):
+    """``(format, params)`` the throughput tests upload, smallest first.
+
+    By default one small document, the smallest size of the first format.
+    AMPLIFY_DOCUMENT_SIZES=all uploads every size of every format (up to
+    ``per_format`` each), up to multi-MB and 200 page files.
+    """
+    formats = list(formats or SIZES)
+    mode = os.getenv("AMPLIFY_DOCUMENT_SIZES", "small")
+    if mode == "small":
+        return [(formats[0], SIZES[formats[0]][0])]
+    if mode == "all":
+        return [(fmt, params) for fmt in formats for params in SIZES[fmt][:per_format]]
+    raise ValueError(f"AMPLIFY_DOCUMENT_SIZES must be 'small' or 'all', not {mode!r}")
+
+
+_LINES_PER_PAGE = 50
+_LINE_LENGTH = 90
+
+
+def document(fmt, seed=DEFAULT_SEED, **params):
+    """Return the path of a ``fmt`` document with ``params``, writing it on first use"""
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown document format {fmt!r}, expected one of {sorted(FORMATS)}")
+    unknown = set(params) - set(FORMATS[fmt])
+    if unknown:
+        raise ValueError(f"Unknown {fmt} parameters: {sorted(unknown)}")
+    merged = {**FORMATS[fmt], **params}
+
+    path = document_path(fmt, seed, merged)
+    if not os.path.exists(path):
+        os.makedirs(DOCUMENT_DIR, exist_ok=True)
+        content = _WRITERS[fmt](TextGenerator(seed), **merged)
+        # Written under a temporary name so parallel workers never upload half a file
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, "wb") as f:
+            f.write(content)
+        os.replace(temporary, path)
+    return path
+
+
+def document_path(fmt, seed, params):
+    described = "_".join(f"{key}{value}" for key, value in sorted(params.items()))
+    return os.path.join(DOCUMENT_DIR, f"Generated_{fmt}_{described}_seed{seed}_v{FORMAT_VERSION}.{fmt}")
+
+
+# ----------------- Text formats -----------------
+def _csv(gen, columns, megabytes):
+    names = ["id", "date", "amount"] + [f"{gen.words(1)}_{i}" for i in range(max(0, columns - 3))]
+    names = names[:columns]
+    out = io.StringIO()
+    writer = csv.writer(out, lineterminator="\n")
+    writer.writerow(names)
+    start = datetime.date(2020, 1, 1)
+    target = int(megabytes * 1e6)
+    row = 0
+    while out.tell() < target:
+        values = [
+            row,
+            (start + datetime.timedelta(days=gen.random.randrange(2000))).isoformat(),
+            f"{gen.random.uniform(0, 10000):.2f}",
+        ]
+        values += [gen.words(gen.random.randint(1, 4)) for _ in range(max(0, columns - 3))]
+        writer.writerow(values[:columns])
+        row += 1
+    return out.getvalue().encode("utf-8")
+
+
+def _txt(gen, megabytes):
+    target = int(megabytes * 1e6)
+    paragraphs = []
+    size = 0
+    while size < target:
+        paragraph = gen.text(gen.random.randint(300, 1200))
+        paragraphs.append(paragraph)
+        size += len(paragraph) + 2
+    return "\n\n".join(paragraphs).encode("utf-8")
+
+
+def _sections(gen, sections):
+    """Shared structure of the md and html documents: heading, paragraphs, list, sometimes a table"""
+    built = []
+    for i in range(sections):
+        table = None
+        if i % 5 == 4:
+            table = [[gen.words(1).title() for _ in range(4)]]
+            table += [[gen.words(2) for _ in range(4)] for _ in range(gen.random.randint(3, 8))]
+        built.append({
+            "title": gen.title(i + 1),
+            "paragraphs": [gen.text(gen.random.randint(200, 800)) for _ in range(gen.random.randint(1, 4))],
+            "items": [gen.words(gen.random.randint(3, 8)).capitalize() for _ in range(gen.random.randint(2, 6))],
+            "table": table,
+        })
+    return built
+
+
+def _md(gen, sections):
+    lines = [f"# {gen.title(0)} Report", ""]
+    for section in _sections(gen, sections):
+        lines += [f"## {section['title']}", ""]
+        for paragraph in section["paragraphs"]:
+            lines += [paragraph, ""]
+        lines += [f"- {item}" for item in section["items"]] + [""]
+        if section["table"]:
+            header, *rows = section["table"]
+            lines.append("| " + " | ".join(header) + " |")
+            lines.append("|" + " --- |" * len(header))
+            lines += ["| " + " | ".join(row) + " |" for row in rows]
+            lines.append("")
+    return "\n".join(lines).encode("utf-8")
+
+
+def _html(gen, sections):
+    title = escape(f"{gen.title(0)} Report")
+    parts = [f"<!DOCTYPE html>\n<html>\n<head><meta charset=\"utf-8\"><title>{title}</title></head>\n<body>"]
+    parts.append(f"<h1>{title}</h1>")
+    for section in _sections(gen, sections):
+        parts.append(f"<section>\n<h2>{escape(section['title'])}</h2>")
+        parts += [f"<p>{escape(paragraph)}</p>" for paragraph in section["paragraphs"]]
+        parts.append("<ul>" + "".join(f"<li>{escape(item)}</li>" for item in section["items"]) + "</ul>")
+        if section["table"]:
+            header, *rows = section["table"]
+            parts.append("<table>")
+            parts.append("<tr>" + "".join(f"<th>{escape(cell)}</th>" for cell in header) + "</tr>")
+            parts += ["<tr>" + "".join(f"<td>{escape(cell)}</td>" for cell in row) + "</tr>" for row in rows]
+            parts.append("</table>")
+        parts.append("</section>")
+    parts.append("</body>\n</html>\n")
+    return "\n".join(parts).encode("utf-8")
+
+
+def _lines(gen, count):
+    """``count`` lines of at most _LINE_LENGTH characters of running text"""
+    lines = []
+    current = ""
+    while len(lines) < count:
+        for word in gen.text(400).split():
+            if len(current) + len(word) + 1 > _LINE_LENGTH:
+                lines.append(current)
+                current = ""
+                if len(lines) == count:
+                    break
+            current = f"{current} {word}" if current else word
+    return lines
+
+
+# ----------------- PDF -----------------
+def _pdf_string(text):
+    return "(" + text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)") + ")"
+
+
+def _pdf(gen, pages):
+    """A PDF with one Helvetica text page per page, the smallest structure readers accept"""
+    # Objects 1-3 are the catalog, the page tree and the font, then a page and its content per page
+    page_ids = [4 + 2 * i for i in range(pages)]
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        (f"<< /Type /Pages /Kids [{' '.join(f'{p} 0 R' for p in page_ids)}] /Count {pages} >>").encode("ascii"),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+    ]
+    for i, page_id in enumerate(page_ids):
+        lines = [f"Page {i + 1}: {gen.title(i + 1)}"] + _lines(gen, _LINES_PER_PAGE - 1)
+        stream = "BT /F1 10 Tf 14 TL 50 760 Td\n" + "\n".join(f"{_pdf_string(line)} '" for line in lines) + "\nET"
+        stream = stream.encode("latin-1")
+        objects.append(
+            (f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+             f"/Resources << /Font << /F1 3 0 R >> >> /Contents {page_id + 1} 0 R >>").encode("ascii")
+        )
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(out.tell())
+        out.write(b"%d 0 obj\n%s\nendobj\n" % (number, body))
+    xref = out.tell()
+    out.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    for offset in offsets:
+        out.write(b"%010d 00000 n \n" % offset)
+    out.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref))
+    return out.getvalue()
+
+
+# ----------------- Office Open XML -----------------
+_XML = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_PKG_REL = "http://schemas.openxmlformats.org/package/2006/relationships"
+_CT = "application/vnd.openxmlformats-officedocument"
+
+
+def _rels(*targets):
+    """A .rels part; ``targets`` are (type, target) pairs numbered rId1, rId2, ..."""
+    body = "".join(
+        f'<Relationship Id="rId{i}" Type="{_REL}/{kind}" Target="{target}"/>'
+        for i, (kind, target) in enumerate(targets, start=1)
+    )
+    return f'{_XML}<Relationships xmlns="{_PKG_REL}">{body}</Relationships>'
+
+
+def _content_types(overrides):
+    body = "".join(f'<Override PartName="{part}" ContentType="{kind}"/>' for part, kind in overrides)
+    return (
+        f'{_XML}<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        f"{body}</Types>"
+    )
+
+
+def _zip(parts):
+    out = io.BytesIO()
+    with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, content in parts.items():
+            archive.writestr(name, content)
+    return out.getvalue()
+
+
+def _docx(gen, pages):
+    def paragraph(text, bold=False, size=None):
+        props = ("<w:b/>" if bold else "") + (f'<w:sz w:val="{size}"/>' if size else "")
+        props = f"<w:rPr>{props}</w:rPr>" if props else ""
+        return f'<w:p><w:r>{props}<w:t xml:space="preserve">{escape(text)}</w:t></w:r></w:p>'
+
+    body = []
+    for i in range(pages):
+        if i:
+            body.append('<w:p><w:r><w:br w:type="page"/></w:r></w:p>')
+        body.append(paragraph(f"{i + 1}. {gen.title(i + 1)}", bold=True, size=32))
+        # About a page of 11pt text
+        for _ in range(5):
+            body.append(paragraph(gen.text(gen.random.randint(400, 700))))
+    document = (
+        f'{_XML}<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f'<w:body>{"".join(body)}<w:sectPr/></w:body></w:document>'
+    )
+    return _zip({
+        "[Content_Types].xml": _content_types([
+            ("/word/document.xml", f"{_CT}.wordprocessingml.document.main+xml"),
+        ]),
+        "_rels/.rels": _rels(("officeDocument", "word/document.xml")),
+        "word/document.xml": document,
+    })
+
+
+_P_NS = (
+    'xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" '
+    f'xmlns:r="{_REL}" '
+    'xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main"'
+)
+_EMPTY_TREE = (
+    '<p:nvGrpSpPr><p:cNvPr id="1" name=""/><p:cNvGrpSpPr/><p:nvPr/></p:nvGrpSpPr>'
+    "<p:grpSpPr/>"
+)
+
+
+def _theme():
+    colors = "".join(
+        f'<a:{name}><a:srgbClr val="{value}"/></a:{name}>'
+        for name, value in (
+            ("dk1", "000000"), ("lt1", "FFFFFF"), ("dk2", "1F497D"), ("lt2", "EEECE1"),
+            ("accent1", "4F81BD"), ("accent2", "C0504D"), ("accent3", "9BBB59"),
+            ("accent4", "8064A2"), ("accent5", "4BACC6"), ("accent6", "F79646"),
+            ("hlink", "0000FF"), ("folHlink", "800080"),
+        )
+    )
+    font = '<a:latin typeface="Calibri"/><a:ea typeface=""/><a:cs typeface=""/>'
+    fill = '<a:solidFill><a:schemeClr val="phClr"/></a:solidFill>'
+    line = f'<a:ln w="9525">{fill}</a:ln>'
+    return (
+        f'{_XML}<a:theme xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" name="Generated">'
+        f'<a:themeElements><a:clrScheme name="Generated">{colors}</a:clrScheme>'
+        f'<a:fontScheme name="Generated"><a:majorFont>{font}</a:majorFont><a:minorFont>{font}</a:minorFont></a:fontScheme>'
+        f'<a:fmtScheme name="Generated"><a:fillStyleLst>{fill * 3}</a:fillStyleLst>'
+        f"<a:lnStyleLst>{line * 3}</a:lnStyleLst>"
+        f'<a:effectStyleLst>{"<a:effectStyle><a:effectLst/></a:effectStyle>" * 3}</a:effectStyleLst>'
+        f"<a:bgFillStyleLst>{fill * 3}</a:bgFillStyleLst></a:fmtScheme>"
+        "</a:themeElements></a:theme>"
+    )
+
+
+def _text_box(shape_id, name, y, height, paragraphs, size):
+    runs = "".join(
+        f'<a:p><a:r><a:rPr lang="en-US" sz="{size}"/><a:t>{escape(text)}</a:t></a:r></a:p>'
+        for text in paragraphs
+    )
+    return (
+        f'<p:sp><p:nvSpPr><p:cNvPr id="{shape_id}" name="{name}"/><p:cNvSpPr txBox="1"/><p:nvPr/></p:nvSpPr>'
+        f'<p:spPr><a:xfrm><a:off x="457200" y="{y}"/><a:ext cx="8229600" cy="{height}"/></a:xfrm>'
+        '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom></p:spPr>'
+        f'<p:txBody><a:bodyPr wrap="square"/><a:lstStyle/>{runs}</p:txBody></p:sp>'
+    )
+
+
+def _pptx(gen, slides, bullets):
+    """A deck on one blank master and layout, with a title and bullet text box per slide"""
+    parts = {
+        "_rels/.rels": _rels(("officeDocument", "ppt/presentation.xml")),
+        "ppt/theme/theme1.xml": _theme(),
+        "ppt/slideMasters/slideMaster1.xml": (
+            f"{_XML}<p:sldMaster {_P_NS}><p:cSld><p:spTree>{_EMPTY_TREE}</p:spTree></p:cSld>"
+            '<p:clrMap bg1="lt1" tx1="dk1" bg2="lt2" tx2="dk2" accent1="accent1" accent2="accent2" '
+            'accent3="accent3" accent4="accent4" accent5="accent5" accent6="accent6" hlink="hlink" folHlink="folHlink"/>'
+            '<p:sldLayoutIdLst><p:sldLayoutId id="2147483649" r:id="rId1"/></p:sldLayoutIdLst></p:sldMaster>'
+        ),
+        "ppt/slideMasters/_rels/slideMaster1.xml.rels": _rels(
+            ("slideLayout", "../slideLayouts/slideLayout1.xml"), ("theme", "../theme/theme1.xml")
+        ),
+        "ppt/slideLayouts/slideLayout1.xml": (
+            f'{_XML}<p:sldLayout {_P_NS} type="blank"><p:cSld name="Blank"><p:spTree>{_EMPTY_TREE}</p:spTree></p:cSld>'
+            "<p:clrMapOvr><a:masterClrMapping/></p:clrMapOvr></p:sldLayout>"
+        ),
+        "ppt/slideLayouts/_rels/slideLayout1.xml.rels": _rels(("slideMaster", "../slideMasters/slideMaster1.xml")),
+    }
+    for i in range(1, slides + 1):
+        title = _text_box(2, "Title", 274638, 1143000, [gen.title(i)], 3200)
+        body = _text_box(
+            3, "Body", 1600200, 4525963,
+            [f"• {gen.text(gen.random.randint(40, 140))}" for _ in range(bullets)], 1800,
+        )
+        parts[f"ppt/slides/slide{i}.xml"] = (
+            f"{_XML}<p:sld {_P_NS}><p:cSld><p:spTree>{_EMPTY_TREE}{title}{body}</p:spTree></p:cSld>"
+            "<p:clrMapOvr><a:masterClrMapping/></p:clrMapOvr></p:sld>"
+        )
+        parts[f"ppt/slides/_rels/slide{i}.xml.rels"] = _rels(("slideLayout", "../slideLayouts/slideLayout1.xml"))
+
+    slide_ids = "".join(f'<p:sldId id="{255 + i}" r:id="rId{i + 2}"/>' for i in range(1, slides + 1))
+    parts["ppt/presentation.xml"] = (
+        f"{_XML}<p:presentation {_P_NS}>"
+        '<p:sldMasterIdLst><p:sldMasterId id="2147483648" r:id="rId1"/></p:sldMasterIdLst>'
+        f"<p:sldIdLst>{slide_ids}</p:sldIdLst>"
+        '<p:sldSz cx="9144000" cy="6858000"/><p:notesSz cx="6858000" cy="9144000"/></p:presentation>'
+    )
+    parts["ppt/_rels/presentation.xml.rels"] = _rels(
+        ("slideMaster", "slideMasters/slideMaster1.xml"),
+        ("theme", "theme/theme1.xml"),
+        *[("slide", f"slides/slide{i}.xml") for i in range(1, slides + 1)],
+    )
+    parts["[Content_Types].xml"] = _content_types(
+        [
+            ("/ppt/presentation.xml", f"{_CT}.presentationml.presentation.main+xml"),
+            ("/ppt/slideMasters/slideMaster1.xml", f"{_CT}.presentationml.slideMaster+xml"),
+            ("/ppt/slideLayouts/slideLayout1.xml", f"{_CT}.presentationml.slideLayout+xml"),
+            ("/ppt/theme/theme1.xml", f"{_CT}.theme+xml"),
+        ]
+        + [(f"/ppt/slides/slide{i}.xml", f"{_CT}.presentationml.slide+xml") for i in range(1, slides + 1)]
+    )
+    return _zip(parts)
+
+
+_WRITERS = {
+    "csv": _csv,
+    "txt": _txt,
+    "md": _md,
+    "html": _html,
+    "pdf": _pdf,
+    "docx": _docx,
+    "pptx": _pptx,
+}
+
+
+def _number(value):
+    return float(value) if "." in value else int(value)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write (or find) a generated test document")
+    parser.add_argument("format", choices=sorted(FORMATS))
+    parser.add_argument("params", nargs="*", help="key=value, e.g. pages=200 or megabytes=0.5")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    args = parser.parse_args()
+    params = {key: _number(value) for key, value in (param.split("=", 1) for param in args.params)}
+    path = document(args.format, seed=args.seed, **params)
+    print(f"{path} ({os.path.getsize(path) / 1e6:.2f} MB)")
+    sys.exit(0)
@@ -0,0 +1,116 @@
+"""Wait for browser downloads to finish in a test's private download directory.
+
+BaseTest points Chrome's ``download.default_directory`` at a temporary
+directory per browser, so parallel workers never see each other's files.
+``wait_for_download`` returns as soon as the file is complete: it is woken up
+by inotify on Linux and falls back to polling elsewhere. Chrome writes to
+``<name>.crdownload`` and renames it when done, so partial files are ignored.
+"""
+
+import ctypes
+import ctypes.util
+import fnmatch
+import os
+import select
+import struct
+import time
+
+POLL_INTERVAL = 0.1
+PARTIAL_SUFFIXES = (".crdownload", ".tmp")
+
+# inotify(7) event masks
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class _Inotify:
+    """Minimal inotify watch on one directory, through libc"""
+
+    def __init__(self, directory):
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        mask = _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE
+        if libc.inotify_add_watch(self.fd, os.fsencode(directory), mask) < 0:
+            os.close(self.fd)
+            raise OSError(ctypes.get_errno(), "inotify_add_watch failed")
+
+    def wait(self, timeout):
+        """Block until something changed in the directory or ``timeout`` passed"""
+        readable, _, _ = select.select([self.fd], [], [], max(timeout, 0))
+        if readable:
+            try:
+                os.read(self.fd, 64 * (_EVENT_HEADER.size + 256))  # Drain the events
+            except BlockingIOError:
+                pass
+
+    def close(self):
+        os.close(self.fd)
+
+
+class _Poller:
+    """Fallback used when inotify is not available"""
+
+    def wait(self, timeout):
+        time.sleep(min(POLL_INTERVAL, max(timeout, 0)))
+
+    def close(self):
+        pass
+
+
+def _watch(directory):
+    try:
+        return _Inotify(directory)
+    except (OSError, AttributeError, TypeError):
+        # Not Linux (no inotify_init1 in libc) or inotify limits reached
+        return _Poller()
+
+
+def is_partial(filename):
+    return filename.endswith(PARTIAL_SUFFIXES)
+
+
+def find_completed(directory, pattern="*"):
+    """Return the path of a completed download matching ``pattern``, or None"""
+    names = os.listdir(directory)
+    for name in sorted(names):
+        if is_partial(name) or not fnmatch.fnmatch(name, pattern):
+            continue
+        # Chrome renames X.crdownload to X when done, but be safe while both exist
+        if any(other.startswith(name) and is_partial(other) for other in names):
+            continue
+        return os.path.join(directory, name)
+    return None
+
+
+def wait_for_download(directory, pattern="*", timeout=30):
+    """Wait for a completed download matching ``pattern`` and return ``(path, size)``"""
+    deadline = time.monotonic() + timeout
+    watcher = _watch(directory)
+    try:
+        while True:
+            path = find_completed(directory, pattern)
+            if path is not None:
+                return path, os.path.getsize(path)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(
+                    f"No completed download matching '{pattern}' in {directory} after {timeout}s "
+                    f"(found: {sorted(os.listdir(directory))})"
+                )
+            watcher.wait(remaining)
+    finally:
+        watcher.close()
+
+
+def clear(directory):
+    """Remove every file from a download directory"""
+    for name in os.listdir(directory):
+        path = os.path.join(directory, name)
+        if os.path.isfile(path):
+            os.remove(path)
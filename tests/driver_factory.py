@@ -0,0 +1,70 @@
+"""Chromedriver resolution and Chrome startup.
+
+The chromedriver binary is resolved once per process (instead of calling
+ChromeDriverManager in every setUp) and the parallel runner resolves it once
+for the whole run and hands the path to its workers through CHROMEDRIVER_PATH.
+
+Resolution order:
+    1. CHROMEDRIVER_PATH, a pinned local binary (use this on air-gapped runners)
+    2. ChromeDriverManager, which downloads or reuses a cached matching driver
+    3. A chromedriver found on PATH, when the manager cannot reach the network
+"""
+
+import os
+import shutil
+import time
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+
+_driver_path = None
+
+# Seconds spent resolving the driver and starting each Chrome in this process
+resolve_time = None
+startup_times = []
+
+
+def resolve_driver_path():
+    """Return the chromedriver path, resolving it on the first call only"""
+    global _driver_path, resolve_time
+    if _driver_path is not None:
+        return _driver_path
+
+    start = time.perf_counter()
+    path = os.getenv("CHROMEDRIVER_PATH")
+    if path:
+        if not os.path.isfile(path):
+            raise FileNotFoundError(f"CHROMEDRIVER_PATH does not exist: {path}")
+    else:
+        try:
+            from webdriver_manager.chrome import ChromeDriverManager
+
+            path = ChromeDriverManager().install()
+        except Exception as e:
+            path = shutil.which("chromedriver")
+            if path is None:
+                raise RuntimeError(
+                    "Could not resolve chromedriver; set CHROMEDRIVER_PATH to a local binary"
+                ) from e
+
+    _driver_path = path
+    resolve_time = time.perf_counter() - start
+    return _driver_path
+
+
+def create_service():
+    """Return a chromedriver Service for the resolved binary.
+
+    Services are cheap once the path is known, so every browser gets its own
+    instead of sharing a process that could be stopped under another driver.
+    """
+    return Service(resolve_driver_path())
+
+
+def start_chrome(options):
+    """Start Chrome and record how long the startup took"""
+    service = create_service()
+    start = time.perf_counter()
+    driver = webdriver.Chrome(service=service, options=options)
+    startup_times.append(time.perf_counter() - start)
+    return driver
@@ -0,0 +1,109 @@
+"""Historical per-test durations, used to schedule the longest tests first.
+
+Every runner invocation appends the duration of each test that ran to a small
+SQLite database (tests/.durations.sqlite, override with AMPLIFY_DURATIONS_DB).
+The estimate for a test is the median of its most recent runs; tests without
+history get the median of every known test so they are neither first nor last.
+"""
+
+import os
+import sqlite3
+import statistics
+import time
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".durations.sqlite")
+
+# Estimate for any test when the database is still empty
+DEFAULT_ESTIMATE = 60.0
+
+# Number of recent runs a test's estimate is based on
+HISTORY = 5
+
+
+def db_path():
+    return os.getenv("AMPLIFY_DURATIONS_DB", DEFAULT_PATH)
+
+
+def connect(path=None):
+    connection = sqlite3.connect(path or db_path())
+    connection.execute(
+        """
+        CREATE TABLE IF NOT EXISTS test_durations (
+            test_id TEXT NOT NULL,
+            duration REAL NOT NULL,
+            status TEXT NOT NULL,
+            recorded_at REAL NOT NULL
+        )
+        """
+    )
+    connection.execute(
+        "CREATE INDEX IF NOT EXISTS test_durations_id ON test_durations (test_id, recorded_at)"
+    )
+    return connection
+
+
+def record(records, path=None):
+    """Store the durations of finished tests (runner result records)"""
+    now = time.time()
+    rows = [
+        (r["id"], r["duration"], r["status"], now)
+        for r in records
+        # Import errors and crashed workers say nothing about the test's speed
+        if r["status"] in ("passed", "failed") and r["duration"] > 0
+    ]
+    connection = connect(path)
+    try:
+        with connection:
+            connection.executemany("INSERT INTO test_durations VALUES (?, ?, ?, ?)", rows)
+    finally:
+        connection.close()
+    return len(rows)
+
+
+def load_estimates(path=None):
+    """Return {test_id: estimated seconds} from the most recent runs of every test"""
+    connection = connect(path)
+    try:
+        rows = connection.execute(
+            "SELECT test_id, duration FROM test_durations ORDER BY recorded_at DESC"
+        ).fetchall()
+    finally:
+        connection.close()
+
+    history = {}
+    for test_id, duration in rows:
+        runs = history.setdefault(test_id, [])
+        if len(runs) < HISTORY:
+            runs.append(duration)
+    return {test_id: statistics.median(runs) for test_id, runs in history.items()}
+
+
+class Estimator:
+    """Estimates test and work unit durations from recorded history"""
+
+    def __init__(self, estimates=None):
+        self.estimates = load_estimates() if estimates is None else estimates
+        self.default = (
+            statistics.median(self.estimates.values()) if self.estimates else DEFAULT_ESTIMATE
+        )
+
+    def test(self, test_id):
+        return self.estimates.get(test_id, self.default)
+
+    def unit(self, unit):
+        """Estimated seconds for a runner work unit (a class and its methods)"""
+        return sum(self.test(f"{unit['id']}.{method}") for method in unit["methods"])
+
+
+def longest_first(units, estimator):
+    """Order work units longest-processing-time first (ties by id, for stable runs)"""
+    return sorted(units, key=lambda unit: (-estimator.unit(unit), unit["id"]))
+
+
+def simulate_makespan(units, workers, estimator):
+    """Expected wall time when ``units`` are pulled in order by ``workers`` idle workers"""
+    loads = [0.0] * max(1, workers)
+    for unit in units:
+        index = loads.index(min(loads))
+        loads[index] += estimator.unit(unit)
+    return max(loads)
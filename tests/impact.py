@@ -0,0 +1,178 @@
+"""Select the tests affected by a frontend change.
+
+Maps every file changed since a git ref to the element ids it defines (see
+tests/locators.py), and those ids to the test methods that look them up,
+directly or through the page objects in tests/pages.py.
+Both the old and the new version of a changed file count, so removing an id
+still selects the tests that used it. A change to the folder component only
+runs the folder tests, not the whole suite:
+
+    python3 -m tests.runner 1 --changed-since origin/main
+    python3 -m tests.impact origin/main     # only print the selection
+
+Changed test modules run completely, changed files in tests/test_files run
+the tests that mention them, and a change to the test infrastructure
+(tests/*.py such as base_test.py) runs everything. Frontend files that define
+no ids (utils, services, styles, ...) cannot be mapped and are only listed.
+"""
+
+import os
+import subprocess
+import sys
+
+from tests import locators
+
+TESTS_DIR = locators.TESTS_DIR
+PROJECT_DIR = locators.PROJECT_DIR
+TEST_FILES_DIR = os.path.join("tests", "test_files")
+FRONTEND_EXTENSIONS = locators.SOURCE_EXTENSIONS + (".css", ".scss", ".json")
+
+
+def _git(*args):
+    return subprocess.run(
+        ["git", *args], cwd=PROJECT_DIR, capture_output=True, text=True, check=True
+    ).stdout
+
+
+def changed_files(ref):
+    """Files changed between ``ref`` and the working tree, including untracked ones"""
+    changed = set(_git("diff", "--name-only", ref, "--").split("\n"))
+    changed.update(_git("ls-files", "--others", "--exclude-standard").split("\n"))
+    return sorted(path for path in changed if path)
+
+
+def _read_at(ref, path):
+    try:
+        return _git("show", f"{ref}:{path}")
+    except subprocess.CalledProcessError:
+        return None  # Added since ref
+
+
+def _read(path):
+    try:
+        with open(os.path.join(PROJECT_DIR, path), encoding="utf-8") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None  # Deleted
+
+
+# ----------------- Frontend side -----------------
+def file_index(path, source, index):
+    """Index only the ids ``source`` defines, including ids forwarded through its props"""
+    own = locators.LocatorIndex()
+    own.add_source(path, source)
+    rendered = set(own.forwarded)
+    # Literals this file passes to forwarding props elsewhere (label="Close All")
+    own.forwarded = {**index.forwarded, **own.forwarded}
+    own.add_forwarded_values(source)
+    # Every id passed to a prop this file renders as an id (KebabItem's id={label})
+    for name in rendered:
+        for element_id in index.forwarded_ids.get(name, ()):
+            own.ids.setdefault(element_id, "forwarded")
+    return own
+
+
+def _is_frontend_source(path):
+    return path.split("/")[0] in locators.SOURCE_DIRS and path.endswith(locators.SOURCE_EXTENSIONS)
+
+
+# ----------------- Test side -----------------
+def _uses(index, found):
+    """Return the ids in ``found`` (from locators_in) that ``index`` defines"""
+    used = set()
+    for _, kind, value in found:
+        if kind == "id" and index.defines(value):
+            used.add(value)
+        elif kind == "prefix" and index.defines_prefix(value):
+            used.add(f"{value}...")
+    return used
+
+
+# ----------------- Selection -----------------
+def affected(changed, ref):
+    """Work out which tests ``changed`` (paths relative to the project) affect.
+
+    Returns a dict with ``tests`` ({test_id: [reasons]}), ``run_all`` (the
+    reason to run everything, or None) and ``unmapped`` (changed frontend
+    files that define no element ids).
+    """
+    result = {"tests": {}, "run_all": None, "unmapped": []}
+    usage = {}
+    pages = locators.page_objects()
+    for path in locators.test_modules():
+        usage.update(locators.test_usage(path, pages))
+
+    def select(test_id, reason):
+        result["tests"].setdefault(test_id, []).append(reason)
+
+    index = None
+    for path in changed:
+        name = os.path.basename(path)
+        if path.startswith("tests/") and path.endswith(".py"):
+            if name.startswith("test_"):
+                module = path[: -len(".py")].replace("/", ".")
+                for test_id in usage:
+                    if test_id.startswith(module + "."):
+                        select(test_id, f"{path} changed")
+            elif result["run_all"] is None:
+                result["run_all"] = f"{path} is shared by every test"
+        elif path.startswith(TEST_FILES_DIR + "/"):
+            for test_id, (_, source_lines) in usage.items():
+                if any(name in line for line in source_lines):
+                    select(test_id, f"uses {path}")
+        elif _is_frontend_source(path):
+            if index is None:
+                index = locators.build_index()
+            defined = [
+                file_index(path, source, index)
+                for source in (_read_at(ref, path), _read(path))
+                if source is not None
+            ]
+            if not any(own.ids or own.templates for own in defined):
+                result["unmapped"].append(path)
+                continue
+            for test_id, (found, _) in usage.items():
+                used = set()
+                for own in defined:
+                    used |= _uses(own, found)
+                for element_id in sorted(used):
+                    select(test_id, f"{path} defines {element_id}")
+        elif path.endswith(FRONTEND_EXTENSIONS) and not path.startswith(("tests/", "__tests__/")):
+            result["unmapped"].append(path)
+    return result
+
+
+def select_units(units, ref):
+    """Narrow runner work units to the methods affected since ``ref``"""
+    result = affected(changed_files(ref), ref)
+    print(format_impact(result))
+    if result["run_all"]:
+        return units
+    selected = []
+    for unit in units:
+        methods = [m for m in unit["methods"] if f"{unit['id']}.{m}" in result["tests"]]
+        if methods:
+            selected.append({**unit, "methods": methods})
+    return selected
+
+
+def format_impact(result):
+    lines = []
+    if result["run_all"]:
+        lines.append(f"Running every test: {result['run_all']}")
+    else:
+        lines.append(f"{len(result['tests'])} tests affected by the change:")
+        for test_id, reasons in sorted(result["tests"].items()):
+            shown = ", ".join(reasons[:3]) + (f" (+{len(reasons) - 3} more)" if len(reasons) > 3 else "")
+            lines.append(f"  {test_id}: {shown}")
+    if result["unmapped"]:
+        lines.append("Changed frontend files that define no element ids (not covered by the selection):")
+        lines.extend(f"  {path}" for path in result["unmapped"])
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Usage: python3 -m tests.impact <git ref>")
+        sys.exit(1)
+    print(format_impact(affected(changed_files(sys.argv[1]), sys.argv[1])))
@@ -0,0 +1,478 @@
+"""Check the element ids used by the tests against the ids the frontend defines.
+
+A test that looks up an id the UI no longer renders only fails after a full
+WebDriverWait timeout. This module builds an index of the ids defined in
+components/, pages/ and hooks/ and lists every ``By.ID`` locator under tests/
+(the page objects in tests/pages.py included) that is not in it, so those
+tests can fail in seconds instead. The parallel runner checks the tests it is
+about to run; to check everything by hand:
+
+    python3 -m tests.locators
+
+The index is static, so it understands:
+
+- literal ids: ``id="chatName"``, ``id={'chatName'}``, ``id={cond ? "a" : "b"}``
+- template ids: ``id={`assistantMessage${index}`}`` matches assistantMessage0, ...
+- ids forwarded through a prop or field, like ``id={label}`` in KebabItems:
+  every literal passed as ``label="..."`` (or ``label: '...'``) counts as an id
+
+Ids that are only known at runtime (e.g. built from API data) can be marked
+with a ``# locator: dynamic`` comment on the line that uses them.
+"""
+
+import ast
+import os
+import re
+import sys
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_DIR = os.path.dirname(TESTS_DIR)
+SOURCE_DIRS = ("components", "pages", "hooks")
+SOURCE_EXTENSIONS = (".tsx", ".ts", ".jsx", ".js")
+DYNAMIC_MARKER = "# locator: dynamic"
+PAGES_PATH = os.path.join(TESTS_DIR, "pages.py")
+BASE_TEST_PATH = os.path.join(TESTS_DIR, "base_test.py")
+
+# Helpers that take an element id first, or right after the driver
+# (see tests/waits.py, BaseTest and Page in tests/pages.py)
+ID_HELPERS = {
+    "click",
+    "find_named",
+    "find_all_named",
+    "wait_for",
+    "wait_for_clickable",
+    "wait_for_gone",
+    "wait_for_text",
+    "wait_for_count",
+    "wait_until_stable",
+}
+
+# Where the items BaseTest.seed and seed_dataset write into storage are listed
+SEEDED_IDS = {"conversations": "chatName", "folders": "dropName", "prompts": "promptName"}
+
+_ID_ATTRIBUTE = re.compile(r"""\bid\s*=\s*(?:"([^"]*)"|'([^']*)'|\{)""")
+_STRING = re.compile(r""""([^"\\]*)"|'([^'\\]*)'""")
+_TEMPLATE = re.compile(r"`([^`]*)`")
+_INTERPOLATION = re.compile(r"\$\{(?:[^{}]|\{[^{}]*\})*\}")
+# id={label}, id={item.id}, id={id || label}: the last name is the forwarded field
+_FORWARDED = re.compile(r"^[\w.\s|]*?(\w+)\s*$")
+# ['Group Name', 'Members'].map((title, i) => ...)
+_MAPPED_ARRAY = re.compile(r"\[([^\[\]]*)\]\s*\.map\(\s*\(?\s*(\w+)")
+# const modelActiveCheck = (key: string, ...) => / function modelActiveCheck(key, ...)
+_FUNCTION = re.compile(r"(?:\b(\w+)\s*=\s*(?:async\s*)?\(|\bfunction\s+(\w+)\s*\()\s*(\w+)")
+
+
+def _expression(source, start):
+    """Return the JSX expression starting at ``start`` (just after its opening brace)"""
+    depth = 1
+    end = start
+    while depth and end < len(source):
+        if source[end] == "{":
+            depth += 1
+        elif source[end] == "}":
+            depth -= 1
+        end += 1
+    return source[start:end - 1]
+
+
+class LocatorIndex:
+    """Ids defined by the frontend, and where each one is defined"""
+
+    def __init__(self):
+        self.ids = {}  # id -> first "path:line" defining it
+        self.templates = []  # (compiled pattern, template text, "path:line")
+        self.forwarded = {}  # prop or field name -> "path:line" that renders it as an id
+        self.forwarded_ids = {}  # prop or field name -> literal ids passed through it
+
+    def add_source(self, path, source):
+        location = lambda offset: f"{path}:{source.count(chr(10), 0, offset) + 1}"
+        for match in _ID_ATTRIBUTE.finditer(source):
+            literal = match.group(1) if match.group(1) is not None else match.group(2)
+            if literal is not None:
+                self.ids.setdefault(literal, location(match.start()))
+                continue
+            expression = _expression(source, match.end())
+            if "+" in expression and _STRING.search(expression):
+                # "__idVarFile" + index, "theme" + color
+                self._add_concatenation(expression, location(match.start()))
+                continue
+            for template in _TEMPLATE.findall(expression):
+                self._add_template(template, location(match.start()))
+            for double, single in _STRING.findall(_TEMPLATE.sub("", expression)):
+                self.ids.setdefault(double or single, location(match.start()))
+            forwarded = _FORWARDED.match(expression)
+            if forwarded:
+                self.forwarded.setdefault(forwarded.group(1), location(match.start()))
+
+    def _add_template(self, template, where):
+        parts = _INTERPOLATION.split(template)
+        if len(parts) == 1:
+            self.ids.setdefault(template, where)
+        elif any(parts):
+            # A template that is only interpolations (`${id}`) would match anything
+            pattern = re.compile(".*".join(re.escape(part) for part in parts), re.S)
+            self.templates.append((pattern, template, where))
+
+    def _add_concatenation(self, expression, where):
+        parts = []
+        for piece in expression.split("+"):
+            literal = _STRING.fullmatch(piece.strip())
+            parts.append((literal.group(1) or literal.group(2) or "") if literal else None)
+        template = "".join(part if part is not None else "${}" for part in parts)
+        self._add_template(template, where)
+
+    def add_forwarded_values(self, source):
+        """Index the literals passed to props, fields and parameters rendered as ids"""
+        if not self.forwarded:
+            return
+        names = "|".join(re.escape(name) for name in sorted(self.forwarded))
+        assignment = re.compile(
+            rf"""\b({names})\s*(=\s*\{{?|:\s*)(?:"([^"\\]*)"|'([^'\\]*)')"""
+        )
+        for name, separator, double, single in assignment.findall(source):
+            # key="..." on a JSX element is React's list key, not a prop
+            if name == "key" and separator.startswith("="):
+                continue
+            self._add_forwarded(name, double or single)
+        for items, name in _MAPPED_ARRAY.findall(source):
+            if name in self.forwarded:
+                for double, single in _STRING.findall(items):
+                    self._add_forwarded(name, double or single)
+
+        # Literal first arguments of local functions whose first parameter is an id
+        functions = {
+            arrow or declared: parameter
+            for arrow, declared, parameter in _FUNCTION.findall(source)
+            if parameter in self.forwarded
+        }
+        if functions:
+            names = "|".join(re.escape(name) for name in sorted(functions))
+            call = re.compile(rf"""\b({names})\(\s*(?:"([^"\\]*)"|'([^'\\]*)')""")
+            for function, double, single in call.findall(source):
+                self._add_forwarded(functions[function], double or single)
+
+    def _add_forwarded(self, name, value):
+        self.ids.setdefault(value, "forwarded")
+        self.forwarded_ids.setdefault(name, set()).add(value)
+
+    def defines(self, element_id):
+        if element_id in self.ids:
+            return True
+        return any(pattern.fullmatch(element_id) for pattern, _, _ in self.templates)
+
+    def defines_prefix(self, prefix):
+        """Whether an id starting with ``prefix`` can exist (for f-string locators)"""
+        if any(element_id.startswith(prefix) for element_id in self.ids):
+            return True
+        for _, template, _ in self.templates:
+            head = _INTERPOLATION.split(template)[0]
+            if head.startswith(prefix) or prefix.startswith(head):
+                return True
+        return False
+
+
+def build_index(root=PROJECT_DIR, source_dirs=SOURCE_DIRS):
+    index = LocatorIndex()
+    sources = []
+    for source_dir in source_dirs:
+        for dirpath, dirnames, filenames in os.walk(os.path.join(root, source_dir)):
+            dirnames[:] = sorted(d for d in dirnames if d not in ("node_modules", "__tests__"))
+            for filename in sorted(filenames):
+                if not filename.endswith(SOURCE_EXTENSIONS) or ".test." in filename:
+                    continue
+                path = os.path.join(dirpath, filename)
+                with open(path, encoding="utf-8") as f:
+                    source = f.read()
+                index.add_source(os.path.relpath(path, root), source)
+                sources.append(source)
+    # Second pass, the forwarded names are only known once every file was read
+    for source in sources:
+        index.add_forwarded_values(source)
+    return index
+
+
+# ----------------- Test locators -----------------
+def _is_by_id(node):
+    return isinstance(node, ast.Attribute) and node.attr == "ID"
+
+
+def _is_driver(node):
+    # waits.wait_for(self.driver, "chatName") / waits.wait_for(driver, "chatName")
+    return (isinstance(node, ast.Name) and node.id == "driver") or (
+        isinstance(node, ast.Attribute) and node.attr == "driver"
+    )
+
+
+def _locator_value(node, constants=None):
+    """Return ("id", value) for a string literal, ("prefix", value) for an f-string"""
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return "id", node.value
+    if isinstance(node, ast.JoinedStr):
+        head = node.values[0] if node.values else None
+        if isinstance(head, ast.Constant) and head.value:
+            return "prefix", head.value
+    if (
+        constants
+        and isinstance(node, ast.Attribute)
+        and isinstance(node.value, ast.Name)
+        and node.value.id == "self"
+        and node.attr in constants
+    ):
+        return "id", constants[node.attr]  # self.click(self.ENTRY)
+    return None
+
+
+def _read_module(path):
+    with open(path, encoding="utf-8") as f:
+        source = f.read()
+    return ast.parse(source, filename=path), source.splitlines()
+
+
+def find_locators(path):
+    """Return ``(line, kind, value)`` for every element id the test module uses"""
+    return locators_in(*_read_module(path))
+
+
+def locators_in(tree, lines, constants=None):
+    """Return ``(line, kind, value)`` for every element id looked up inside ``tree``.
+
+    ``constants`` maps class attributes to ids, for ``self.ATTRIBUTE`` locators.
+    """
+    found = []
+    for node in ast.walk(tree):
+        target = None
+        if isinstance(node, ast.Tuple) and len(node.elts) == 2 and _is_by_id(node.elts[0]):
+            target = node.elts[1]  # (By.ID, "chatName")
+        elif isinstance(node, ast.Call) and len(node.args) >= 2 and _is_by_id(node.args[0]):
+            target = node.args[1]  # find_element(By.ID, "chatName")
+        elif (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and node.func.attr in ID_HELPERS
+            and node.args
+        ):
+            # self.wait_for("chatName"), self.click("chatName"), waits.wait_for(self.driver, "chatName")
+            if not _is_driver(node.args[0]):
+                target = node.args[0]
+            elif len(node.args) >= 2:
+                target = node.args[1]
+        value = _locator_value(target, constants) if target is not None else None
+        if value and DYNAMIC_MARKER not in lines[node.lineno - 1]:
+            found.append((node.lineno, *value))
+    return sorted(set(found))
+
+
+# ----------------- Page objects -----------------
+def page_objects(pages_path=PAGES_PATH, base_test_path=BASE_TEST_PATH):
+    """Index the page objects of tests/pages.py.
+
+    Returns a dict with ``locators`` ({page class: locators of its methods,
+    inherited ones included}) and ``properties`` ({BaseTest property: page
+    class}, e.g. left_sidebar -> LeftSidebar).
+    """
+    tree, lines = _read_module(pages_path)
+    classes = {node.name: node for node in tree.body if isinstance(node, ast.ClassDef)}
+
+    def lineage(name):
+        """The class and its base classes defined in pages.py, bases first"""
+        chain = []
+        for base in classes[name].bases:
+            if isinstance(base, ast.Name) and base.id in classes:
+                chain.extend(lineage(base.id))
+        return chain + [classes[name]]
+
+    found = {}
+    for name in classes:
+        chain = lineage(name)
+        # ENTRY = "adminInterface": subclasses fill in ids their base's methods use
+        constants = {}
+        for node in chain:
+            for item in node.body:
+                if (
+                    isinstance(item, ast.Assign)
+                    and len(item.targets) == 1
+                    and isinstance(item.targets[0], ast.Name)
+                    and isinstance(item.value, ast.Constant)
+                    and isinstance(item.value.value, str)
+                ):
+                    constants[item.targets[0].id] = item.value.value
+        found[name] = sorted({loc for node in chain for loc in locators_in(node, lines, constants)})
+
+    properties = {}
+    tree, _ = _read_module(base_test_path)
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.FunctionDef):
+            continue
+        if not any(isinstance(d, ast.Name) and d.id == "property" for d in node.decorator_list):
+            continue
+        for statement in node.body:
+            # return pages.LeftSidebar(self.driver)
+            if (
+                isinstance(statement, ast.Return)
+                and isinstance(statement.value, ast.Call)
+                and isinstance(statement.value.func, ast.Attribute)
+                and isinstance(statement.value.func.value, ast.Name)
+                and statement.value.func.value.id == "pages"
+                and statement.value.func.attr in found
+            ):
+                properties[node.name] = statement.value.func.attr
+    return {"locators": found, "properties": properties}
+
+
+def pages_in(tree, pages):
+    """Return the page classes used inside ``tree``: ``self.left_sidebar``, ``pages.LeftSidebar``, ..."""
+    used = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name):
+            if node.value.id == "self" and node.attr in pages["properties"]:
+                used.add(pages["properties"][node.attr])
+            elif node.value.id == "pages" and node.attr in pages["locators"]:
+                used.add(node.attr)
+        elif isinstance(node, ast.Name) and node.id in pages["locators"]:
+            used.add(node.id)  # from tests.pages import LeftSidebar
+    return used
+
+
+def _page_locators(tree, pages):
+    return [loc for name in sorted(pages_in(tree, pages)) for loc in pages["locators"][name]]
+
+
+def _seeded_locators(tree):
+    """Ids of the items ``self.seed(conversations=...)`` and ``self.seed_dataset(...)`` put on screen"""
+    found = []
+    for node in ast.walk(tree):
+        if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)):
+            continue
+        if node.func.attr == "seed_dataset":
+            kinds = list(SEEDED_IDS)
+        elif node.func.attr == "seed":
+            kinds = list(SEEDED_IDS)[: len(node.args)]
+            kinds += [keyword.arg for keyword in node.keywords if keyword.arg in SEEDED_IDS]
+        else:
+            continue
+        found.extend((node.lineno, "id", SEEDED_IDS[kind]) for kind in kinds)
+    return found
+
+
+# ----------------- Test usage -----------------
+def test_usage(path, pages=None):
+    """Return ``{test_id: (locators, source lines)}`` for every test method in a module.
+
+    Locators in helper methods of the class and in module level functions are
+    counted for every test method, since any of them may call the helper. A
+    page object used by a test (or a helper) adds the locators of its methods,
+    and seeded chats, folders and prompts the ids they are listed under.
+    """
+    pages = pages or page_objects()
+    tree, lines = _read_module(path)
+    module = os.path.relpath(path, PROJECT_DIR)[: -len(".py")].replace(os.sep, ".")
+
+    def span(node):
+        return lines[node.lineno - 1 : node.end_lineno]
+
+    def used_in(node):
+        return locators_in(node, lines) + _page_locators(node, pages) + _seeded_locators(node)
+
+    shared = []
+    shared_lines = []
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            shared.extend(used_in(node))
+            shared_lines.extend(span(node))
+
+    usage = {}
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        functions = [item for item in node.body if isinstance(item, ast.FunctionDef)]
+        helpers = list(shared)
+        helper_lines = list(shared_lines)
+        for item in functions:
+            if not item.name.startswith("test"):
+                helpers.extend(used_in(item))
+                helper_lines.extend(span(item))
+        for item in functions:
+            if item.name.startswith("test"):
+                usage[f"{module}.{node.name}.{item.name}"] = (
+                    used_in(item) + helpers,
+                    span(item) + helper_lines,
+                )
+    return usage
+
+
+def _is_stale(index, kind, value):
+    return not (index.defines(value) if kind == "id" else index.defines_prefix(value))
+
+
+def _shown(kind, value):
+    return value if kind == "id" else f"{value}..."
+
+
+def stale_locators(paths, index=None, pages=None):
+    """Return ``[(path, line, value)]`` for locators no frontend file defines.
+
+    Locators of the page objects the modules use are checked too, and
+    reported at their line in tests/pages.py.
+    """
+    index = index or build_index()
+    pages = pages or page_objects()
+    stale = []
+    used = set()
+    for path in paths:
+        tree, lines = _read_module(path)
+        used |= pages_in(tree, pages)
+        for line, kind, value in locators_in(tree, lines):
+            if _is_stale(index, kind, value):
+                stale.append((os.path.relpath(path, PROJECT_DIR), line, _shown(kind, value)))
+    page_found = sorted({loc for name in used for loc in pages["locators"][name]})
+    for line, kind, value in page_found:
+        if _is_stale(index, kind, value):
+            stale.append((os.path.relpath(PAGES_PATH, PROJECT_DIR), line, _shown(kind, value)))
+    return stale
+
+
+def stale_tests(paths, index=None, pages=None):
+    """Return ``{test id: [stale ids]}`` for every test method that uses a stale locator.
+
+    Ids in setUp, helper methods or module-level functions count for every
+    test of the class or module, like in test_usage.
+    """
+    index = index or build_index()
+    pages = pages or page_objects()
+    found = {}
+    for path in paths:
+        for test_id, (used, _) in test_usage(path, pages).items():
+            ids = {_shown(kind, value) for _, kind, value in used if _is_stale(index, kind, value)}
+            if ids:
+                found[test_id] = sorted(ids)
+    return found
+
+
+def test_modules(root=TESTS_DIR):
+    paths = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith((".", "__")))
+        for filename in sorted(filenames):
+            if filename.startswith("test_") and filename.endswith(".py"):
+                paths.append(os.path.join(dirpath, filename))
+    return paths
+
+
+def format_stale(stale):
+    by_id = {}
+    for path, line, value in stale:
+        by_id.setdefault(value, []).append(f"{path}:{line}")
+    lines = [f"{len(by_id)} element ids used by the tests are not defined in {', '.join(SOURCE_DIRS)}:"]
+    for value, places in sorted(by_id.items()):
+        lines.append(f"  {value!r} ({len(places)} uses)")
+        lines.extend(f"      {place}" for place in places)
+    lines.append(f"Mark ids that only exist at runtime with '{DYNAMIC_MARKER}'.")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    results = stale_locators(sys.argv[1:] or test_modules())
+    if results:
+        print(format_stale(results))
+        sys.exit(1)
+    print("Every element id used by the tests is defined by the frontend.")
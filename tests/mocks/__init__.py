@@ -0,0 +1,69 @@
+"""Local stand-ins for the services the app talks to, so the suite can run offline.
+
+Each mock is a module here with a MockServer subclass (see server.py):
+
+    chat       CHAT_ENDPOINT, streamed scripted replies (chat.py)
+    backend    API_BASE_URL, in-memory conversations, assistants, shares and admin configs (backend.py)
+    cassette   either of them, recorded from the real services and replayed offline (cassette.py)
+    oidc       COGNITO_ISSUER, instant logins for a set of test users (oidc.py)
+    storage    the file service: presigned uploads and a fake document pipeline (storage.py)
+
+Start them for a whole run with the parallel runner, which keeps them up
+until the workers are done:
+
+    python3 -m tests.runner 3 --mocks chat,backend
+
+The Next.js server reads the endpoints from .env.local when it starts, so
+point them at the mocks there (the default ports are in each module). Tests
+reach a running mock through ``control``, e.g. to reset it or to read the
+requests it received:
+
+    mocks.control("chat", "/__mock/reset", {})
+    chats = mocks.control("chat", "/__mock/chats")
+"""
+
+import importlib
+import json
+import os
+import urllib.request
+
+MOCKS = {
+    "chat": ("tests.mocks.chat", "ChatServer"),
+    "backend": ("tests.mocks.backend", "BackendServer"),
+    "cassette": ("tests.mocks.cassette", "CassetteServer"),
+    "oidc": ("tests.mocks.oidc", "OIDCServer"),
+    "storage": ("tests.mocks.storage", "StorageServer"),
+}
+
+
+def server_class(name):
+    if name not in MOCKS:
+        raise ValueError(f"Unknown mock {name!r}, expected one of {sorted(MOCKS)}")
+    module, cls = MOCKS[name]
+    return getattr(importlib.import_module(module), cls)
+
+
+def url(name):
+    """Base URL of the ``name`` mock: AMPLIFY_MOCK_<NAME>_URL, or its default port on localhost"""
+    default = f"http://127.0.0.1:{server_class(name).DEFAULT_PORT}"
+    return os.getenv(f"AMPLIFY_MOCK_{name.upper()}_URL", default)
+
+
+def start(names):
+    """Start the named mocks in background threads, return the running servers"""
+    servers = []
+    for name in names:
+        server = server_class(name)().start()
+        os.environ[f"AMPLIFY_MOCK_{name.upper()}_URL"] = server.url
+        servers.append(server)
+    return servers
+
+
+def control(name, path, data=None, timeout=10):
+    """GET ``path`` on a running mock, or POST ``data`` as JSON when given"""
+    body = None if data is None else json.dumps(data).encode("utf-8")
+    request = urllib.request.Request(
+        url(name) + path, data=body, headers={"Content-Type": "application/json"}
+    )
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return json.loads(response.read() or b"null")
@@ -0,0 +1,466 @@
+"""In-memory stand-in for API_BASE_URL, the backend behind /api/requestOp.
+
+pages/api/requestOp.ts forwards each operation as ``<method> <path><op>``
+with the user's bearer token, and lzwCompress'es the JSON payload of most
+paths. This server decompresses it, keeps every user's data in memory and
+answers with the shapes the services in services/ expect:
+
+    state        /state/conversation/...   cloud conversations (upload, get, get/all, get/multiple, delete)
+                 /state/settings, /state/accounts
+    share        /state/share, /state/share/load, /state/share/delete
+    assistant    /assistant/create, /assistant/list, /assistant/delete
+    admin        /amplifymin/configs, /amplifymin/configs/update, /amplifymin/feature_flags,
+                 /amplifymin/user_app_configs, /available_models
+
+Any other operation answers ``{"success": true, "data": []}`` and is listed
+by GET /__mock/unhandled, so a page that starts calling something new keeps
+loading and the gap is easy to find. Users are told apart by their token
+(the username or email claim of a JWT, otherwise the token itself).
+
+Tests set up and tear down data through the control routes:
+
+    POST /__mock/reset    forget every user's data and restore the default configs
+    POST /__mock/seed     {"user": ..., "conversations": [...], "assistants": [...],
+                           "shares": [...], "featureFlags": {...}, "configs": {...}}
+
+Point the app at it in .env.local and start it with the runner (--mocks backend)
+or on its own:
+
+    API_BASE_URL=http://localhost:8102
+    python3 -m tests.mocks.backend
+"""
+
+import argparse
+import base64
+import copy
+import json
+import re
+import time
+import uuid
+
+from tests.mocks.lzw import is_lzw_compressed, lzw_compress, lzw_uncompress
+from tests.mocks.server import MockServer, json_response
+
+# Same models as the model selector lists in ChatTests/test_ChatHome.py
+MODELS = [
+    ("anthropic.claude-3-haiku-20240307-v1:0", "Claude 3 Haiku", "Bedrock"),
+    ("us.anthropic.claude-3-opus-20240229-v1:0", "Claude 3 Opus", "Bedrock"),
+    ("anthropic.claude-3-sonnet-20240229-v1:0", "Claude 3 Sonnet", "Bedrock"),
+    ("anthropic.claude-3-5-sonnet-20240620-v1:0", "Claude 3.5 Sonnet", "Bedrock"),
+    ("us.anthropic.claude-3-5-sonnet-20241022-v2:0", "Claude 3.5 Sonnet V2", "Bedrock"),
+    ("us.anthropic.claude-3-7-sonnet-20250219-v1:0", "Claude 3.7 Sonnet", "Bedrock"),
+    ("us.deepseek.r1-v1:0", "DeepSeek r1", "Bedrock"),
+    ("gpt-4o", "GPT-4o", "Azure"),
+    ("gpt-4o-mini", "GPT-4o-mini", "Azure"),
+    ("us.meta.llama3-2-90b-instruct-v1:0", "Llama 3.2 90b instruct", "Bedrock"),
+    ("mistral.mistral-7b-instruct-v0:2", "Mistral 7B", "Bedrock"),
+    ("mistral.mistral-large-2402-v1:0", "Mistral Large", "Bedrock"),
+    ("mistral.mixtral-8x7b-instruct-v0:1", "Mixtral 8*7B", "Bedrock"),
+    ("o1-mini", "o1 Mini", "OpenAI"),
+    ("o1-preview", "o1 Preview", "OpenAI"),
+]
+DEFAULT_MODEL = "gpt-4o-mini"
+ADVANCED_MODEL = "gpt-4o"
+CHEAPEST_MODEL = "gpt-4o-mini"
+
+DEFAULT_FEATURE_FLAGS = {
+    "artifacts": True,
+    "uploadDocuments": True,
+    "ragEnabled": True,
+    "storeCloudConversations": True,
+    "highlighter": True,
+    "qiSummary": True,
+    "assistantAdminInterface": True,
+    "createAstAdminGroups": True,
+    "apiKeys": True,
+    "accounts": True,
+    "modelPricing": True,
+    "promptOptimizer": True,
+    "memory": False,
+    "mtdCost": False,
+    "integrations": False,
+    "dataDisclosure": False,
+    "webSearch": False,
+    "mcp": False,
+    "mixPanel": False,
+}
+
+def supported_model(model_id, name, provider):
+    return {
+        "id": model_id,
+        "name": name,
+        "provider": provider,
+        "description": f"{name} served by the mock backend",
+        "inputContextWindow": 128000,
+        "outputTokenLimit": 4096,
+        "inputTokenCost": 0.0025,
+        "outputTokenCost": 0.01,
+        "inputCachedTokenCost": 0,
+        "inputWriteCachedTokenCost": 0,
+        "exclusiveGroupAvailability": [],
+        "supportsImages": False,
+        "supportsReasoning": model_id.startswith("o1"),
+        "supportsSystemPrompts": True,
+        "supportsImageGeneration": False,
+        "supportsVideo": False,
+        "systemPrompt": "",
+        "isAvailable": True,
+        "isBuiltIn": True,
+    }
+
+
+def default_configs():
+    """Admin configurations as /amplifymin/configs returns them, keyed by AdminConfigTypes"""
+    return {
+        "admins": [],
+        "featureFlags": {name: {"enabled": on, "userExceptions": [], "amplifyGroupExceptions": []}
+                         for name, on in DEFAULT_FEATURE_FLAGS.items()},
+        "supportedModels": {model_id: supported_model(model_id, name, provider)
+                            for model_id, name, provider in MODELS},
+        "defaultModels": {"user": DEFAULT_MODEL, "advanced": ADVANCED_MODEL, "cheapest": CHEAPEST_MODEL,
+                          "agent": DEFAULT_MODEL, "documentCaching": CHEAPEST_MODEL, "embeddings": None,
+                          "qa": CHEAPEST_MODEL},
+        "applicationVariables": {},
+        "applicationSecrets": {},
+        "openaiEndpoints": {"models": []},
+        "ops": [],
+        "assistantAdminGroups": [],
+        "powerPointTemplates": [],
+        "amplifyGroups": {},
+        "rateLimit": {"period": "Unlimited", "rate": None},
+        "promtCostAlert": {"isActive": False, "alertMessage": "", "cost": 5},
+        "emailSupport": {"isActive": False, "email": ""},
+        "aiEmailDomain": "",
+        "webSearchConfig": None,
+        "defaultConversationStorage": "future-local",
+        "criticalErrors": {"isActive": False, "email": ""},
+        "userDocumentationUrl": "",
+    }
+
+
+def user_for_token(token):
+    """The user a bearer token belongs to: a JWT's username or email claim, else the token"""
+    parts = (token or "").split(".")
+    if len(parts) == 3:
+        try:
+            claims = json.loads(base64.urlsafe_b64decode(parts[1] + "=" * (-len(parts[1]) % 4)))
+            for claim in ("username", "email", "cognito:username", "sub"):
+                if claims.get(claim):
+                    return claims[claim]
+        except ValueError:
+            pass
+    return token or "anonymous"
+
+
+def operation(handler):
+    """Wrap an operation handler: check the token, decode the payload, encode the result.
+
+    ``handler(user, payload, request)`` gets the payload requestOp sent, with
+    lzwCompress undone, and returns the JSON response.
+    """
+
+    async def run(request):
+        if not request.bearer_token:
+            return json_response({"error": "Unauthorized"}, 401)
+        body = request.json() or {}
+        payload = body.get("data") if isinstance(body, dict) else None
+        if is_lzw_compressed(payload):
+            # Objects are compressed as JSON, long strings as they are
+            text = lzw_uncompress(payload)
+            try:
+                payload = json.loads(text)
+            except ValueError:
+                payload = text
+        user = user_for_token(request.bearer_token)
+        return json_response(handler(user, payload if isinstance(payload, dict) else {}, request))
+
+    return run
+
+
+class BackendServer(MockServer):
+    NAME = "backend"
+    DEFAULT_PORT = 8102
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.reset()
+        self.route("POST", r"/__mock/seed", self._seed)
+        self.route("GET", r"/__mock/unhandled", self._list_unhandled)
+        self.route("GET", r"/__mock/objects/([\w-]+)", self._object)
+        ops = {
+            ("PUT", "/state/conversation/upload"): self.upload_conversation,
+            ("GET", "/state/conversation/get"): self.get_conversation,
+            ("GET", "/state/conversation/get/all"): self.get_all_conversations,
+            ("GET", "/state/conversation/get/empty"): self.get_empty_conversations,
+            ("POST", "/state/conversation/get/multiple"): self.get_multiple_conversations,
+            ("DELETE", "/state/conversation/delete"): self.delete_conversation,
+            ("POST", "/state/conversation/delete_multiple"): self.delete_conversations,
+            ("GET", "/state/settings/get"): self.get_settings,
+            ("POST", "/state/settings/save"): self.save_settings,
+            ("GET", "/state/accounts/get"): self.get_accounts,
+            ("POST", "/state/accounts/save"): self.save_accounts,
+            ("GET", "/state/share"): self.list_shares,
+            ("POST", "/state/share"): self.share,
+            ("POST", "/state/share/load"): self.load_share,
+            ("POST", "/state/share/delete"): self.delete_share,
+            ("POST", "/assistant/create"): self.create_assistant,
+            ("GET", "/assistant/list"): self.list_assistants,
+            ("POST", "/assistant/delete"): self.delete_assistant,
+            ("GET", "/amplifymin/configs"): self.get_configs,
+            ("POST", "/amplifymin/configs/update"): self.update_configs,
+            ("GET", "/amplifymin/feature_flags"): self.feature_flags,
+            ("GET", "/amplifymin/user_app_configs"): self.user_app_configs,
+            ("GET", "/available_models"): self.available_models,
+        }
+        for (method, path), handler in ops.items():
+            self.route(method, re.escape(path), operation(handler))
+        for method in ("GET", "POST", "PUT", "DELETE"):
+            self.route(method, r"/(?!__mock/).*", self._unhandled)
+
+    def reset(self):
+        super().reset()
+        self.users = {}
+        self.shares = []
+        self.objects = {}
+        self.configs = default_configs()
+        self.unhandled = {}
+
+    def user_state(self, user):
+        if user not in self.users:
+            self.users[user] = {
+                "conversations": {},
+                "assistants": [],
+                "settings": None,
+                "accounts": [{"id": "general_account", "name": "General Account", "isDefault": True}],
+            }
+        return self.users[user]
+
+    # ----------------- Requests -----------------
+    async def _unhandled(self, request):
+        key = f"{request.method} {request.path}"
+        self.unhandled[key] = self.unhandled.get(key, 0) + 1
+        return json_response({"success": True, "data": []})
+
+    async def _list_unhandled(self, request):
+        return json_response(self.unhandled)
+
+    def _presigned(self, data):
+        """Store ``data`` for the browser to download like an S3 presigned URL"""
+        key = uuid.uuid4().hex
+        self.objects[key] = data
+        return f"{self.url}/__mock/objects/{key}"
+
+    async def _object(self, request):
+        key = request.match.group(1)
+        if key not in self.objects:
+            return json_response({"error": "NoSuchKey"}, 404)
+        return json_response(self.objects[key])
+
+    # ----------------- Conversations -----------------
+    def upload_conversation(self, user, data, request):
+        self.user_state(user)["conversations"][data["conversationId"]] = {
+            "conversation": data["conversation"],
+            "folder": data.get("folder"),
+            "updated": time.time(),
+        }
+        return {"success": True}
+
+    def get_conversation(self, user, data, request):
+        stored = self.user_state(user)["conversations"].get(request.query.get("conversationId"))
+        if stored is None:
+            return {"success": False, "type": "NoSuchKey", "message": "Conversation not found"}
+        return {"success": True, "conversation": stored["conversation"]}
+
+    def get_all_conversations(self, user, data, request):
+        stored = self.user_state(user)["conversations"].values()
+        if not stored:
+            return {"success": True, "presignedUrls": []}
+        chunk = [
+            {"conversation": json.loads(lzw_uncompress(s["conversation"])), "folder": s["folder"]}
+            for s in stored
+        ]
+        return {"success": True, "presignedUrls": [self._presigned(chunk)]}
+
+    def get_empty_conversations(self, user, data, request):
+        return {
+            "success": True,
+            "presignedUrls": [],
+            "nonEmptyIds": list(self.user_state(user)["conversations"]),
+        }
+
+    def get_multiple_conversations(self, user, data, request):
+        conversations = self.user_state(user)["conversations"]
+        ids = data.get("conversationIds", [])
+        found = [conversations[i]["conversation"] for i in ids if i in conversations]
+        return {
+            "success": True,
+            "presignedUrls": [self._presigned(found)] if found else [],
+            "noSuchKeyConversations": [i for i in ids if i not in conversations],
+            "failed": [],
+        }
+
+    def delete_conversation(self, user, data, request):
+        self.user_state(user)["conversations"].pop(request.query.get("conversationId"), None)
+        return {"success": True}
+
+    def delete_conversations(self, user, data, request):
+        conversations = self.user_state(user)["conversations"]
+        for conversation_id in data.get("conversationIds", []):
+            conversations.pop(conversation_id, None)
+        return {"success": True}
+
+    # ----------------- Settings and accounts -----------------
+    def get_settings(self, user, data, request):
+        return {"success": True, "data": self.user_state(user)["settings"]}
+
+    def save_settings(self, user, data, request):
+        self.user_state(user)["settings"] = data.get("settings")
+        return {"success": True}
+
+    def get_accounts(self, user, data, request):
+        return {"success": True, "data": self.user_state(user)["accounts"]}
+
+    def save_accounts(self, user, data, request):
+        self.user_state(user)["accounts"] = data.get("accounts", [])
+        return {"success": True}
+
+    # ----------------- Sharing -----------------
+    def list_shares(self, user, data, request):
+        items = [
+            {key: share[key] for key in ("sharedBy", "sharedAt", "key", "note")}
+            for share in self.shares
+            if share["sharedBy"] == user or user in share["sharedWith"]
+        ]
+        return {"success": True, "items": items}
+
+    def share(self, user, data, request):
+        self.shares.append({
+            "sharedBy": user,
+            "sharedWith": list(data.get("sharedWith", [])),
+            "sharedAt": int(time.time() * 1000),
+            "key": f"{user}/{uuid.uuid4()}.json",
+            "note": data.get("note", ""),
+            "sharedData": data.get("sharedData"),
+        })
+        return {"success": True, "message": "Shared successfully"}
+
+    def load_share(self, user, data, request):
+        for share in self.shares:
+            if share["key"] == data.get("key") and (share["sharedBy"] == user or user in share["sharedWith"]):
+                return {"success": True, "item": json.dumps(share["sharedData"])}
+        return {"success": False, "message": "Shared item not found"}
+
+    def delete_share(self, user, data, request):
+        # /api/share/delete posts {op, data: ShareItem} directly, not through requestOp
+        for share in self.shares:
+            if share["key"] == data.get("key") and user in share["sharedWith"]:
+                share["sharedWith"].remove(user)
+        return {"success": True}
+
+    # ----------------- Assistants -----------------
+    def create_assistant(self, user, data, request):
+        assistants = self.user_state(user)["assistants"]
+        existing = next((a for a in assistants if data.get("assistantId") and a["assistantId"] == data["assistantId"]), None)
+        assistant = copy.deepcopy(data)
+        assistant["id"] = existing["id"] if existing else f"ast/{uuid.uuid4()}"
+        assistant["assistantId"] = existing["assistantId"] if existing else f"astp/{uuid.uuid4()}"
+        assistant["version"] = existing["version"] + 1 if existing else 1
+        assistant["user"] = user
+        assistant.setdefault("dataSources", [])
+        assistant.setdefault("tags", [])
+        if existing:
+            assistants.remove(existing)
+        assistants.append(assistant)
+        return {
+            "success": True,
+            "message": "Assistant created successfully",
+            "data": {
+                "id": assistant["id"],
+                "assistantId": assistant["assistantId"],
+                "data_sources": assistant["dataSources"],
+                "ast_data": assistant.get("data", {}),
+            },
+        }
+
+    def list_assistants(self, user, data, request):
+        return {"success": True, "data": self.user_state(user)["assistants"]}
+
+    def delete_assistant(self, user, data, request):
+        state = self.user_state(user)
+        before = len(state["assistants"])
+        state["assistants"] = [a for a in state["assistants"] if a["assistantId"] != data.get("assistantId")]
+        if len(state["assistants"]) == before:
+            return {"success": False, "message": "Assistant not found"}
+        return {"success": True, "message": "Assistant deleted successfully"}
+
+    # ----------------- Admin -----------------
+    def get_configs(self, user, data, request):
+        return {"success": True, "data": self.configs}
+
+    def update_configs(self, user, data, request):
+        for config in data.get("configurations", []):
+            self.configs[config["type"]] = config["data"]
+        return {"success": True, "data": {}}
+
+    def feature_flags(self, user, data, request):
+        flags = {}
+        for name, flag in self.configs["featureFlags"].items():
+            # A user exception flips the flag for that user
+            flags[name] = flag.get("enabled", False) != (user in flag.get("userExceptions", []))
+        return {"success": True, "data": flags}
+
+    def user_app_configs(self, user, data, request):
+        keys = ("emailSupport", "aiEmailDomain", "defaultConversationStorage", "promtCostAlert",
+                "webSearchConfig", "userDocumentationUrl", "rateLimit")
+        return {"success": True, "data": {key: self.configs[key] for key in keys if key in self.configs}}
+
+    def available_models(self, user, data, request):
+        supported = self.configs["supportedModels"]
+        models = [m for m in supported.values() if m.get("isAvailable")]
+        defaults = self.configs["defaultModels"]
+        return {
+            "success": True,
+            "data": {
+                "models": models,
+                "default": supported.get(defaults.get("user")),
+                "advanced": supported.get(defaults.get("advanced")),
+                "cheapest": supported.get(defaults.get("cheapest")),
+            },
+        }
+
+    # ----------------- Seeding -----------------
+    async def _seed(self, request):
+        self.seed(**(request.json() or {}))
+        return json_response({"seeded": True})
+
+    def seed(self, user="anonymous", conversations=(), assistants=(), shares=(), featureFlags=None, configs=None):
+        """Add data for ``user``; conversations are plain dicts, stored compressed like the app does"""
+        state = self.user_state(user)
+        for conversation in conversations:
+            state["conversations"][conversation["id"]] = {
+                "conversation": lzw_compress(json.dumps({**conversation, "isLocal": False})),
+                "folder": conversation.get("folder"),
+                "updated": time.time(),
+            }
+        for assistant in assistants:
+            self.create_assistant(user, assistant, None)
+        for share in shares:
+            self.shares.append({
+                "sharedBy": share.get("sharedBy", user),
+                "sharedWith": share.get("sharedWith", [user]),
+                "sharedAt": share.get("sharedAt", int(time.time() * 1000)),
+                "key": share.get("key", f"{user}/{uuid.uuid4()}.json"),
+                "note": share.get("note", ""),
+                "sharedData": share.get("sharedData"),
+            })
+        for name, enabled in (featureFlags or {}).items():
+            self.configs["featureFlags"][name] = {"enabled": enabled, "userExceptions": [], "amplifyGroupExceptions": []}
+        self.configs.update(configs or {})
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve an in-memory backend for API_BASE_URL")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=BackendServer.DEFAULT_PORT)
+    args = parser.parse_args()
+    BackendServer(host=args.host, port=args.port).serve_forever()
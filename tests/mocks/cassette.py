@@ -0,0 +1,393 @@
+"""Record real backend traffic once, replay it offline as cassettes.
+
+The cassette proxy sits where the app expects its backends. In record mode
+it forwards every request to the real service and stores the request and
+response pair; streamed replies (the chat SSE stream) are stored chunk by
+chunk with the time each chunk arrived. In replay mode it answers from the
+cassette without any network, either as fast as possible or with the
+recorded timing:
+
+    python3 -m tests.mocks.cassette record --upstream https://api.example.com/dev \\
+        --upstream /chat=https://chat.example.com/dev/chat --cassette smoke
+    python3 -m tests.mocks.cassette replay --cassette smoke --timing original
+
+``--upstream`` takes ``[prefix=]url``; requests under ``prefix`` go to
+``url`` with the prefix removed, the one without a prefix gets the rest. So
+one proxy serves both backends:
+
+    API_BASE_URL=http://localhost:8103
+    CHAT_ENDPOINT=http://localhost:8103/chat
+
+Requests match on method, path, the user the token belongs to and a
+normalised payload: lzwCompress'ed data is expanded, and uuids, timestamps
+and fields such as requestId are masked, so the ids a test creates on each
+run don't break replay. Identical requests replay their recorded responses
+in order (the last one repeats). Presigned download URLs in responses are
+fetched while recording and served from the cassette.
+
+With the runner (--mocks cassette) the mode comes from the environment:
+AMPLIFY_CASSETTE_MODE, AMPLIFY_CASSETTE_UPSTREAM (comma separated),
+AMPLIFY_CASSETTE (the cassette name) and AMPLIFY_CASSETTE_TIMING.
+Requests a replay could not answer are listed by GET /__mock/misses.
+"""
+
+import argparse
+import asyncio
+import base64
+import hashlib
+import http.client
+import json
+import os
+import re
+import time
+from urllib.parse import urlencode, urlsplit
+
+from tests.mocks.backend import user_for_token
+from tests.mocks.lzw import is_lzw_compressed, lzw_uncompress
+from tests.mocks.server import MockServer, Response, StreamResponse, json_response
+
+CASSETTE_DIR = os.getenv(
+    "AMPLIFY_CASSETTE_DIR", os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cassettes")
+)
+
+# Bump when the stored format changes; older cassettes have to be recorded again
+FORMAT_VERSION = 1
+
+MODES = ("record", "replay")
+TIMINGS = ("fast", "original")
+
+# Headers passed on to the real service
+_FORWARDED_HEADERS = ("authorization", "content-type", "accept")
+
+# Fields whose value changes on every run whatever the test does
+VOLATILE_KEYS = {
+    "requestId", "time", "timeZone", "date", "timestamp", "createdAt", "updatedAt", "sharedAt", "pollRequestId",
+}
+_UUID = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", re.I)
+_ISO_TIME = re.compile(r"\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}(:\d{2}(\.\d+)?)?(Z|[+-]\d{2}:?\d{2})?")
+_EPOCH = re.compile(r"\b1\d{9}(\d{3})?\b")
+
+# Stands in for the proxy's own URL in stored responses
+_SELF = "{{cassette}}"
+
+
+def normalize(value):
+    """``value`` with lzw payloads expanded and run-specific ids and times masked"""
+    if is_lzw_compressed(value):
+        text = lzw_uncompress(value)
+        try:
+            return normalize(json.loads(text))
+        except ValueError:
+            return normalize(text)
+    if isinstance(value, dict):
+        return {k: "<volatile>" if k in VOLATILE_KEYS else normalize(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [normalize(v) for v in value]
+    if isinstance(value, str):
+        value = _UUID.sub("<uuid>", value)
+        value = _ISO_TIME.sub("<time>", value)
+        return _EPOCH.sub("<time>", value)
+    if isinstance(value, int) and not isinstance(value, bool) and value > 10 ** 9:
+        return "<time>"
+    return value
+
+
+def request_key(request):
+    """What a recorded request and a replayed one have to share to match"""
+    try:
+        payload = request.json()
+    except ValueError:
+        payload = request.body.decode("utf-8", "replace")
+    described = {
+        "method": request.method,
+        "path": normalize(request.path),
+        "query": normalize(request.query),
+        "user": user_for_token(request.bearer_token),
+        "payload": normalize(payload),
+    }
+    text = json.dumps(described, sort_keys=True)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:24], described
+
+
+def cassette_path(name):
+    return os.path.join(CASSETTE_DIR, f"{name}.json")
+
+
+def parse_upstreams(values):
+    """``["/chat=https://...", "https://..."]`` as (prefix, url) pairs, longest prefix first"""
+    upstreams = []
+    for value in values:
+        prefix, _, url = value.partition("=") if "=" in value.split("://")[0] else ("", "", value)
+        upstreams.append((prefix.rstrip("/"), url.rstrip("/")))
+    return sorted(upstreams, key=lambda upstream: len(upstream[0]), reverse=True)
+
+
+def _encode_body(data):
+    try:
+        return {"body": data.decode("utf-8")}
+    except UnicodeDecodeError:
+        return {"base64": base64.b64encode(data).decode("ascii")}
+
+
+def _decode_body(stored):
+    if "base64" in stored:
+        return base64.b64decode(stored["base64"])
+    return stored["body"].encode("utf-8")
+
+
+def _fetch(url, method="GET", headers=None, body=None, on_chunk=None):
+    """Blocking request to the real service; each chunk goes to ``on_chunk`` as it arrives"""
+    parts = urlsplit(url)
+    connection_class = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+    connection = connection_class(parts.netloc, timeout=300)
+    target = parts.path + (f"?{parts.query}" if parts.query else "")
+    try:
+        connection.request(method, target or "/", body=body or None, headers=headers or {})
+        response = connection.getresponse()
+        head = (response.status, {k.lower(): v for k, v in response.getheaders()})
+        if on_chunk:
+            on_chunk(head)
+        chunks = []
+        while True:
+            chunk = response.read1(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            if on_chunk:
+                on_chunk(chunk)
+        return head, b"".join(chunks)
+    finally:
+        connection.close()
+
+
+class CassetteServer(MockServer):
+    NAME = "cassette"
+    DEFAULT_PORT = 8103
+
+    def __init__(self, mode=None, cassette=None, upstreams=None, timing=None, **kwargs):
+        super().__init__(**kwargs)
+        self.mode = mode or os.getenv("AMPLIFY_CASSETTE_MODE", "replay")
+        self.timing = timing or os.getenv("AMPLIFY_CASSETTE_TIMING", "fast")
+        self.name = cassette or os.getenv("AMPLIFY_CASSETTE", "default")
+        if upstreams is None:
+            upstreams = [u for u in os.getenv("AMPLIFY_CASSETTE_UPSTREAM", "").split(",") if u.strip()]
+        self.upstreams = parse_upstreams(upstreams)
+        if self.mode not in MODES:
+            raise ValueError(f"Unknown cassette mode {self.mode!r}, expected one of {MODES}")
+        if self.timing not in TIMINGS:
+            raise ValueError(f"Unknown cassette timing {self.timing!r}, expected one of {TIMINGS}")
+        if self.mode == "record" and not self.upstreams:
+            raise ValueError("Recording needs at least one upstream (--upstream or AMPLIFY_CASSETTE_UPSTREAM)")
+
+        self.interactions = {}  # request key -> recorded responses in order
+        self.objects = {}  # presigned downloads, by content hash
+        self.played = {}
+        self.misses = []
+        if self.mode == "replay":
+            self.load()
+        self.route("POST", r"/__mock/save", self._save)
+        self.route("GET", r"/__mock/misses", self._list_misses)
+        self.route("GET", r"/__mock/objects/(\w+)", self._object)
+        for method in ("GET", "POST", "PUT", "DELETE", "PATCH"):
+            self.route(method, r"/(?!__mock/).*", self.handle)
+
+    def reset(self):
+        """Rewind the replay; recorded interactions are kept until saved"""
+        super().reset()
+        self.played = {}
+        self.misses = []
+
+    # ----------------- Cassette files -----------------
+    def load(self):
+        path = cassette_path(self.name)
+        try:
+            with open(path, encoding="utf-8") as f:
+                cassette = json.load(f)
+        except OSError:
+            raise RuntimeError(f"No cassette at {path}, record one first") from None
+        if cassette.get("version") != FORMAT_VERSION:
+            raise RuntimeError(f"{path} was recorded with an older format, record it again")
+        for interaction in cassette["interactions"]:
+            self.interactions.setdefault(interaction["key"], []).append(interaction)
+        self.objects = cassette.get("objects", {})
+        print(f"Loaded {len(cassette['interactions'])} interactions from {path}")
+
+    def save(self):
+        if self.mode != "record":
+            return
+        os.makedirs(CASSETTE_DIR, exist_ok=True)
+        path = cassette_path(self.name)
+        cassette = {
+            "version": FORMAT_VERSION,
+            "recorded_at": time.time(),
+            "upstreams": [url for _, url in self.upstreams],
+            "interactions": [i for recorded in self.interactions.values() for i in recorded],
+            "objects": self.objects,
+        }
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, "w", encoding="utf-8") as f:
+            json.dump(cassette, f)
+        os.replace(temporary, path)
+        print(f"Saved {len(cassette['interactions'])} interactions to {path}")
+
+    def stop(self):
+        super().stop()
+        self.save()
+
+    def serve_forever(self):
+        try:
+            super().serve_forever()
+        finally:
+            self.save()
+
+    # ----------------- Control routes -----------------
+    async def _save(self, request):
+        self.save()
+        return json_response({"saved": sum(len(i) for i in self.interactions.values())})
+
+    async def _list_misses(self, request):
+        return json_response(self.misses)
+
+    async def _object(self, request):
+        stored = self.objects.get(request.match.group(1))
+        if stored is None:
+            return json_response({"error": "NoSuchKey"}, 404)
+        return Response(_decode_body(stored), headers={"Content-Type": stored.get("type", "application/json")})
+
+    # ----------------- Proxy -----------------
+    async def handle(self, request):
+        key, described = request_key(request)
+        if self.mode == "record":
+            return await self.record(request, key, described)
+        return await self.replay(request, key, described)
+
+    def upstream_url(self, request):
+        for prefix, url in self.upstreams:
+            if request.path == prefix or request.path.startswith(prefix + "/") or not prefix:
+                path = request.path[len(prefix):]
+                query = f"?{urlencode(request.query)}" if request.query else ""
+                return url + path + query
+        raise ValueError(f"No upstream for {request.path}")
+
+    async def record(self, request, key, described):
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue()
+        headers = {name: request.headers[name] for name in _FORWARDED_HEADERS if name in request.headers}
+        started = time.monotonic()
+
+        def forward():
+            try:
+                _fetch(
+                    self.upstream_url(request), request.method, headers, request.body,
+                    lambda item: loop.call_soon_threadsafe(queue.put_nowait, (time.monotonic() - started, item)),
+                )
+            except Exception as e:
+                loop.call_soon_threadsafe(queue.put_nowait, (time.monotonic() - started, e))
+            loop.call_soon_threadsafe(queue.put_nowait, (time.monotonic() - started, None))
+
+        loop.run_in_executor(None, forward)
+        _, head = await queue.get()
+        if isinstance(head, Exception):
+            raise head
+        status, response_headers = head
+        content_type = response_headers.get("content-type", "application/json")
+        interaction = {
+            "key": key,
+            "request": described,
+            "status": status,
+            "type": content_type,
+            "first_byte": time.monotonic() - started,
+        }
+        self.interactions.setdefault(key, []).append(interaction)
+
+        if "text/event-stream" in content_type:
+            interaction["chunks"] = []
+
+            async def relay():
+                while True:
+                    offset, chunk = await queue.get()
+                    if chunk is None or isinstance(chunk, Exception):
+                        return
+                    interaction["chunks"].append([round(offset, 4), chunk.decode("utf-8", "replace")])
+                    yield chunk
+
+            return StreamResponse(relay(), status, {"Content-Type": content_type})
+
+        body = b""
+        while True:
+            offset, chunk = await queue.get()
+            if chunk is None:
+                break
+            if isinstance(chunk, Exception):
+                raise chunk
+            body += chunk
+        interaction["elapsed"] = round(offset, 4)
+        if "json" in content_type:
+            body = await loop.run_in_executor(None, self.capture_downloads, body)
+        interaction.update(_encode_body(body))
+        return Response(body.replace(_SELF.encode(), self.url.encode()), status, {"Content-Type": content_type})
+
+    def capture_downloads(self, body):
+        """Fetch the presigned URLs in a JSON response into the cassette, point the response at them"""
+        try:
+            data = json.loads(body)
+        except ValueError:
+            return body
+        urls = data.get("presignedUrls") if isinstance(data, dict) else None
+        if not isinstance(urls, list):
+            return body
+        for index, url in enumerate(urls):
+            (status, headers), content = _fetch(url)
+            if status != 200:
+                continue
+            name = hashlib.sha256(content).hexdigest()[:24]
+            self.objects[name] = {**_encode_body(content), "type": headers.get("content-type", "application/json")}
+            urls[index] = f"{_SELF}/__mock/objects/{name}"
+        return json.dumps(data).encode("utf-8")
+
+    async def replay(self, request, key, described):
+        recorded = self.interactions.get(key)
+        if not recorded:
+            self.misses.append(described)
+            print(f"[cassette] No recording for {request.method} {request.path}")
+            return json_response({"error": f"No recording in cassette {self.name!r} for {request.path}"}, 404)
+        index = self.played.get(key, 0)
+        self.played[key] = index + 1
+        interaction = recorded[min(index, len(recorded) - 1)]
+
+        headers = {"Content-Type": interaction["type"]}
+        if "chunks" in interaction:
+            return StreamResponse(self.replay_chunks(interaction), interaction["status"], headers)
+        if self.timing == "original":
+            await asyncio.sleep(interaction.get("elapsed", 0))
+        body = _decode_body(interaction).replace(_SELF.encode(), self.url.encode())
+        return Response(body, interaction["status"], headers)
+
+    async def replay_chunks(self, interaction):
+        previous = 0
+        if self.timing == "original":
+            await asyncio.sleep(interaction.get("first_byte", 0))
+            previous = interaction.get("first_byte", 0)
+        for offset, chunk in interaction["chunks"]:
+            if self.timing == "original":
+                await asyncio.sleep(max(0, offset - previous))
+                previous = offset
+            yield chunk
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Record backend traffic into a cassette, or replay one offline")
+    parser.add_argument("mode", choices=MODES)
+    parser.add_argument("--cassette", default="default", help="Cassette name, stored in tests/.cassettes")
+    parser.add_argument(
+        "--upstream", action="append", default=[],
+        help="[prefix=]url of a real service to record, e.g. /chat=https://.../chat (repeatable)",
+    )
+    parser.add_argument("--timing", choices=TIMINGS, default="fast", help="Replay speed")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=CassetteServer.DEFAULT_PORT)
+    args = parser.parse_args()
+    CassetteServer(
+        mode=args.mode, cassette=args.cassette, upstreams=args.upstream, timing=args.timing,
+        host=args.host, port=args.port,
+    ).serve_forever()
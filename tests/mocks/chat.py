@@ -0,0 +1,198 @@
+"""Stand-in for CHAT_ENDPOINT that streams scripted replies.
+
+services/chatService.ts POSTs the chat body to CHAT_ENDPOINT and parses the
+reply as server-sent events, one ``data: {"s": "0", "d": "<text>"}`` event
+per token; the reply ends when the stream closes. A body holding
+``{"killSwitch": {"requestId": ..., "value": true}}`` (killRequest, the Stop
+Generating button) stops the stream with that request id.
+
+Replies are deterministic. The newest user message picks a script:
+
+    mermaid / diagram / flowchart    a ```mermaid graph
+    artifact / html page             a ```html page (also every artifactsMode request)
+    csv / extract ... columns        a ```csv block with the requested columns
+    mock error                       a 500 with an error the app shows the user
+    anything else                    sentences seeded by the message text
+
+Tests can add their own replies, from the same process or over HTTP:
+
+    chat_mock.script(r"Pikachu", "Pika pika!")
+    POST /__mock/scripts {"pattern": "Pikachu", "reply": "Pika pika!"}
+
+Point the app at it in .env.local and start it with the runner (--mocks chat)
+or on its own:
+
+    CHAT_ENDPOINT=http://localhost:8101/chat
+    python3 -m tests.mocks.chat --tokens-per-second 100
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import re
+
+from tests.datasets import TextGenerator
+from tests.mocks.server import MockServer, StreamResponse, json_response
+
+DEFAULT_TOKENS_PER_SECOND = 200
+
+# The system prompt AutoArtifactBlock sends when it turns a reply into an artifact
+_ARTIFACT_PROMPT = "Follow these structural guidelines strictly"
+
+# Runs of non-space characters with the whitespace after them, so replies stream like an LLM's
+_TOKEN = re.compile(r"\S+\s*|\s+")
+
+
+def _content(message):
+    content = message.get("content", "")
+    if isinstance(content, str):
+        return content
+    # Multimodal messages hold a list of parts
+    return " ".join(part.get("text", "") for part in content if isinstance(part, dict))
+
+
+def _seeded(text):
+    return TextGenerator(int(hashlib.sha256(text.encode("utf-8")).hexdigest()[:8], 16))
+
+
+# ----------------- Scripts -----------------
+def mermaid_reply(text, body):
+    gen = _seeded(text)
+    steps = [gen.words(2).title() for _ in range(4)]
+    edges = "\n".join(f"    S{i}[{steps[i]}] --> S{i + 1}[{steps[i + 1]}]" for i in range(3))
+    return f"Here is the diagram you asked for:\n\n```mermaid\ngraph TD\n{edges}\n```\n"
+
+
+def artifact_reply(text, body):
+    gen = _seeded(text)
+    title = gen.title(1)
+    page = (
+        "```html\n<!-- index.html -->\n<html>\n  <body>\n"
+        f"    <h1>{title}</h1>\n    <p>{gen.text(120)}</p>\n"
+        "  </body>\n</html>\n```\n"
+    )
+    if body.get("options", {}).get("artifactsMode"):
+        return page + "<> The page is ready in the artifact viewer. </>"
+    return f"Here is a page for {title}:\n\n{page}"
+
+
+def csv_reply(text, body):
+    gen = _seeded(text)
+    requested = re.search(r"Extract the following columns:\s*\n(.+?)(?:\n-{3,}|$)", text, re.S)
+    if requested:
+        columns = [c.strip() for c in re.split(r"[,\n]", requested.group(1)) if c.strip()]
+    else:
+        columns = ["name", "category", "amount"]
+    rows = [",".join(gen.words(1) for _ in columns) for _ in range(5)]
+    return "Extracted Data:\n\n```csv\n" + "\n".join([",".join(columns)] + rows) + "\n```\n"
+
+
+def default_reply(text, body):
+    return _seeded(text).text(300)
+
+
+SCRIPTS = [
+    (re.compile(r"\b(mermaid|diagram|flowchart)\b", re.I), mermaid_reply),
+    (re.compile(r"\b(artifact|html page)\b", re.I), artifact_reply),
+    (re.compile(r"\bcsv\b|Extract the following columns", re.I), csv_reply),
+]
+
+
+class ChatServer(MockServer):
+    NAME = "chat"
+    DEFAULT_PORT = 8101
+
+    def __init__(self, tokens_per_second=DEFAULT_TOKENS_PER_SECOND, first_token_delay=0.05, **kwargs):
+        super().__init__(**kwargs)
+        self.tokens_per_second = tokens_per_second
+        self.first_token_delay = first_token_delay
+        self.custom_scripts = []
+        self.killed = set()
+        self.chats = []
+        self.route("POST", r"/__mock/scripts", self._add_script)
+        self.route("GET", r"/__mock/chats", self._list_chats)
+        self.route("POST", r"/(?!__mock/).*", self.chat)
+
+    def reset(self):
+        super().reset()
+        self.custom_scripts.clear()
+        self.killed.clear()
+        self.chats.clear()
+
+    def script(self, pattern, reply):
+        """Answer user messages matching ``pattern`` with ``reply`` (checked before the built-in scripts)"""
+        self.custom_scripts.append((re.compile(pattern, re.I), reply))
+
+    def reply_for(self, body):
+        messages = body.get("messages") or []
+        system = next((_content(m) for m in messages if m.get("role") == "system"), "")
+        text = next((_content(m) for m in reversed(messages) if m.get("role") == "user"), "")
+        for pattern, reply in self.custom_scripts:
+            if pattern.search(text):
+                return reply
+        if _ARTIFACT_PROMPT in system or body.get("options", {}).get("artifactsMode"):
+            return artifact_reply(text, body)
+        for pattern, build in SCRIPTS:
+            if pattern.search(text):
+                return build(text, body)
+        return default_reply(text, body)
+
+    # ----------------- Routes -----------------
+    async def _add_script(self, request):
+        data = request.json()
+        self.script(data["pattern"], data["reply"])
+        return json_response({"scripts": len(self.custom_scripts)})
+
+    async def _list_chats(self, request):
+        return json_response(self.chats)
+
+    async def chat(self, request):
+        if not request.bearer_token:
+            return json_response({"error": "Unauthorized"}, 401)
+        body = request.json() or {}
+
+        kill = body.get("killSwitch")
+        if kill:
+            if kill.get("value"):
+                self.killed.add(kill.get("requestId"))
+            return json_response({"success": True})
+
+        request_id = body.get("options", {}).get("requestId")
+        messages = body.get("messages") or []
+        last = _content(messages[-1]) if messages else ""
+        self.chats.append({
+            "requestId": request_id,
+            "model": body.get("model"),
+            "message": last,
+            "dataSources": [s.get("id") for s in body.get("dataSources") or []],
+        })
+        if re.search(r"\bmock error\b", last, re.I):
+            return json_response({"error": "The mock chat backend was asked to fail."}, 500)
+
+        reply = self.reply_for(body)
+        # The whole reply, to compare with what the UI kept of a cut off stream
+        self.chats[-1]["reply"] = reply
+        return StreamResponse(
+            self.stream(reply, request_id),
+            headers={"Content-Type": "text/event-stream", "Connection": "keep-alive"},
+        )
+
+    async def stream(self, reply, request_id):
+        """Yield ``reply`` as one SSE event per token, stopping early if the request is killed"""
+        await asyncio.sleep(self.first_token_delay)
+        delay = 1 / self.tokens_per_second if self.tokens_per_second else 0
+        for token in _TOKEN.findall(reply):
+            if request_id in self.killed:
+                return
+            yield f"data: {json.dumps({'s': '0', 'd': token})}\n\n"
+            await asyncio.sleep(delay)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve scripted chat replies for CHAT_ENDPOINT")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=ChatServer.DEFAULT_PORT)
+    parser.add_argument("--tokens-per-second", type=float, default=DEFAULT_TOKENS_PER_SECOND)
+    args = parser.parse_args()
+    ChatServer(tokens_per_second=args.tokens_per_second, host=args.host, port=args.port).serve_forever()
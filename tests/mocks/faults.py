@@ -0,0 +1,136 @@
+"""Latency and fault injection profiles for the mock servers.
+
+A profile is a list of rules. A request uses the first rule whose ``route``
+(a regex matched against the start of the path) and optional ``method``
+match it; requests without a rule are served normally. Every field is
+optional:
+
+    latency       delay before the handler runs, in ms: a number, or
+                  {"distribution": "fixed" | "uniform" | "normal" | "lognormal" | "exponential",
+                   "ms": ..., "min_ms": ..., "max_ms": ..., "stddev_ms": ..., "sigma": ...}
+    error_rate    share of requests answered with ``error_status`` (default 500) instead
+    bandwidth     response bytes per second
+    chunk_size    bytes per write; streams are re-chunked, so events can split across writes
+    chunk_delay   ms to wait before each written chunk
+    drop_rate     share of responses whose connection is cut part way through
+    drop_after    how far in that happens: bytes (an int) or a share of a plain body (a float below 1)
+
+For example, a slow state service and a chat stream that stalls and then
+disconnects half way:
+
+    [{"route": "/state/", "latency": 2000},
+     {"route": "/chat", "chunk_delay": 50, "drop_rate": 1, "drop_after": 800}]
+
+Named profiles are in PROFILES. A mock takes its profile from its
+constructor, from AMPLIFY_MOCK_PROFILE (a name, a JSON file or inline
+JSON) or at run time from POST /__mock/profile:
+
+    mocks.control("chat", "/__mock/profile", {"profile": "dropped-stream"})
+    mocks.control("backend", "/__mock/profile", {"rules": [{"route": "/state/", "latency": 2000}]})
+
+AMPLIFY_MOCK_SEED seeds the random draws so a profile behaves the same on
+every run.
+"""
+
+import json
+import os
+import random
+import re
+
+PROFILES = {
+    "none": [],
+    "slow-state": [
+        {"route": "/state/", "latency": 2000},
+    ],
+    "jittery-backend": [
+        {"route": "/(?!chat)", "latency": {"distribution": "lognormal", "ms": 300, "sigma": 0.8}},
+    ],
+    "flaky-backend": [
+        {"route": "/(?!chat)", "latency": {"distribution": "uniform", "min_ms": 50, "max_ms": 500}, "error_rate": 0.2},
+    ],
+    "slow-chat": [
+        {"route": "/chat", "latency": 1500, "chunk_delay": 50},
+    ],
+    "dropped-stream": [
+        {"route": "/chat", "chunk_delay": 50, "drop_rate": 1, "drop_after": 800},
+    ],
+    "narrow-link": [
+        {"route": "/", "bandwidth": 64 * 1024, "chunk_size": 1024},
+    ],
+    "chat-errors": [
+        {"route": "/chat", "error_rate": 1, "error_status": 502},
+    ],
+}
+
+
+def load_profile(spec):
+    """Rules for ``spec``: a PROFILES name, a JSON file, inline JSON or a list of rules"""
+    if not spec:
+        return []
+    if isinstance(spec, list):
+        return spec
+    if spec in PROFILES:
+        return PROFILES[spec]
+    if os.path.isfile(spec):
+        with open(spec, encoding="utf-8") as f:
+            return json.load(f)
+    try:
+        rules = json.loads(spec)
+    except ValueError:
+        raise ValueError(f"Unknown fault profile {spec!r}, expected one of {sorted(PROFILES)} or JSON") from None
+    return rules if isinstance(rules, list) else [rules]
+
+
+class Faults:
+    """The rules of one profile and the random draws they need"""
+
+    def __init__(self, rules=(), seed=None):
+        self.rules = [(re.compile(rule.get("route", "/")), rule) for rule in rules]
+        if seed is None:
+            seed = int(os.getenv("AMPLIFY_MOCK_SEED", "0"))
+        self.random = random.Random(seed)
+
+    def rule_for(self, method, path):
+        for pattern, rule in self.rules:
+            if pattern.match(path) and rule.get("method", method) == method:
+                return rule
+        return None
+
+    def latency(self, rule):
+        """Seconds to wait before handling a request under ``rule``"""
+        latency = rule.get("latency")
+        if latency is None:
+            return 0
+        if isinstance(latency, (int, float)):
+            return latency / 1000
+        distribution = latency.get("distribution", "fixed")
+        ms = latency.get("ms", 0)
+        if distribution == "fixed":
+            value = ms
+        elif distribution == "uniform":
+            value = self.random.uniform(latency.get("min_ms", 0), latency.get("max_ms", ms))
+        elif distribution == "normal":
+            value = self.random.gauss(ms, latency.get("stddev_ms", ms / 4))
+        elif distribution == "lognormal":
+            # ``ms`` is the median
+            value = self.random.lognormvariate(0, latency.get("sigma", 0.5)) * ms
+        elif distribution == "exponential":
+            value = self.random.expovariate(1 / ms) if ms else 0
+        else:
+            raise ValueError(f"Unknown latency distribution {distribution!r}")
+        if "max_ms" in latency and distribution != "uniform":
+            value = min(value, latency["max_ms"])
+        return max(0, value) / 1000
+
+    def fails(self, rule):
+        return self.random.random() < rule.get("error_rate", 0)
+
+    def drop_point(self, rule, size=None):
+        """Bytes to send before cutting the connection, or None to send everything"""
+        if not rule.get("drop_rate") or self.random.random() >= rule["drop_rate"]:
+            return None
+        after = rule.get("drop_after", 0.5)
+        if isinstance(after, float) and after < 1:
+            # A share of the body; streams have no known size, so cut them after the first chunk
+            return int(size * after) if size is not None else 1
+        return int(after)
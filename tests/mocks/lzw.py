@@ -0,0 +1,63 @@
+"""Python port of utils/app/lzwCompression.ts.
+
+requestOp compresses most payloads before they reach the backend, and the
+app stores cloud conversations compressed, so the mocks need to read and
+write the same format. Like the TypeScript version this works on UTF-16
+code units and writes the ones above 255 as ``U+<hex>``.
+"""
+
+import re
+
+_UNICODE = re.compile(r"U\+([0-9a-f]{4})", re.I)
+
+
+def _code_units(text):
+    data = text.encode("utf-16-le", "surrogatepass")
+    return [int.from_bytes(data[i:i + 2], "little") for i in range(0, len(data), 2)]
+
+
+def lzw_compress(text):
+    if not text:
+        return []
+    processed = "".join(chr(unit) if unit <= 255 else f"U+{unit:x}" for unit in _code_units(text))
+    dictionary = {chr(i): i for i in range(256)}
+    output = []
+    current = ""
+    for character in processed:
+        pattern = current + character
+        if pattern in dictionary:
+            current = pattern
+        else:
+            output.append(dictionary[current])
+            dictionary[pattern] = len(dictionary)
+            current = character
+    if current:
+        output.append(dictionary[current])
+    return output
+
+
+def lzw_uncompress(codes):
+    if not codes:
+        return ""
+    dictionary = {i: chr(i) for i in range(256)}
+    previous = dictionary.get(codes[0])
+    if previous is None:
+        return ""
+    parts = [previous]
+    for code in codes[1:]:
+        if code in dictionary:
+            entry = dictionary[code]
+        elif code == len(dictionary):
+            entry = previous + previous[0]
+        else:
+            raise ValueError("Invalid compressed data: Entry for code not found")
+        parts.append(entry)
+        dictionary[len(dictionary)] = previous + entry[0]
+        previous = entry
+    text = _UNICODE.sub(lambda m: chr(int(m.group(1), 16)), "".join(parts))
+    # Surrogate pairs come back as two characters, join them into one
+    return text.encode("utf-16-le", "surrogatepass").decode("utf-16-le", "replace")
+
+
+def is_lzw_compressed(data):
+    return isinstance(data, list) and bool(data) and all(isinstance(item, int) for item in data)
@@ -0,0 +1,303 @@
+"""Local OpenID Connect provider for NextAuth, with instant logins for test users.
+
+pages/api/auth/[...nextauth].js signs in through the Cognito provider, which
+only needs an issuer with the standard discovery document. Point it here in
+.env.local and the login button leads to a page with one button per test
+user instead of the real identity provider:
+
+    COGNITO_ISSUER=http://localhost:8104
+    COGNITO_DOMAIN=http://localhost:8104
+    COGNITO_CLIENT_ID=amplify-tests
+    COGNITO_CLIENT_SECRET=amplify-tests
+
+The users come from AMPLIFY_OIDC_USERS (comma separated emails), by default
+tester0@amplify.test ... tester7@amplify.test. The parallel runner gives
+every worker its own user (worker_user) when it runs --mocks oidc, so
+workers never share conversations or settings; BaseTest.login clicks that
+user's button. Access tokens are JWTs whose ``username`` claim is the
+user's email, which is how the backend mock tells users apart.
+
+Tokens are signed RS256 with a key generated when the server starts (pure
+Python, a second or two), and published at /jwks. Client ids and secrets are
+not checked.
+
+    python3 -m tests.mocks.oidc
+"""
+
+import argparse
+import base64
+import hashlib
+import html
+import json
+import os
+import secrets
+import time
+import uuid
+from urllib.parse import parse_qsl, urlencode
+
+from tests.mocks.server import MockServer, Response, json_response
+
+DEFAULT_USER_COUNT = 8
+TOKEN_LIFETIME = 3600
+
+# SHA-256 DigestInfo prefix for PKCS#1 v1.5 signatures
+_SHA256_PREFIX = bytes.fromhex("3031300d060960864801650304020105000420")
+
+
+def users():
+    """The emails that can log in, from AMPLIFY_OIDC_USERS or the numbered defaults"""
+    configured = [u.strip() for u in os.getenv("AMPLIFY_OIDC_USERS", "").split(",") if u.strip()]
+    return configured or [f"tester{i}@amplify.test" for i in range(DEFAULT_USER_COUNT)]
+
+
+def worker_user(worker):
+    """The user parallel worker ``worker`` logs in as"""
+    configured = users()
+    return configured[int(worker) % len(configured)]
+
+
+# ----------------- Signing -----------------
+def _b64url(data):
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _int_b64url(value):
+    return _b64url(value.to_bytes((value.bit_length() + 7) // 8, "big"))
+
+
+def _probable_prime(n, rounds=40):
+    for p in (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37):
+        if n % p == 0:
+            return n == p
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for _ in range(rounds):
+        x = pow(secrets.randbelow(n - 3) + 2, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = pow(x, 2, n)
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _prime(bits, e):
+    while True:
+        # Top two bits set so the product has exactly 2 * bits bits
+        candidate = secrets.randbits(bits) | (3 << bits - 2) | 1
+        if _probable_prime(candidate) and (candidate - 1) % e:
+            return candidate
+
+
+class SigningKey:
+    """An RSA key for RS256, generated without third-party packages"""
+
+    def __init__(self, bits=2048, e=65537):
+        while True:
+            p, q = _prime(bits // 2, e), _prime(bits // 2, e)
+            if p != q:
+                break
+        self.n = p * q
+        self.e = e
+        self.d = pow(e, -1, (p - 1) * (q - 1))
+        self.size = (self.n.bit_length() + 7) // 8
+        self.kid = hashlib.sha256(str(self.n).encode("ascii")).hexdigest()[:16]
+
+    def jwk(self):
+        return {"kty": "RSA", "use": "sig", "alg": "RS256", "kid": self.kid, "n": _int_b64url(self.n), "e": _int_b64url(self.e)}
+
+    def sign(self, message):
+        digest = _SHA256_PREFIX + hashlib.sha256(message).digest()
+        padded = b"\x00\x01" + b"\xff" * (self.size - len(digest) - 3) + b"\x00" + digest
+        return pow(int.from_bytes(padded, "big"), self.d, self.n).to_bytes(self.size, "big")
+
+    def jwt(self, claims):
+        header = _b64url(json.dumps({"alg": "RS256", "typ": "JWT", "kid": self.kid}).encode("utf-8"))
+        payload = _b64url(json.dumps(claims).encode("utf-8"))
+        signing_input = f"{header}.{payload}".encode("ascii")
+        return f"{header}.{payload}.{_b64url(self.sign(signing_input))}"
+
+
+# ----------------- Login page -----------------
+_LOGIN_PAGE = """<!DOCTYPE html>
+<html>
+<head><title>Mock login</title></head>
+<body>
+<form id="mockOidcLogin" method="post" action="/authorize">
+{hidden}
+<h1>Log in as</h1>
+{buttons}
+</form>
+</body>
+</html>
+"""
+
+
+def claims_for(email):
+    name = email.split("@")[0]
+    return {
+        "sub": str(uuid.uuid5(uuid.NAMESPACE_URL, f"amplify-test:{email}")),
+        "email": email,
+        "email_verified": True,
+        "username": email,
+        "cognito:username": email,
+        "name": name.title(),
+        "given_name": name.title(),
+        "family_name": "Tester",
+    }
+
+
+class OIDCServer(MockServer):
+    NAME = "oidc"
+    DEFAULT_PORT = 8104
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.key = SigningKey()
+        self.codes = {}
+        self.refresh_tokens = {}
+        self.logins = []
+        self.route("GET", r"/\.well-known/openid-configuration", self.discovery)
+        self.route("GET", r"/jwks", self.jwks)
+        self.route("GET", r"/authorize", self.login_page)
+        self.route("POST", r"/authorize", self.authorize)
+        self.route("POST", r"/(?:token|oauth2/token)", self.token)
+        self.route("GET", r"/userinfo", self.userinfo)
+        self.route("GET", r"/__mock/logins", self._list_logins)
+
+    def reset(self):
+        super().reset()
+        self.codes.clear()
+        self.refresh_tokens.clear()
+        self.logins.clear()
+
+    def issuer(self, request):
+        # The issuer has to be exactly the URL NextAuth was configured with
+        return f"http://{request.headers.get('host', f'{self.host}:{self.port}')}"
+
+    # ----------------- Routes -----------------
+    async def discovery(self, request):
+        issuer = self.issuer(request)
+        return json_response({
+            "issuer": issuer,
+            "authorization_endpoint": f"{issuer}/authorize",
+            "token_endpoint": f"{issuer}/token",
+            "userinfo_endpoint": f"{issuer}/userinfo",
+            "jwks_uri": f"{issuer}/jwks",
+            "response_types_supported": ["code"],
+            "subject_types_supported": ["public"],
+            "id_token_signing_alg_values_supported": ["RS256"],
+            "scopes_supported": ["openid", "email", "profile"],
+            "token_endpoint_auth_methods_supported": ["client_secret_basic", "client_secret_post"],
+            "grant_types_supported": ["authorization_code", "refresh_token"],
+            "claims_supported": sorted(claims_for("x@y")),
+        })
+
+    async def jwks(self, request):
+        return json_response({"keys": [self.key.jwk()]})
+
+    async def login_page(self, request):
+        if request.query.get("login_hint") in users():
+            return self._redirect_with_code(request.query, request.query["login_hint"], request)
+        hidden = "\n".join(
+            f'<input type="hidden" name="{html.escape(k)}" value="{html.escape(v)}">'
+            for k, v in request.query.items()
+        )
+        buttons = "\n".join(
+            f'<button type="submit" name="user" value="{html.escape(u)}" data-user="{html.escape(u)}">{html.escape(u)}</button>'
+            for u in users()
+        )
+        return Response(_LOGIN_PAGE.format(hidden=hidden, buttons=buttons), headers={"Content-Type": "text/html"})
+
+    async def authorize(self, request):
+        form = dict(parse_qsl(request.body.decode("utf-8")))
+        if form.get("user") not in users():
+            return Response(f"Unknown test user {form.get('user')!r}", 400)
+        return self._redirect_with_code(form, form["user"], request)
+
+    def _redirect_with_code(self, params, user, request):
+        code = secrets.token_urlsafe(24)
+        self.codes[code] = {"user": user, "nonce": params.get("nonce"), "client_id": params.get("client_id")}
+        self.logins.append({"user": user, "at": time.time()})
+        query = {"code": code}
+        if params.get("state"):
+            query["state"] = params["state"]
+        location = params["redirect_uri"] + ("&" if "?" in params["redirect_uri"] else "?") + urlencode(query)
+        return Response(status=302, headers={"Location": location})
+
+    async def token(self, request):
+        form = dict(parse_qsl(request.body.decode("utf-8")))
+        client_id = form.get("client_id") or self._basic_client_id(request)
+        if form.get("grant_type") == "authorization_code":
+            grant = self.codes.pop(form.get("code"), None)
+            if grant is None:
+                return json_response({"error": "invalid_grant"}, 400)
+            return json_response(self.issue(request, grant["user"], client_id, grant["nonce"]))
+        if form.get("grant_type") == "refresh_token":
+            user = self.refresh_tokens.get(form.get("refresh_token"))
+            if user is None:
+                return json_response({"error": "invalid_grant"}, 400)
+            tokens = self.issue(request, user, client_id)
+            tokens["refresh_token"] = form["refresh_token"]
+            return json_response(tokens)
+        return json_response({"error": "unsupported_grant_type"}, 400)
+
+    async def userinfo(self, request):
+        claims = self._verified_claims(request.bearer_token)
+        if claims is None:
+            return json_response({"error": "invalid_token"}, 401)
+        return json_response(claims_for(claims["username"]))
+
+    async def _list_logins(self, request):
+        return json_response(self.logins)
+
+    # ----------------- Tokens -----------------
+    def _basic_client_id(self, request):
+        auth = request.headers.get("authorization", "")
+        if not auth.startswith("Basic "):
+            return None
+        return base64.b64decode(auth[len("Basic "):]).decode("utf-8").partition(":")[0]
+
+    def issue(self, request, user, client_id, nonce=None):
+        now = int(time.time())
+        issuer = self.issuer(request)
+        claims = claims_for(user)
+        id_claims = {**claims, "iss": issuer, "aud": client_id, "iat": now, "exp": now + TOKEN_LIFETIME, "token_use": "id"}
+        if nonce:
+            id_claims["nonce"] = nonce
+        access_claims = {
+            "sub": claims["sub"], "username": user, "iss": issuer, "client_id": client_id,
+            "iat": now, "exp": now + TOKEN_LIFETIME, "token_use": "access", "scope": "openid email profile",
+        }
+        refresh_token = secrets.token_urlsafe(32)
+        self.refresh_tokens[refresh_token] = user
+        return {
+            "access_token": self.key.jwt(access_claims),
+            "id_token": self.key.jwt(id_claims),
+            "refresh_token": refresh_token,
+            "token_type": "Bearer",
+            "expires_in": TOKEN_LIFETIME,
+        }
+
+    def _verified_claims(self, token):
+        try:
+            header, payload, signature = (token or "").split(".")
+        except ValueError:
+            return None
+        expected = self.key.sign(f"{header}.{payload}".encode("ascii"))
+        if _b64url(expected) != signature:
+            return None
+        return json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve a local OpenID Connect provider for NextAuth")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=OIDCServer.DEFAULT_PORT)
+    args = parser.parse_args()
+    OIDCServer(host=args.host, port=args.port).serve_forever()
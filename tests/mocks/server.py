@@ -0,0 +1,350 @@
+"""A small asyncio HTTP/1.1 server the mock backends are built on.
+
+Only what the app's fetch calls need: JSON request bodies, keep-alive,
+CORS for calls the browser makes directly, and chunked responses for
+streams. Handlers are coroutines taking a Request and returning a Response
+or a StreamResponse:
+
+    class EchoServer(MockServer):
+        NAME = "echo"
+        DEFAULT_PORT = 8199
+
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.route("POST", r"/echo", self.echo)
+
+        async def echo(self, request):
+            return json_response(request.json())
+
+Every server also answers a few control routes under /__mock/ that tests
+and scripts use to inspect or reset it:
+
+    GET  /__mock/health      {"name": ..., "requests": n}
+    GET  /__mock/requests    every request received since the last reset
+    POST /__mock/reset       forget the requests and any state (see reset())
+    GET  /__mock/profile     the latency and fault rules in force (see faults.py)
+    POST /__mock/profile     {"profile": name} or {"rules": [...]}, until the next reset
+
+Servers run in a background thread with ``start()`` (the parallel runner
+does this for --mocks) or in the foreground with ``serve_forever()``.
+"""
+
+import asyncio
+import json
+import os
+import re
+import threading
+import time
+from http import HTTPStatus
+from urllib.parse import parse_qsl, urlsplit
+
+from tests.mocks.faults import Faults, load_profile
+
+_CORS_HEADERS = {
+    "Access-Control-Allow-Methods": "GET, POST, PUT, DELETE, OPTIONS",
+    "Access-Control-Allow-Headers": "Content-Type, Authorization",
+    "Access-Control-Max-Age": "600",
+}
+
+
+class Request:
+    def __init__(self, method, target, headers, body):
+        parts = urlsplit(target)
+        self.method = method
+        self.path = parts.path
+        self.query = dict(parse_qsl(parts.query))
+        self.headers = headers  # Lower-cased names
+        self.body = body
+        self.match = None  # The route's regex match, set before the handler runs
+        self.fault = None  # The fault rule the request falls under, if any
+        self.receive_seconds = 0  # From the request line to the end of the body
+
+    def json(self):
+        return json.loads(self.body) if self.body else None
+
+    @property
+    def bearer_token(self):
+        auth = self.headers.get("authorization", "")
+        return auth[len("Bearer "):] if auth.startswith("Bearer ") else None
+
+
+class Response:
+    def __init__(self, body=b"", status=200, headers=None):
+        self.body = body.encode("utf-8") if isinstance(body, str) else body
+        self.status = status
+        self.headers = {"Content-Type": "text/plain; charset=utf-8", **(headers or {})}
+
+
+class StreamResponse:
+    """A chunked response; ``chunks`` is an async iterator of bytes or str"""
+
+    def __init__(self, chunks, status=200, headers=None):
+        self.chunks = chunks
+        self.status = status
+        self.headers = headers or {}
+
+
+class DropConnection(Exception):
+    """Raised by a stream to cut the connection without finishing the response"""
+
+
+def json_response(data, status=200, headers=None):
+    return Response(
+        json.dumps(data), status, {"Content-Type": "application/json", **(headers or {})}
+    )
+
+
+class MockServer:
+    """Routing, control routes and the HTTP plumbing shared by every mock"""
+
+    NAME = "mock"
+    DEFAULT_PORT = 0
+
+    def __init__(self, host="127.0.0.1", port=None, profile=None):
+        self.host = host
+        self.port = self.DEFAULT_PORT if port is None else port
+        self.routes = []
+        self.requests = []
+        if profile is None:
+            profile = os.getenv(f"AMPLIFY_MOCK_{self.NAME.upper()}_PROFILE") or os.getenv("AMPLIFY_MOCK_PROFILE")
+        self.profile = load_profile(profile)
+        self.faults = Faults(self.profile)
+        self._loop = None
+        self._server = None
+        self._thread = None
+        self.route("GET", r"/__mock/health", self._health)
+        self.route("GET", r"/__mock/requests", self._list_requests)
+        self.route("POST", r"/__mock/reset", self._reset)
+        self.route("GET", r"/__mock/profile", self._get_profile)
+        self.route("POST", r"/__mock/profile", self._set_profile)
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}"
+
+    def route(self, method, pattern, handler):
+        """Send ``method`` requests whose whole path matches ``pattern`` to ``handler``"""
+        self.routes.append((method, re.compile(pattern), handler))
+
+    def reset(self):
+        """Forget everything a test left behind; subclasses clear their own state too"""
+        self.requests.clear()
+        # Back to the profile the server started with, with the same random draws
+        self.faults = Faults(self.profile)
+
+    # ----------------- Control routes -----------------
+    async def _health(self, request):
+        return json_response({"name": self.NAME, "requests": len(self.requests)})
+
+    async def _list_requests(self, request):
+        return json_response(self.requests)
+
+    async def _reset(self, request):
+        self.reset()
+        return json_response({"reset": True})
+
+    async def _get_profile(self, request):
+        return json_response([rule for _, rule in self.faults.rules])
+
+    async def _set_profile(self, request):
+        data = request.json() or {}
+        rules = load_profile(data["profile"] if "profile" in data else data.get("rules", []))
+        self.faults = Faults(rules, data.get("seed"))
+        return json_response(rules)
+
+    # ----------------- Dispatch -----------------
+    async def dispatch(self, request):
+        if request.method == "OPTIONS":
+            return Response(status=204)
+        if not request.path.startswith("/__mock/"):
+            self.requests.append({
+                "method": request.method,
+                "path": request.path,
+                "bytes": len(request.body),
+                "at": time.time(),
+            })
+            request.fault = self.faults.rule_for(request.method, request.path)
+            if request.fault:
+                await asyncio.sleep(self.faults.latency(request.fault))
+                if self.faults.fails(request.fault):
+                    status = request.fault.get("error_status", 500)
+                    return json_response({"error": f"Injected {status} for {request.path}"}, status)
+        allowed = False
+        for method, pattern, handler in self.routes:
+            match = pattern.fullmatch(request.path)
+            if not match:
+                continue
+            if method != request.method:
+                allowed = True
+                continue
+            request.match = match
+            return await handler(request)
+        if allowed:
+            return json_response({"error": f"{request.method} not allowed"}, 405)
+        return json_response({"error": f"No mock route for {request.path}"}, 404)
+
+    # ----------------- HTTP -----------------
+    async def _read_request(self, reader):
+        line = await reader.readline()
+        if not line.strip():
+            return None
+        started = time.monotonic()
+        method, target, _ = line.decode("latin-1").split(" ", 2)
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            body = b""
+            while True:
+                size = int((await reader.readline()).split(b";")[0], 16)
+                if size == 0:
+                    await reader.readline()
+                    break
+                body += await reader.readexactly(size)
+                await reader.readline()
+        else:
+            body = await reader.readexactly(int(headers.get("content-length", 0)))
+        request = Request(method, target, headers, body)
+        request.receive_seconds = time.monotonic() - started
+        return request
+
+    def _head(self, request, status, headers):
+        headers = dict(headers)
+        headers["Access-Control-Allow-Origin"] = request.headers.get("origin", "*")
+        if request.method == "OPTIONS":
+            headers.update(_CORS_HEADERS)
+        reason = HTTPStatus(status).phrase if status in HTTPStatus._value2member_map_ else ""
+        lines = [f"HTTP/1.1 {status} {reason}"] + [f"{k}: {v}" for k, v in headers.items()]
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+    async def _shaped(self, chunks, rule, drop_at):
+        """``chunks`` re-cut, paced and possibly cut off as ``rule`` says"""
+        chunk_size = rule.get("chunk_size")
+        delay = rule.get("chunk_delay", 0) / 1000
+        bandwidth = rule.get("bandwidth")
+        sent = 0
+        async for chunk in chunks:
+            chunk = chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+            pieces = [chunk[i:i + chunk_size] for i in range(0, len(chunk), chunk_size)] if chunk_size else [chunk]
+            for piece in pieces:
+                if drop_at is not None and sent + len(piece) >= drop_at:
+                    yield piece[:drop_at - sent]
+                    raise DropConnection()
+                await asyncio.sleep(delay + (len(piece) / bandwidth if bandwidth else 0))
+                sent += len(piece)
+                yield piece
+
+    async def _write_response(self, writer, request, response):
+        rule = request.fault
+        if isinstance(response, StreamResponse):
+            headers = {**response.headers, "Transfer-Encoding": "chunked", "Cache-Control": "no-cache"}
+            writer.write(self._head(request, response.status, headers))
+            await writer.drain()
+            chunks = response.chunks
+            if rule:
+                chunks = self._shaped(chunks, rule, self.faults.drop_point(rule))
+            async for chunk in chunks:
+                chunk = chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+                if chunk:
+                    writer.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+                    await writer.drain()
+            writer.write(b"0\r\n\r\n")
+        elif rule:
+            headers = {**response.headers, "Content-Length": str(len(response.body))}
+            writer.write(self._head(request, response.status, headers))
+
+            async def body():
+                yield response.body
+
+            async for chunk in self._shaped(body(), rule, self.faults.drop_point(rule, len(response.body))):
+                writer.write(chunk)
+                await writer.drain()
+        else:
+            headers = {**response.headers, "Content-Length": str(len(response.body))}
+            writer.write(self._head(request, response.status, headers) + response.body)
+        await writer.drain()
+
+    async def _connection(self, reader, writer):
+        try:
+            while True:
+                request = await self._read_request(reader)
+                if request is None:
+                    break
+                try:
+                    response = await self.dispatch(request)
+                except Exception as e:
+                    print(f"[{self.NAME} mock] {request.method} {request.path} failed: {e!r}")
+                    response = json_response({"error": str(e)}, 500)
+                await self._write_response(writer, request, response)
+                if request.headers.get("connection", "").lower() == "close":
+                    break
+        except (DropConnection, ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except asyncio.CancelledError:
+            pass  # stop() closes connections that are still open
+        finally:
+            writer.close()
+
+    # ----------------- Lifecycle -----------------
+    async def _start_server(self):
+        self._server = await asyncio.start_server(self._connection, self.host, self.port)
+        # Port 0 picks a free port
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    def start(self):
+        """Serve from a background thread, return once the port is bound"""
+        ready = threading.Event()
+        failure = []
+
+        def run():
+            self._loop = asyncio.new_event_loop()
+            try:
+                self._loop.run_until_complete(self._start_server())
+            except OSError as e:
+                failure.append(e)
+                ready.set()
+                return
+            ready.set()
+            self._loop.run_forever()
+            self._loop.close()
+
+        self._thread = threading.Thread(target=run, name=f"{self.NAME}-mock", daemon=True)
+        self._thread.start()
+        ready.wait()
+        if failure:
+            raise RuntimeError(f"Could not start the {self.NAME} mock on port {self.port}: {failure[0]}")
+        print(f"{self.NAME} mock listening on {self.url}")
+        return self
+
+    async def _shutdown(self):
+        self._server.close()
+        # Open keep-alive connections and unfinished streams
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stop(self):
+        if self._loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result(timeout=5)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+        self._loop = None
+
+    def serve_forever(self):
+        async def main():
+            await self._start_server()
+            print(f"{self.NAME} mock listening on {self.url}")
+            async with self._server:
+                await self._server.serve_forever()
+
+        try:
+            asyncio.run(main())
+        except KeyboardInterrupt:
+            pass
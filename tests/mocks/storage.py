@@ -0,0 +1,289 @@
+"""Local stand-in for the file service: presigned uploads, processing and file queries.
+
+services/fileService.ts uploads a file in three steps: /api/files/upload
+asks the file service for a presigned URL, the browser PUTs the file there,
+then polls the metadata URL until the document pipeline has processed it.
+This server plays both the file service and the object store:
+
+    POST /files/upload        {"uploadUrl", "statusUrl", "contentUrl", "metadataUrl", "key"}
+    PUT  /objects/<key>       the presigned upload, timed to measure throughput
+    GET  /metadata/<key>      404 while "processing", then {"totalTokens", "totalItems", ...}
+    GET  /status/<key>        {"status": "processing" | "ready"}
+    GET  /content/<key>       the extracted text, once ready
+    POST /files/query, /files/delete, /files/download, /files/set_tags, /files/tags/delete
+    GET  /files/tags/list
+
+Processing takes ``processing_seconds`` plus ``processing_seconds_per_mb``
+for every MB uploaded (AMPLIFY_MOCK_PROCESSING_SECONDS and
+AMPLIFY_MOCK_PROCESSING_SECONDS_PER_MB, or POST /__mock/processing with
+{"seconds": ..., "per_mb": ...}). GET /__mock/uploads lists every upload
+with the MB/s it was received at and how long processing took.
+
+The app reaches the file service through NEXT_PUBLIC_LOCAL_SERVICES, which
+routes the "file" service to http://localhost:<port>/<stage>; restart the
+frontend after setting it:
+
+    NEXT_PUBLIC_LOCAL_SERVICES=file:8105:dev
+    python3 -m tests.mocks.storage --processing-seconds 2
+"""
+
+import argparse
+import datetime
+import os
+import re
+import time
+import uuid
+from urllib.parse import quote, unquote
+
+from tests.mocks.backend import operation
+from tests.mocks.server import MockServer, Response, json_response
+
+DEFAULT_PROCESSING_SECONDS = 1.0
+
+IMAGE_TYPES = ("image/png", "image/jpeg", "image/gif", "image/webp")
+
+# The stage NEXT_PUBLIC_LOCAL_SERVICES puts in front of the path, e.g. /dev
+_STAGE = r"(?:/[\w-]+)?"
+
+
+class StorageServer(MockServer):
+    NAME = "storage"
+    DEFAULT_PORT = 8105
+
+    def __init__(self, processing_seconds=None, processing_seconds_per_mb=None, **kwargs):
+        super().__init__(**kwargs)
+        if processing_seconds is None:
+            processing_seconds = float(os.getenv("AMPLIFY_MOCK_PROCESSING_SECONDS", DEFAULT_PROCESSING_SECONDS))
+        if processing_seconds_per_mb is None:
+            processing_seconds_per_mb = float(os.getenv("AMPLIFY_MOCK_PROCESSING_SECONDS_PER_MB", "0"))
+        self.processing_seconds = processing_seconds
+        self.processing_seconds_per_mb = processing_seconds_per_mb
+        self.files = {}
+        self.route("POST", r"/__mock/processing", self._set_processing)
+        self.route("GET", r"/__mock/uploads", self._list_uploads)
+        self.route("PUT", r"/objects/(.+)", self.put_object)
+        self.route("GET", r"/objects/(.+)", self.get_object)
+        self.route("GET", r"/metadata/(.+)", self.metadata)
+        self.route("GET", r"/status/(.+)", self.status)
+        self.route("GET", r"/content/(.+)", self.content)
+        # Same methods as services/fileService.ts and pages/api/files/upload.ts
+        ops = {
+            ("POST", "/files/upload"): self.upload,
+            ("POST", "/files/query"): self.query,
+            ("POST", "/files/delete"): self.delete,
+            ("POST", "/files/download"): self.download,
+            ("GET", "/files/tags/list"): self.list_tags,
+            ("POST", "/files/tags/delete"): self.delete_tags,
+            ("POST", "/files/set_tags"): self.set_tags,
+            ("POST", "/files/reprocess/rag"): self.reprocess,
+        }
+        for (method, path), handler in ops.items():
+            self.route(method, _STAGE + re.escape(path), operation(handler))
+
+    def reset(self):
+        super().reset()
+        self.files = {}
+
+    def base_url(self, request):
+        # URLs handed to the browser use the host the file service was called on
+        return f"http://{request.headers.get('host', f'{self.host}:{self.port}')}"
+
+    def _file(self, request):
+        return self.files.get(unquote(request.match.group(1)))
+
+    def is_ready(self, stored):
+        return stored["ready_at"] is not None and time.monotonic() >= stored["ready_at"]
+
+    # ----------------- Control routes -----------------
+    async def _set_processing(self, request):
+        data = request.json() or {}
+        self.processing_seconds = float(data.get("seconds", self.processing_seconds))
+        self.processing_seconds_per_mb = float(data.get("per_mb", self.processing_seconds_per_mb))
+        return json_response({"seconds": self.processing_seconds, "per_mb": self.processing_seconds_per_mb})
+
+    async def _list_uploads(self, request):
+        return json_response([self.upload_record(stored) for stored in self.files.values() if stored["bytes"] is not None])
+
+    def upload_record(self, stored):
+        seconds = stored["upload_seconds"]
+        return {
+            "key": stored["key"],
+            "name": stored["name"],
+            "type": stored["type"],
+            "bytes": stored["bytes"],
+            "upload_seconds": round(seconds, 4),
+            "mb_per_second": round(stored["bytes"] / 1e6 / seconds, 3) if seconds else None,
+            "processing_seconds": round(stored["processing_seconds"], 3),
+            "ready": self.is_ready(stored),
+        }
+
+    # ----------------- Object store -----------------
+    async def put_object(self, request):
+        stored = self._file(request)
+        if stored is None:
+            return Response("NoSuchUpload", 404, {"x-amz-error-message": "Unknown upload key"})
+        stored["bytes"] = len(request.body)
+        stored["body"] = request.body
+        stored["upload_seconds"] = request.receive_seconds
+        stored["processing_seconds"] = self.processing_seconds + self.processing_seconds_per_mb * len(request.body) / 1e6
+        stored["ready_at"] = time.monotonic() + stored["processing_seconds"]
+        record = self.upload_record(stored)
+        print(
+            f"[{self.NAME} mock] {record['name']}: {record['bytes']} bytes in {record['upload_seconds']}s "
+            f"({record['mb_per_second'] or '-'} MB/s), ready in {record['processing_seconds']}s"
+        )
+        return Response(status=200)
+
+    async def get_object(self, request):
+        stored = self._file(request)
+        if stored is None or stored["body"] is None:
+            return Response("NoSuchKey", 404)
+        return Response(stored["body"], headers={"Content-Type": stored["type"] or "application/octet-stream"})
+
+    # ----------------- Processing -----------------
+    def extracted_text(self, stored):
+        if stored["type"] in IMAGE_TYPES:
+            return ""
+        text = stored["body"].decode("utf-8", "ignore")
+        # Binary formats (pdf, docx, ...) have no readable text without a real pipeline
+        if sum(c.isprintable() or c.isspace() for c in text[:4096]) < 0.9 * len(text[:4096]):
+            text = f"Text extracted from {stored['name']} by the storage mock."
+        return text
+
+    async def metadata(self, request):
+        stored = self._file(request)
+        if stored is None or not self.is_ready(stored):
+            return json_response({"error": "NoSuchKey"}, 404)
+        text = self.extracted_text(stored)
+        is_image = stored["type"] in IMAGE_TYPES
+        return json_response({
+            "name": stored["name"],
+            "type": stored["type"],
+            "isImage": is_image,
+            "totalTokens": max(1, len(text) // 4) if not is_image else 0,
+            "totalItems": max(1, text.count("\n\n") + 1) if not is_image else 0,
+            "bytes": stored["bytes"],
+        })
+
+    async def status(self, request):
+        stored = self._file(request)
+        if stored is None:
+            return json_response({"error": "NoSuchKey"}, 404)
+        if stored["bytes"] is None:
+            return json_response({"status": "waiting for upload"})
+        return json_response({"status": "ready" if self.is_ready(stored) else "processing"})
+
+    async def content(self, request):
+        stored = self._file(request)
+        if stored is None or not self.is_ready(stored):
+            return json_response({"error": "NoSuchKey"}, 404)
+        return json_response({"content": self.extracted_text(stored)})
+
+    # ----------------- File service -----------------
+    def upload(self, user, data, request):
+        now = datetime.datetime.now(datetime.timezone.utc)
+        key = f"{user}/{now:%Y-%m-%d}/{uuid.uuid4()}.json"
+        self.files[key] = {
+            "key": key,
+            "user": user,
+            "name": data.get("name", ""),
+            "type": data.get("type", ""),
+            "tags": list(data.get("tags") or []),
+            "groupId": data.get("groupId"),
+            "createdAt": now.isoformat(),
+            "bytes": None,
+            "body": None,
+            "upload_seconds": 0,
+            "processing_seconds": 0,
+            "ready_at": None,
+        }
+        base, quoted = self.base_url(request), quote(key, safe="")
+        return {
+            "success": True,
+            "uploadUrl": f"{base}/objects/{quoted}",
+            "statusUrl": f"{base}/status/{quoted}",
+            "contentUrl": f"{base}/content/{quoted}",
+            "metadataUrl": f"{base}/metadata/{quoted}",
+            "key": key,
+        }
+
+    def file_record(self, stored):
+        text = self.extracted_text(stored) if self.is_ready(stored) else ""
+        return {
+            "id": stored["key"],
+            "name": stored["name"],
+            "type": stored["type"],
+            "tags": stored["tags"],
+            "knowledgeBase": "default",
+            "data": {},
+            "createdAt": stored["createdAt"],
+            "updatedAt": stored["createdAt"],
+            "createdBy": stored["user"],
+            "updatedBy": stored["user"],
+            "totalTokens": len(text) // 4,
+            "totalItems": 1 if text else 0,
+        }
+
+    def query(self, user, data, request):
+        items = [
+            self.file_record(stored)
+            for stored in self.files.values()
+            if stored["user"] == user and stored["bytes"] is not None
+            and (not data.get("namePrefix") or stored["name"].startswith(data["namePrefix"]))
+            and (not data.get("types") or stored["type"] in data["types"])
+            and (not data.get("tags") or set(data["tags"]) & set(stored["tags"]))
+        ]
+        items.sort(key=lambda item: item["createdAt"], reverse=not data.get("forwardScan", False))
+        return {"success": True, "data": {"items": items[:data.get("pageSize") or None], "pageKey": None}}
+
+    def delete(self, user, data, request):
+        stored = self.files.get(data.get("key"))
+        if stored is None or stored["user"] != user:
+            return {"success": False, "message": "File not found"}
+        del self.files[data["key"]]
+        return {"success": True}
+
+    def download(self, user, data, request):
+        if data.get("key") not in self.files:
+            return {"success": False, "message": "File not found"}
+        return {"success": True, "downloadUrl": f"{self.base_url(request)}/objects/{quote(data['key'], safe='')}"}
+
+    def list_tags(self, user, data, request):
+        tags = sorted({tag for stored in self.files.values() if stored["user"] == user for tag in stored["tags"]})
+        return {"success": True, "data": {"tags": tags}}
+
+    def delete_tags(self, user, data, request):
+        tags = set(data.get("tags") or [])
+        for stored in self.files.values():
+            if stored["user"] == user:
+                stored["tags"] = [tag for tag in stored["tags"] if tag not in tags]
+        return {"success": True, "message": "Tags deleted"}
+
+    def set_tags(self, user, data, request):
+        stored = self.files.get(data.get("id"))
+        if stored is None:
+            return {"success": False, "message": "File not found"}
+        stored["tags"] = list(data.get("tags") or [])
+        return {"success": True, "message": "Tags updated"}
+
+    def reprocess(self, user, data, request):
+        stored = self.files.get(data.get("key"))
+        if stored is None or stored["bytes"] is None:
+            return {"success": False, "message": "File not found"}
+        stored["ready_at"] = time.monotonic() + stored["processing_seconds"]
+        return {"success": True}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve presigned uploads and a fake document pipeline")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=StorageServer.DEFAULT_PORT)
+    parser.add_argument("--processing-seconds", type=float, default=None)
+    parser.add_argument("--processing-seconds-per-mb", type=float, default=None)
+    args = parser.parse_args()
+    StorageServer(
+        processing_seconds=args.processing_seconds,
+        processing_seconds_per_mb=args.processing_seconds_per_mb,
+        host=args.host,
+        port=args.port,
+    ).serve_forever()
@@ -0,0 +1,334 @@
+"""Page objects shared by the test classes.
+
+Each part of the app the tests drive has one implementation of each action
+here, built on the condition waits from tests/waits.py instead of fixed
+sleeps, so a faster way to create a chat or share a prompt lands in every
+test at once. BaseTest exposes them as ``self.left_sidebar``,
+``self.right_sidebar``, ``self.chat``, ``self.assistant_modal``,
+``self.admin_modal`` and ``self.settings_modal``:
+
+    self.left_sidebar.create_chats(["Kukui", "Cynthia"])
+    self.left_sidebar.tag_chats(["Kukui", "Cynthia"], ["Researcher", "Champion"])
+    self.chat.send_message("Hello", chat="Kukui")
+    self.right_sidebar.share_items(["Goomba 1", "Goomba 2"], "friend@email.com")
+
+The batched variants (create_chats, tag_chats, share_items, ...) go through
+the kebab menu's multi-select once for all the items instead of once per item.
+Every method raises TimeoutException naming the element it waited for.
+"""
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+
+from tests import timing, waits
+
+SHARE_NOTE = "Shared by the automated tests"
+
+
+class Page:
+    """Lookups shared by every page object"""
+
+    def __init__(self, driver):
+        self.driver = driver
+
+    def find_named(self, element_id, text, timeout=waits.DEFAULT_TIMEOUT):
+        """Wait for the element with ``element_id`` whose text is exactly ``text``"""
+
+        def named(d):
+            for element in d.find_elements(By.ID, element_id):
+                if element.text == text:
+                    return element
+            return False
+
+        return waits.poll(self.driver, timeout).until(
+            named, f"No #{element_id} named {text!r} within {timeout}s"
+        )
+
+    def find_all_named(self, element_id, texts, timeout=waits.DEFAULT_TIMEOUT):
+        """Wait until every text in ``texts`` has an ``element_id`` element, return them in order"""
+
+        def named(d):
+            by_text = {element.text: element for element in d.find_elements(By.ID, element_id)}
+            return [by_text[text] for text in texts] if all(t in by_text for t in texts) else False
+
+        return waits.poll(self.driver, timeout).until(
+            named, f"Not every #{element_id} in {list(texts)} appeared within {timeout}s"
+        )
+
+    def click(self, element_id, text=None, timeout=waits.DEFAULT_TIMEOUT):
+        """Click the element with ``element_id`` (the one named ``text`` if given)"""
+        if text is None:
+            element = waits.wait_for_clickable(self.driver, element_id, timeout)
+        else:
+            element = self.find_named(element_id, text, timeout)
+        element.click()
+        return element
+
+    def answer_prompt(self, text, timeout=waits.DEFAULT_TIMEOUT):
+        """Type ``text`` into the window.prompt the app just opened and accept it"""
+        alert = waits.poll(self.driver, timeout).until(
+            EC.alert_is_present(), f"No prompt dialog opened within {timeout}s"
+        )
+        alert.send_keys(text)
+        alert.accept()
+
+
+class Sidebar(Page):
+    """The tabbed sidebar; LeftSidebar and RightSidebar are its Chats and Assistants tabs"""
+
+    TAB = None
+    ITEM_CONTAINER = None  # Element wrapping an item and its multi-select checkbox
+    NAME_IDS = ()  # Ids of the item names shown in this tab
+
+    def open(self):
+        """Switch the sidebar to this tab"""
+        def tab(d):
+            for button in d.find_elements(By.ID, "tabSelection"):
+                if self.TAB in (button.get_attribute("title") or ""):
+                    return button
+            return False
+
+        waits.poll(self.driver).until(tab, f"No {self.TAB!r} sidebar tab").click()
+        waits.wait_for(self.driver, "promptHandler")
+        return self
+
+    # ----------------- Folders -----------------
+    def create_folder(self, name):
+        self.create_folders([name])
+
+    def create_folders(self, names):
+        for name in names:
+            self.click("createFolderButton")
+            self.answer_prompt(name)
+        self.find_all_named("dropName", names)
+
+    def expand_folder(self, name):
+        """Expand the folder named ``name`` unless it is already open"""
+        button = self.find_named("dropName", name).find_element(By.XPATH, "./ancestor::button")
+        if button.get_attribute("title") != "Collapse folder":
+            button.click()
+
+    # ----------------- Multi-select -----------------
+    def _item(self, name, folders=False):
+        for element_id in ("dropName",) if folders else self.NAME_IDS:
+            for element in self.driver.find_elements(By.ID, element_id):
+                if element.text == name:
+                    return element
+        return None
+
+    def select_items(self, action, names=None, folders=False):
+        """Start a kebab menu ``action`` ("Delete", "Share", "Tag") and tick ``names``.
+
+        Without names every item is ticked with selectAllCheck. ``folders``
+        runs the action from the Folders submenu instead. Call confirm_selection
+        to apply it.
+        """
+        self.click("promptHandler")
+        if folders:
+            self.click("folders-menu")
+            waits.poll(self.driver).until(
+                lambda d: len(d.find_elements(By.ID, action)) > 1, f"No folder {action} action"
+            )
+            self.driver.find_elements(By.ID, action)[-1].click()
+        else:
+            self.click(action)
+        if names is None:
+            waits.wait_for(self.driver, "selectAllCheck").find_element(
+                By.XPATH, ".//input[@type='checkbox']"
+            ).click()
+            return
+
+        def items(d):
+            found = [(name, self._item(name, folders)) for name in names]
+            return found if all(element for _, element in found) else False
+
+        found = waits.poll(self.driver).until(items, f"Not every item in {list(names)} is listed")
+        for name, element in found:
+            container = "folderContainer" if folders else self.ITEM_CONTAINER
+            element.find_element(By.XPATH, f"./ancestor::div[@id='{container}']").find_element(
+                By.XPATH, ".//input[@type='checkbox']"
+            ).click()
+
+    def confirm_selection(self):
+        self.click("confirmItem")
+
+    def delete_items(self, names=None, folders=False):
+        """Delete ``names`` (or everything) through the kebab menu"""
+        self.select_items("Delete", names, folders)
+        self.confirm_selection()
+        if names:
+            for name in names:
+                waits.poll(self.driver).until(
+                    lambda d: self._item(name, folders) is None, f"{name!r} was not deleted"
+                )
+
+    def share_items(self, names, user, note=SHARE_NOTE, folders=False):
+        """Share ``names`` with ``user`` (an email, or a list of them) in one go"""
+        self.select_items("Share", names, folders)
+        self.confirm_selection()
+        waits.wait_for_text(self.driver, "modalTitle", "Add People to Share With")
+        users = [user] if isinstance(user, str) else list(user)
+        self.driver.find_element(
+            By.XPATH, "//p[normalize-space()='People:']/parent::div/preceding-sibling::button"
+        ).click()
+        waits.wait_for(self.driver, "emailInput").send_keys(", ".join(users))
+        self.driver.find_element(By.XPATH, "//button[normalize-space()='OK']").click()
+        self.driver.find_element(
+            By.XPATH, "//textarea[starts-with(@placeholder, 'Describe what you are sharing')]"
+        ).send_keys(note)
+        self.click("confirmationButton", "Share")
+        waits.poll(self.driver, 60).until(
+            lambda d: not any(e.text == "Add People to Share With" for e in d.find_elements(By.ID, "modalTitle")),
+            "The share dialog did not close within 60s",
+        )
+
+
+class LeftSidebar(Sidebar):
+    """Chats tab: conversations and chat folders"""
+
+    TAB = "Chats"
+    ITEM_CONTAINER = "chat"
+    NAME_IDS = ("chatName",)
+
+    def create_chat(self, name):
+        self.create_chats([name])
+
+    def create_chats(self, names):
+        """Create and rename one chat per name, then wait for all of them at once"""
+        for name in names:
+            self.click("promptButton", "New Chat")
+            self.open_chat("New Conversation")
+            self.click("isRenaming")
+            field = waits.wait_for(self.driver, "isRenamingInput")
+            field.clear()
+            field.send_keys(name)
+            self.click("handleConfirm")
+        self.find_all_named("chatName", names)
+
+    def open_chat(self, name):
+        self.find_named("chatName", name).find_element(By.XPATH, "./ancestor::button").click()
+        waits.wait_for(self.driver, "messageChatInputText")
+
+    def delete_chats(self, names=None):
+        self.delete_items(names)
+
+    def tag_chats(self, names, tags):
+        """Add every tag in ``tags`` to every chat in ``names`` (None for all chats)"""
+        self.select_items("Tag", names)
+        self.confirm_selection()
+        waits.wait_for(self.driver, "tagAddModal")
+        self.click("addTag")
+        self.answer_prompt(", ".join(tags))
+        self.click("doneButton")
+        waits.wait_for_gone(self.driver, "tagAddModal")
+
+
+class RightSidebar(Sidebar):
+    """Assistants tab: assistants, prompt templates and their folders"""
+
+    TAB = "Assistants"
+    ITEM_CONTAINER = "promptEncompass"
+    NAME_IDS = ("assistantName", "promptName")
+
+    def create_prompt(self, name, content=""):
+        self.create_prompts([name], content)
+
+    def create_prompts(self, names, content=""):
+        for name in names:
+            self.click("promptButton", "Prompt Template")
+            field = waits.wait_for(self.driver, "promptModalName")
+            field.clear()
+            field.send_keys(name)
+            if content:
+                self.driver.find_element(By.ID, "promptContent").send_keys(content)
+            self.click("confirmationButton", "Save")
+            self.find_named("promptName", name)
+
+    def create_assistant(self, name):
+        self.create_assistants([name])
+
+    def create_assistants(self, names):
+        modal = AssistantModal(self.driver)
+        for name in names:
+            self.click("addAssistantButton")
+            modal.fill(name)
+            modal.save()
+        # New assistants go into the Assistants folder, which may be collapsed
+        self.expand_folder("Assistants")
+        self.find_all_named("assistantName", names, timeout=30)
+
+
+class ChatPane(Page):
+    """The conversation in the middle of the screen"""
+
+    def send_message(self, message, chat=None, wait=True):
+        """Send ``message`` (to ``chat`` if given) and return the AssistantReply"""
+        if chat is not None:
+            LeftSidebar(self.driver).open_chat(chat)
+        waits.wait_for(self.driver, "messageChatInputText").send_keys(message)
+        self.click("sendMessage")
+        if not wait:
+            return None
+        reply = waits.wait_for_assistant_reply(self.driver)
+        timing.recorder.record_reply(reply)
+        return reply
+
+    def send_messages(self, messages, chat=None):
+        """Send each message after the previous reply finished, return the replies"""
+        if chat is not None:
+            LeftSidebar(self.driver).open_chat(chat)
+        return [self.send_message(message) for message in messages]
+
+
+class AssistantModal(Page):
+    """The assistant editor opened by addAssistantButton or an assistant's Edit"""
+
+    def fill(self, name=None, description=None, instructions=None):
+        if name is not None:
+            field = waits.wait_for(self.driver, "assistantNameInput")
+            field.clear()
+            field.send_keys(name)
+        if description is not None:
+            field = waits.wait_for(self.driver, "assistantDescription")
+            field.clear()
+            field.send_keys(description)
+        if instructions is not None:
+            field = waits.wait_for(self.driver, "assistantInstructions")
+            field.clear()
+            field.send_keys(instructions)
+
+    def save(self):
+        self.click("confirmationButton", "Save")
+        waits.wait_for_gone(self.driver, "assistantNameInput", timeout=30)
+
+
+class UserMenuModal(Page):
+    """A modal opened from the user menu; ENTRY is the id of its menu item"""
+
+    ENTRY = None
+    TITLE = None
+
+    def open(self, tab=None):
+        self.click("userMenu")
+        self.click(self.ENTRY)
+        if self.TITLE:
+            waits.wait_for_text(self.driver, "modalTitle", self.TITLE, timeout=30)
+        else:
+            waits.wait_for(self.driver, "tabName", timeout=30)
+        if tab is not None:
+            self.select_tab(tab)
+        return self
+
+    def select_tab(self, name):
+        self.click("tabName", name, timeout=30)
+
+
+class AdminModal(UserMenuModal):
+    """Admin interface, e.g. ``self.admin_modal.open("Feature Flags")``"""
+
+    ENTRY = "adminInterface"
+
+
+class SettingsModal(UserMenuModal):
+    ENTRY = "settingsInterface"
+    TITLE = "Settings"
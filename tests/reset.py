@@ -0,0 +1,205 @@
+"""Clear the test user's chats, folders, prompts and assistants in one step.
+
+The delete_all_* helpers used to open promptHandler, click Delete, tick
+selectAllCheck and confirm, sleeping between every step. ``reset`` does the
+same at the storage and API level instead:
+
+- conversations, folders and prompts are emptied in the app's IndexedDB store
+  (see tests/seeding.py); conversations kept in the cloud are deleted with
+  the /state/conversation/delete_multiple op the app uses
+- assistants found locally or through /assistant/list are deleted in parallel
+  with the /assistant/delete op; system and group assistants are left alone
+
+Both ops go through /api/requestOp with the browser's session, exactly as
+services/doRequestOp.ts sends them. After one reload the storage is checked
+for anything that survived, and the test fails with the leftovers if so.
+"""
+
+import time
+
+KINDS = ("conversations", "folders", "prompts", "assistants")
+
+# Folders the app creates on every load (see pages/api/home/home.tsx)
+BASE_FOLDER_IDS = ("assistants", "layered_assistants")
+
+_STORAGE_JS = """
+const MIGRATION_KEY = '__indexeddb_migration_status__';
+const openDb = () => new Promise((resolve, reject) => {
+    const request = indexedDB.open('ChatUIStorage', 1);
+    request.onupgradeneeded = () => {
+        if (!request.result.objectStoreNames.contains('keyvalue')) {
+            request.result.createObjectStore('keyvalue', {keyPath: 'key'});
+        }
+    };
+    request.onsuccess = () => resolve(request.result);
+    request.onerror = () => reject(request.error);
+});
+const parse = (raw) => { try { return JSON.parse(raw || 'null'); } catch (e) { return null; } };
+const readStorage = async (db) => {
+    const values = await new Promise((resolve) => {
+        const tx = db.transaction(['keyvalue'], 'readonly');
+        const store = tx.objectStore('keyvalue');
+        const found = {};
+        for (const key of [MIGRATION_KEY, 'conversationHistory', 'folders', 'prompts']) {
+            const get = store.get(key);
+            get.onsuccess = () => { found[key] = get.result ? get.result.value : null; };
+        }
+        tx.oncomplete = () => resolve(found);
+    });
+    const migrated = parse(values[MIGRATION_KEY]) || [];
+    // Keys storage.ts has not migrated yet are still in localStorage
+    const load = (key) => parse(migrated.includes(key) ? values[key] : localStorage.getItem(key)) || [];
+    return {
+        migrated: migrated,
+        conversations: load('conversationHistory'),
+        folders: load('folders'),
+        prompts: load('prompts'),
+    };
+};
+const definition = (prompt) => prompt.data && prompt.data.assistant ? prompt.data.assistant.definition || {} : null;
+const isSystem = (def) => ((def && def.tags) || []).includes('amplify:system');
+"""
+
+# services/doRequestOp.ts: an op sent through /api/requestOp with the browser's session
+REQUEST_OP_JS = """
+const encode = (data) => btoa(unescape(encodeURIComponent(JSON.stringify(data))));
+const decode = (data) => JSON.parse(decodeURIComponent(escape(atob(data))));
+const requestOp = async (op) => {
+    const body = {...op};
+    if (op.data) body.data = encode(op.data);
+    try {
+        const response = await fetch('/api/requestOp', {
+            method: 'POST',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify({data: body}),
+        });
+        if (!response.ok) return {success: false, message: response.statusText};
+        return decode((await response.json()).data);
+    } catch (e) {
+        return {success: false, message: String(e)};
+    }
+};
+"""
+
+_RESET_JS = _STORAGE_JS + REQUEST_OP_JS + """
+const [kinds, done] = [arguments[0], arguments[arguments.length - 1]];
+
+(async () => {
+    const db = await openDb();
+    const state = await readStorage(db);
+    const result = {conversations: 0, folders: 0, prompts: 0, assistants: 0, failed: []};
+    const writes = {};
+    const pending = [];
+
+    if (kinds.includes('conversations')) {
+        const remote = state.conversations.filter((c) => c.isLocal === false).map((c) => c.id);
+        if (remote.length) {
+            pending.push(requestOp({
+                method: 'POST', path: '/state/conversation', op: '/delete_multiple',
+                data: {conversationIds: remote}, service: 'conversation',
+            }).then((r) => { if (!r.success) result.failed.push(`cloud conversations: ${r.message}`); }));
+        }
+        writes.conversationHistory = [];
+        result.conversations = state.conversations.length;
+    }
+    if (kinds.includes('folders')) {
+        writes.folders = [];
+        result.folders = state.folders.length;
+    }
+
+    let prompts = state.prompts;
+    if (kinds.includes('assistants')) {
+        const ids = new Set();
+        for (const prompt of prompts) {
+            const def = definition(prompt);
+            if (def && def.assistantId && !prompt.data.noDelete && !isSystem(def) && !prompt.groupId) {
+                ids.add(def.assistantId);
+            }
+        }
+        const listed = await requestOp({method: 'GET', path: '/assistant', op: '/list', service: 'assistant'});
+        for (const def of (listed.success && Array.isArray(listed.data) ? listed.data : [])) {
+            if (def.assistantId && !isSystem(def) && !def.groupId) ids.add(def.assistantId);
+        }
+        for (const id of ids) {
+            pending.push(requestOp({
+                method: 'POST', path: '/assistant', op: '/delete', data: {assistantId: id}, service: 'assistant',
+            }).then((r) => { if (!r.success) result.failed.push(`assistant ${id}: ${r.message || 'not deleted'}`); }));
+        }
+        result.assistants = ids.size;
+        prompts = prompts.filter((p) => !definition(p) || isSystem(definition(p)) || p.groupId);
+    }
+    if (kinds.includes('prompts')) {
+        prompts = prompts.filter((p) => definition(p));
+    }
+    if (prompts.length !== state.prompts.length) {
+        writes.prompts = prompts;
+        result.prompts = state.prompts.length - prompts.length;
+    }
+
+    await Promise.all(pending);
+    await new Promise((resolve, reject) => {
+        const tx = db.transaction(['keyvalue'], 'readwrite');
+        const store = tx.objectStore('keyvalue');
+        const migrated = [...state.migrated];
+        for (const [key, value] of Object.entries(writes)) {
+            store.put({key: key, value: JSON.stringify(value)});
+            localStorage.removeItem(key);
+            if (!migrated.includes(key)) migrated.push(key);
+        }
+        if (writes.conversationHistory) {
+            store.delete('selectedConversation');
+            localStorage.removeItem('selectedConversation');
+        }
+        store.put({key: MIGRATION_KEY, value: JSON.stringify(migrated)});
+        tx.oncomplete = resolve;
+        tx.onerror = () => reject(tx.error);
+    });
+    done(result);
+})().catch((e) => done({error: String(e)}));
+"""
+
+# Everything in storage that reset() should have removed. On load the app adds
+# one empty "New Conversation", today's folder and its base folders back.
+_LEFTOVERS_JS = _STORAGE_JS + """
+const [kinds, baseFolderIds, done] = [arguments[0], arguments[1], arguments[arguments.length - 1]];
+const datePattern = /^(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec) \\d{1,2}, \\d{4}$/;
+(async () => {
+    const state = await readStorage(await openDb());
+    const left = [];
+    if (kinds.includes('conversations')) {
+        for (const c of state.conversations) {
+            const empty = !(c.messages && c.messages.length) && !(c.compressedMessages && c.compressedMessages.length);
+            if (!empty || c.name !== 'New Conversation') left.push(`conversation ${c.name}`);
+        }
+    }
+    if (kinds.includes('folders')) {
+        for (const f of state.folders) {
+            if (!baseFolderIds.includes(f.id) && !f.isGroupFolder && !datePattern.test(f.name)) left.push(`folder ${f.name}`);
+        }
+    }
+    for (const p of state.prompts) {
+        const def = definition(p);
+        if (def && kinds.includes('assistants') && !isSystem(def) && !p.groupId) left.push(`assistant ${p.name}`);
+        if (!def && kinds.includes('prompts')) left.push(`prompt ${p.name}`);
+    }
+    done(left);
+})().catch((e) => done([`could not read storage: ${e}`]));
+"""
+
+
+def reset(driver, kinds=KINDS):
+    """Delete the given kinds of items without reloading; returns what was removed"""
+    unknown = set(kinds) - set(KINDS)
+    if unknown:
+        raise ValueError(f"Unknown kinds to reset: {sorted(unknown)}")
+    started = time.perf_counter()
+    result = driver.execute_async_script(_RESET_JS, list(kinds))
+    if "error" in result:
+        raise RuntimeError(f"Resetting client state failed: {result['error']}")
+    result["seconds"] = round(time.perf_counter() - started, 3)
+    return result
+
+
+def leftovers(driver, kinds=KINDS):
+    """Describe every item of the given kinds still in storage (empty when clean)"""
+    return driver.execute_async_script(_LEFTOVERS_JS, list(kinds), list(BASE_FOLDER_IDS))
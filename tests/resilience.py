@@ -0,0 +1,167 @@
+"""How responsive the chat UI stays when the backends are slow or failing.
+
+The mock servers (tests/mocks) can inject latency, errors, bandwidth caps
+and dropped streams per route, see tests/mocks/faults.py. ``measure_send``
+sends one message under whatever profile is active and records:
+
+    interactive_seconds   send click until messageChatInputText is enabled and nothing streams
+    first_text_seconds    send click until the reply shows any text (None if it never did)
+    kept_chars            characters of the reply the UI kept
+    reply_chars           characters the chat mock meant to send
+    kept                  kept_chars / reply_chars, how much of a cut off message survived
+
+ChatTests/test_Resilience.py runs it once per profile in
+AMPLIFY_RESILIENCE_PROFILES (default BENCHMARK_PROFILES). Set
+AMPLIFY_RESILIENCE_REPORT to a path to append every measurement as a JSON
+line, then compare the profiles with:
+
+    python3 -m tests.resilience resilience.jsonl
+"""
+
+import json
+import os
+import sys
+import time
+
+from selenium.common.exceptions import NoAlertPresentException, UnexpectedAlertPresentException
+
+from tests import waits
+
+BENCHMARK_PROFILES = ["none", "slow-state", "slow-chat", "dropped-stream", "chat-errors", "narrow-link"]
+
+# Every measurement made by this process, see record_result()
+results = []
+
+# Text of the reply to the last user message (as the app stored it, before
+# markdown), and whether the UI still blocks input
+_UI_STATE_JS = """
+const users = document.querySelectorAll('[id^="userMessage"]');
+const replies = document.querySelectorAll('[id^="assistantMessage"]');
+const lastUser = users[users.length - 1];
+const last = replies[replies.length - 1];
+let text = '';
+if (last && lastUser && (lastUser.compareDocumentPosition(last) & Node.DOCUMENT_POSITION_FOLLOWING)) {
+    const block = last.querySelector('[data-original-content]');
+    text = block ? block.getAttribute('data-original-content') : last.innerText;
+}
+const input = document.getElementById('messageChatInputText');
+const send = document.getElementById('sendMessage');
+const busy = !!document.getElementById('stopGenerating')
+    || !!(send && send.querySelector('.animate-spin'))
+    || !input || input.disabled || input.readOnly;
+return [text || '', busy];
+"""
+
+
+def benchmark_profiles():
+    configured = os.getenv("AMPLIFY_RESILIENCE_PROFILES", "")
+    return [p.strip() for p in configured.split(",") if p.strip()] or BENCHMARK_PROFILES
+
+
+class _Interactive:
+    """Condition that holds once the UI accepts input again after a send"""
+
+    def __init__(self, sent_at, quiet):
+        self.sent_at = sent_at
+        self.quiet = quiet
+        self.first_text_at = None
+        self.text = ""
+        self.started = False
+        self.idle_since = None
+
+    def __call__(self, driver):
+        try:
+            text, busy = driver.execute_script(_UI_STATE_JS)
+        except UnexpectedAlertPresentException:
+            # Errors can surface as alerts; they block the UI until dismissed
+            try:
+                driver.switch_to.alert.accept()
+            except NoAlertPresentException:
+                pass
+            return False
+        now = time.monotonic()
+        if text and self.first_text_at is None:
+            self.first_text_at = now
+        self.started = self.started or busy or bool(text)
+        # Right after the click the UI may not have switched to busy yet
+        waiting_to_start = not self.started and now - self.sent_at < 2
+        if busy or text != self.text or waiting_to_start:
+            self.text = text
+            self.idle_since = None
+            return False
+        if self.idle_since is None:
+            self.idle_since = now
+        # Idle for ``quiet`` seconds, counted from when it became idle
+        return now - self.idle_since >= self.quiet and self.idle_since
+
+
+def measure_send(driver, message, quiet=1.0, timeout=120):
+    """Send ``message`` and measure how long until the chat is usable again"""
+    waits.wait_for(driver, "messageChatInputText").send_keys(message)
+    waits.wait_for_clickable(driver, "sendMessage")
+    sent_at = time.monotonic()
+    driver.find_element("id", "sendMessage").click()
+    watcher = _Interactive(sent_at, quiet)
+    interactive_at = waits.poll(driver, timeout).until(
+        watcher, f"The chat input was not usable again within {timeout}s"
+    )
+    return {
+        "interactive_seconds": round(interactive_at - sent_at, 3),
+        "first_text_seconds": round(watcher.first_text_at - sent_at, 3) if watcher.first_text_at else None,
+        "kept_chars": len(watcher.text),
+    }
+
+
+def record_result(profile, result, reply_chars=None):
+    """Store a measure_send result; ``reply_chars`` is the length of the reply the mock sent"""
+    kept = result["kept_chars"]
+    record = {
+        "profile": profile,
+        **result,
+        "reply_chars": reply_chars,
+        "kept": round(min(kept / reply_chars, 1.0), 3) if reply_chars else None,
+    }
+    results.append(record)
+    print(
+        f"[{profile}] interactive after {record['interactive_seconds']:.2f}s, "
+        f"kept {record['kept_chars']}/{record['reply_chars'] or '?'} chars"
+    )
+
+    report_path = os.getenv("AMPLIFY_RESILIENCE_REPORT")
+    if report_path:
+        with open(report_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+    return record
+
+
+def summarize(records):
+    """Aggregate measurements per profile"""
+    by_profile = {}
+    for record in records:
+        by_profile.setdefault(record["profile"], []).append(record)
+
+    summary = {}
+    for profile, items in by_profile.items():
+        interactive = sorted(r["interactive_seconds"] for r in items)
+        kept = [r["kept"] for r in items if r["kept"] is not None]
+        summary[profile] = {
+            "sends": len(items),
+            "median_interactive_seconds": interactive[len(interactive) // 2],
+            "max_interactive_seconds": interactive[-1],
+            "mean_kept": round(sum(kept) / len(kept), 3) if kept else None,
+        }
+    return summary
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Usage: python3 -m tests.resilience <resilience_report.jsonl>")
+        sys.exit(1)
+    with open(sys.argv[1], encoding="utf-8") as f:
+        loaded = [json.loads(line) for line in f if line.strip()]
+    print(f"{'profile':<16} {'sends':>6} {'median s':>9} {'max s':>7} {'kept':>6}")
+    for profile, stats in summarize(loaded).items():
+        print(
+            f"{profile:<16} {stats['sends']:>6} {stats['median_interactive_seconds']:>9} "
+            f"{stats['max_interactive_seconds']:>7} {stats['mean_kept'] if stats['mean_kept'] is not None else '-':>6}"
+        )
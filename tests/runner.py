@@ -0,0 +1,520 @@
+"""Parallel runner for the Selenium test suite.
+
+Distributes test classes across a pool of worker processes. Every worker gets
+its own copy of the ``chrome_profile`` directory (and therefore its own Chrome
+instance), and the results of all workers are merged into a single report.
+
+Run it from the project root with the same case numbers as test_all_files.sh:
+
+    python3 -m tests.runner 1 --workers 4 --report test_results.json
+
+To split the suite across machines, run ``--shard i/n`` on each of them and
+merge the reports afterwards, see tests/sharding.py. ``--changed-since REF``
+only runs the tests affected by a frontend change, see tests/impact.py.
+``--mocks chat`` serves local stand-ins for the backends, see tests/mocks.
+"""
+
+import argparse
+import ast
+import json
+import multiprocessing
+import os
+import queue
+import shutil
+import sys
+import tempfile
+import time
+import traceback
+import unittest
+
+from tests import durations, sharding
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_DIR = os.path.dirname(TESTS_DIR)
+PROFILE_DIR = os.path.join(TESTS_DIR, "chrome_profile")
+
+# Same case numbers as test_all_files.sh; None means every folder
+CASES = {
+    1: None,
+    2: "AmplifyHelperTests",
+    3: "ChatTests",
+    4: "ConversationsTests",
+    5: "CustomInstructionsTests",
+    6: "LeftSidebarTests",
+    7: "ModalTests",
+    8: "RightSidebarTests",
+    9: "TabTests",
+}
+
+
+# ----------------- Discovery -----------------
+def discover(folder=None):
+    """Find every test class under tests/ (or tests/<folder>) without importing it.
+
+    Returns a list of work units: dicts with the dotted class ``id``, the
+    project-relative ``file`` and the ``methods`` defined on the class.
+    """
+    root = os.path.join(TESTS_DIR, folder) if folder else TESTS_DIR
+    units = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith((".", "__")))
+        for filename in sorted(filenames):
+            if not (filename.startswith("test_") and filename.endswith(".py")):
+                continue
+            path = os.path.join(dirpath, filename)
+            units.extend(_classes_in_file(path))
+    return units
+
+
+def _classes_in_file(path):
+    rel_path = os.path.relpath(path, PROJECT_DIR)
+    module = rel_path[: -len(".py")].replace(os.sep, ".")
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+
+    units = []
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        methods = [
+            item.name
+            for item in node.body
+            if isinstance(item, ast.FunctionDef) and item.name.startswith("test")
+        ]
+        if methods:
+            units.append(
+                {"id": f"{module}.{node.name}", "file": rel_path, "methods": methods}
+            )
+    return units
+
+
+# ----------------- Worker -----------------
+class RecordingResult(unittest.TestResult):
+    """TestResult that keeps one JSON-friendly record per test."""
+
+    def __init__(self, worker):
+        super().__init__()
+        self.buffer = True  # Keep interleaved worker output readable
+        self.worker = worker
+        self.records = []
+        self._started = {}
+
+    def startTest(self, test):
+        super().startTest(test)
+        self._started[test.id()] = time.time()
+
+    def _record(self, test, status, message=""):
+        started = self._started.pop(test.id(), time.time())
+        record = {
+            "id": test.id(),
+            "status": status,
+            "duration": round(time.time() - started, 3),
+            "worker": self.worker,
+            "message": message,
+        }
+        # Set by BaseTest when the test had to start its own Chrome
+        if getattr(test, "driver_startup", None) is not None:
+            record["driver_startup"] = round(test.driver_startup, 3)
+        self.records.append(record)
+        print(f"[worker {self.worker}] {status.upper()} {record['id']} ({record['duration']}s)")
+
+    def addSuccess(self, test):
+        super().addSuccess(test)
+        self._record(test, "passed")
+
+    def addFailure(self, test, err):
+        super().addFailure(test, err)
+        self._record(test, "failed", self.failures[-1][1])
+
+    def addError(self, test, err):
+        super().addError(test, err)
+        # setUpClass/tearDownClass errors arrive as _ErrorHolder objects
+        self._record(test, "error", self.errors[-1][1])
+
+    def addSkip(self, test, reason):
+        super().addSkip(test, reason)
+        self._record(test, "skipped", reason)
+
+    def addExpectedFailure(self, test, err):
+        super().addExpectedFailure(test, err)
+        self._record(test, "passed")
+
+    def addUnexpectedSuccess(self, test):
+        super().addUnexpectedSuccess(test)
+        self._record(test, "failed", "Unexpected success")
+
+
+def run_unit(unit, worker):
+    """Run one work unit (a test class) in the current process."""
+    loader = unittest.TestLoader()
+    result = RecordingResult(worker)
+    try:
+        suite = loader.loadTestsFromNames(
+            [f"{unit['id']}.{method}" for method in unit["methods"]]
+        )
+        suite.run(result)
+    except Exception:
+        result.records.append(
+            {
+                "id": unit["id"],
+                "status": "error",
+                "duration": 0.0,
+                "worker": worker,
+                "message": traceback.format_exc(),
+            }
+        )
+    return result.records
+
+
+def _prepare_profile(worker):
+    """Copy the shared chrome_profile into a private directory for this worker."""
+    workdir = tempfile.mkdtemp(prefix=f"amplify-worker{worker}-")
+    profile = os.path.join(workdir, "chrome_profile")
+    if os.path.isdir(PROFILE_DIR):
+        # Singleton* files are Chrome's lock files and must not be shared
+        shutil.copytree(
+            PROFILE_DIR, profile, symlinks=True, ignore=shutil.ignore_patterns("Singleton*")
+        )
+    else:
+        os.makedirs(profile)
+    return workdir, profile
+
+
+def _worker_main(worker, work_queue, result_queue):
+    if PROJECT_DIR not in sys.path:
+        sys.path.insert(0, PROJECT_DIR)
+    workdir, profile = _prepare_profile(worker)
+    os.environ["AMPLIFY_TEST_WORKER"] = str(worker)
+    os.environ["AMPLIFY_CHROME_PROFILE"] = profile
+    if os.getenv("AMPLIFY_MOCK_OIDC_URL"):
+        from tests.mocks import oidc
+
+        # Every worker logs in as its own user, see tests/mocks/oidc.py
+        os.environ["AMPLIFY_TEST_USER"] = oidc.worker_user(worker)
+    try:
+        while True:
+            unit = work_queue.get()
+            if unit is None:
+                break
+            result_queue.put((unit["id"], run_unit(unit, worker)))
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+# ----------------- Scheduling -----------------
+def run_parallel(units, workers):
+    """Run work units on ``workers`` processes and return the merged records."""
+    ctx = multiprocessing.get_context("spawn")
+    work_queue = ctx.Queue()
+    result_queue = ctx.Queue()
+    for unit in units:
+        work_queue.put(unit)
+
+    for _ in range(workers):
+        work_queue.put(None)
+
+    processes = [
+        ctx.Process(target=_worker_main, args=(i, work_queue, result_queue), daemon=True)
+        for i in range(workers)
+    ]
+    for process in processes:
+        process.start()
+
+    records = []
+    pending = {unit["id"] for unit in units}
+    while pending:
+        try:
+            unit_id, unit_records = result_queue.get(timeout=5)
+        except queue.Empty:
+            if not any(process.is_alive() for process in processes):
+                break
+            continue
+        pending.discard(unit_id)
+        records.extend(unit_records)
+
+    for process in processes:
+        process.join(timeout=10)
+
+    # A worker that crashed (e.g. Chrome took the process down) loses its unit
+    for unit_id in sorted(pending):
+        records.append(
+            {
+                "id": unit_id,
+                "status": "error",
+                "duration": 0.0,
+                "worker": None,
+                "message": "Worker process exited before reporting results",
+            }
+        )
+    return records
+
+
+# ----------------- Reporting -----------------
+def summarize(records):
+    summary = {"passed": 0, "failed": 0, "error": 0, "skipped": 0}
+    for record in records:
+        summary[record["status"]] = summary.get(record["status"], 0) + 1
+    summary["total"] = len(records)
+
+    startups = [r["driver_startup"] for r in records if "driver_startup" in r]
+    if startups:
+        summary["driver_startups"] = len(startups)
+        summary["driver_startup_mean"] = round(sum(startups) / len(startups), 3)
+        summary["driver_startup_max"] = round(max(startups), 3)
+    return summary
+
+
+def build_report(records, started, workers, case):
+    return {
+        "case": case,
+        "workers": workers,
+        "started": started,
+        "duration": round(time.time() - started, 3),
+        "summary": summarize(records),
+        "tests": sorted(records, key=lambda r: r["id"]),
+    }
+
+
+def print_report(report):
+    for record in report["tests"]:
+        if record["status"] in ("failed", "error"):
+            print("=" * 70)
+            print(f"{record['status'].upper()}: {record['id']}")
+            print("-" * 70)
+            print(record["message"])
+
+    summary = report["summary"]
+    print("-" * 70)
+    print(
+        f"Ran {summary['total']} tests in {report['duration']}s "
+        f"on {report['workers']} workers: {summary['passed']} passed, "
+        f"{summary['failed']} failed, {summary['error']} errors, "
+        f"{summary['skipped']} skipped"
+    )
+    if "driver_startups" in summary:
+        print(
+            f"Started Chrome {summary['driver_startups']} times: "
+            f"mean {summary['driver_startup_mean']}s, max {summary['driver_startup_max']}s"
+        )
+
+
+def write_timing_report(timing_dir, path, top):
+    from tests import timing
+
+    events = timing.load_events(timing_dir)
+    shutil.rmtree(timing_dir, ignore_errors=True)
+    if not events:
+        return
+    summary = timing.write_report(events, path, top)
+    print(timing.format_summary(summary))
+    print(f"Timing report written to {path}")
+
+
+def check_locators(units, mode):
+    """Drop the tests that use ids the frontend does not define.
+
+    Returns the units left to run and a failed record for every dropped test,
+    so one stale id fails the tests using it instead of the whole run.
+    """
+    if mode == "off":
+        return units, []
+    from tests import locators
+
+    started = time.time()
+    paths = sorted({os.path.join(PROJECT_DIR, unit["file"]) for unit in units})
+    index = locators.build_index()
+    stale = locators.stale_locators(paths, index)
+    if not stale:
+        print(f"Checked element ids of {len(paths)} test files in {time.time() - started:.1f}s")
+        return units, []
+    print(locators.format_stale(stale))
+    if mode == "warn":
+        return units, []
+
+    stale_tests = locators.stale_tests(paths, index)
+    runnable, records = [], []
+    for unit in units:
+        methods = []
+        for method in unit["methods"]:
+            test_id = f"{unit['id']}.{method}"
+            if test_id not in stale_tests:
+                methods.append(method)
+                continue
+            records.append(
+                {
+                    "id": test_id,
+                    "status": "failed",
+                    "duration": 0.0,
+                    "worker": None,
+                    "message": "Uses element ids the frontend does not define: "
+                    + ", ".join(repr(value) for value in stale_tests[test_id]),
+                }
+            )
+        if methods:
+            runnable.append({**unit, "methods": methods})
+    print(
+        f"Failing {len(records)} tests that use these ids without running them "
+        "(pass --locator-check warn to run them anyway)"
+    )
+    return runnable, records
+
+
+def resolve_chromedriver():
+    """Resolve chromedriver once and share the path with every worker"""
+    try:
+        from tests import driver_factory
+
+        path = driver_factory.resolve_driver_path()
+    except Exception as e:
+        print(f"Could not resolve chromedriver up front, workers will retry: {e}")
+        return
+    os.environ["CHROMEDRIVER_PATH"] = path
+    print(f"Using chromedriver {path} (resolved in {driver_factory.resolve_time:.2f}s)")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run the Selenium suite in parallel.")
+    parser.add_argument(
+        "case",
+        type=int,
+        choices=sorted(CASES),
+        help="Case number, same as test_all_files.sh (1 runs every folder)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.getenv("TEST_WORKERS", "2")),
+        help="Number of worker processes, each with its own Chrome (default: 2)",
+    )
+    parser.add_argument(
+        "--session",
+        choices=("test", "class", "worker"),
+        default=os.getenv("AMPLIFY_SESSION_MODE", "test"),
+        help="Browser lifetime: a new one per test (default), per class or per worker",
+    )
+    parser.add_argument(
+        "--locator-check",
+        choices=("fail", "warn", "off"),
+        default=os.getenv("AMPLIFY_LOCATOR_CHECK", "fail"),
+        help="What to do when a test uses an element id the frontend no longer defines",
+    )
+    parser.add_argument(
+        "--changed-since",
+        metavar="REF",
+        help="Only run the tests affected by changes since this git ref (e.g. origin/main)",
+    )
+    parser.add_argument(
+        "--shard",
+        help="Only run shard i of n (e.g. 2/4), split by recorded durations",
+    )
+    parser.add_argument(
+        "--mocks",
+        default=os.getenv("AMPLIFY_MOCKS", ""),
+        help="Comma separated local backends to run for the whole run, e.g. chat,backend,oidc,storage (see tests/mocks)",
+    )
+    parser.add_argument("--report", help="Write the merged JSON report to this path")
+    parser.add_argument(
+        "--timing-report",
+        default="test_timings.json",
+        help="Write the per-step timing report to this path (default: test_timings.json)",
+    )
+    parser.add_argument(
+        "--top", type=int, default=15, help="Rows per table in the time sink summary"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    shard = None
+    if args.shard:
+        try:
+            shard = sharding.parse_shard(args.shard)
+        except ValueError as e:
+            print(e)
+            return 2
+    os.environ.setdefault("ENV_FILE", os.path.join(PROJECT_DIR, ".env.local"))
+    # Workers inherit the environment, BaseTest reads the mode from it
+    os.environ["AMPLIFY_SESSION_MODE"] = args.session
+    resolve_chromedriver()
+
+    units = discover(CASES[args.case])
+    if not units:
+        print("No tests found.")
+        return 1
+    if args.changed_since:
+        from tests import impact
+
+        units = impact.select_units(units, args.changed_since)
+        if not units:
+            print(f"No tests are affected by the changes since {args.changed_since}.")
+            return 0
+
+    estimator = durations.Estimator()
+    # Every test of the run, before the split, so a merge can find tests no shard ran
+    suite = [f"{unit['id']}.{method}" for unit in units for method in unit["methods"]]
+    if shard:
+        index, count = shard
+        units = sharding.select(units, index, count, estimator)
+        print(
+            f"Shard {index}/{count}: {len(units)} test classes, "
+            f"estimated {sum(estimator.unit(unit) for unit in units):.0f}s"
+        )
+        if not units:
+            print("Nothing to run in this shard.")
+
+    units, stale_records = check_locators(units, args.locator_check)
+    workers = max(1, min(args.workers, len(units)))
+
+    # Started before the workers so they inherit the AMPLIFY_MOCK_*_URL variables
+    servers = []
+    if args.mocks:
+        from tests import mocks
+
+        servers = mocks.start(name.strip() for name in args.mocks.split(",") if name.strip())
+
+    # Longest classes first, so no worker picks up a slow class at the very end
+    units = durations.longest_first(units, estimator)
+    print(
+        f"Running {len(units)} test classes on {workers} workers "
+        f"(estimated {durations.simulate_makespan(units, workers, estimator):.0f}s)..."
+    )
+
+    # Workers append their per-step timings here, see tests/timing.py
+    timing_dir = tempfile.mkdtemp(prefix="amplify-timings-")
+    os.environ["AMPLIFY_TIMING_DIR"] = timing_dir
+
+    started = time.time()
+    try:
+        records = stale_records + (run_parallel(units, workers) if units else [])
+    finally:
+        for server in servers:
+            server.stop()
+    report = build_report(records, started, workers, args.case)
+    if shard:
+        report["shard"] = {
+            "index": shard[0],
+            "count": shard[1],
+            "estimate": round(sum(estimator.unit(unit) for unit in units), 1),
+            "suite": suite,
+        }
+    print_report(report)
+    if shard:
+        # The other shards may still be computing their split from the same
+        # database; record once for all of them with ``sharding merge --record``
+        print("Not recording durations for a shard, see tests.sharding merge --record")
+    else:
+        durations.record(records)
+    write_timing_report(timing_dir, args.timing_report, args.top)
+
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {args.report}")
+
+    summary = report["summary"]
+    return 0 if summary["failed"] == 0 and summary["error"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
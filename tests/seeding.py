@@ -0,0 +1,175 @@
+"""Seed conversations, folders and prompts straight into the app's client storage.
+
+Creating a chat through the UI (New Chat, rename, confirm) takes about ten
+seconds; tests that only need existing chats, folders or prompts as a
+starting point can write them into storage in one batch and reload once:
+
+    self.seed(
+        folders=[seeding.folder("Pokemon")],
+        conversations=[
+            seeding.conversation("Kukui"),
+            seeding.conversation("Accerola", folder="Pokemon", tags=["league"]),
+        ],
+        prompts=[seeding.prompt("Greeting", content="Say hi to {{name}}")],
+    )
+
+The app keeps these lists in IndexedDB (ChatUIStorage/keyvalue, see
+utils/app/storage.ts) under "conversationHistory", "folders" and "prompts",
+and reads them once on load in pages/api/home/home.tsx. Seeding appends to
+whatever is there (or replaces it with ``replace=True``), so UI-driven
+creation stays only in the tests that test creating things.
+
+Conversations without a folder go into today's date folder, like New Chat.
+Assistants are created by the backend, so they are not seeded here.
+"""
+
+import datetime
+import uuid
+
+TODAY = object()  # Folder marker for today's date folder, which New Chat uses
+
+# Merges the seeded items into IndexedDB. Values that storage.ts has not yet
+# migrated are still in localStorage, so those are read from there and moved.
+_SEED_JS = """
+const [seed, replace, done] = [arguments[0], arguments[1], arguments[arguments.length - 1]];
+const MIGRATION_KEY = '__indexeddb_migration_status__';
+const KEYS = ['conversationHistory', 'folders', 'prompts'];
+
+const request = indexedDB.open('ChatUIStorage', 1);
+request.onupgradeneeded = () => {
+    if (!request.result.objectStoreNames.contains('keyvalue')) {
+        request.result.createObjectStore('keyvalue', {keyPath: 'key'});
+    }
+};
+request.onerror = () => done({error: String(request.error)});
+request.onsuccess = () => {
+    const db = request.result;
+    const tx = db.transaction(['keyvalue'], 'readwrite');
+    const store = tx.objectStore('keyvalue');
+    const values = {};
+    let saved = null;
+    let remaining = KEYS.length + 1;
+    // Plain callbacks, the transaction must not go idle between reading and writing
+    for (const key of [MIGRATION_KEY, ...KEYS]) {
+        const get = store.get(key);
+        get.onsuccess = () => {
+            values[key] = get.result ? get.result.value : null;
+            if (--remaining === 0) write();
+        };
+    }
+    const write = () => {
+        let migrated = [];
+        try { migrated = JSON.parse(values[MIGRATION_KEY] || '[]'); } catch (e) {}
+        const load = (key) => {
+            const raw = migrated.includes(key) ? values[key] : localStorage.getItem(key);
+            try { return replace ? [] : JSON.parse(raw || '[]'); } catch (e) { return []; }
+        };
+        const conversations = load('conversationHistory');
+        const folders = load('folders');
+        const prompts = load('prompts');
+
+        const today = new Date().toLocaleDateString('en-US', {month: 'short', day: 'numeric', year: 'numeric'});
+        const folderId = (name, type) => {
+            let folder = folders.find((f) => f.name === name && f.type === type);
+            if (!folder) {
+                folder = {id: crypto.randomUUID ? crypto.randomUUID() : `${Date.now()}-${Math.random()}`, date: new Date().toISOString(), name: name, type: type};
+                folders.push(folder);
+            }
+            return folder.id;
+        };
+        folders.push(...seed.folders);
+
+        let model = null;
+        try { model = JSON.parse(localStorage.getItem('defaultModel')); } catch (e) {}
+        model = model || (conversations.length ? conversations[conversations.length - 1].model : null);
+
+        for (const c of seed.conversations) {
+            const {folderName, ...conversation} = c;
+            conversation.folderId = folderName === null ? null : folderId(folderName || today, 'chat');
+            conversation.model = conversation.model || model || {id: '', name: ''};
+            conversations.push(conversation);
+        }
+        for (const p of seed.prompts) {
+            const {folderName, ...prompt} = p;
+            prompt.folderId = folderName ? folderId(folderName, 'prompt') : null;
+            prompts.push(prompt);
+        }
+
+        saved = {conversationHistory: conversations, folders: folders, prompts: prompts};
+        for (const key of KEYS) {
+            store.put({key: key, value: JSON.stringify(saved[key])});
+            localStorage.removeItem(key);
+            if (!migrated.includes(key)) migrated.push(key);
+        }
+        store.put({key: MIGRATION_KEY, value: JSON.stringify(migrated)});
+    };
+    tx.oncomplete = () => done({conversations: saved.conversationHistory.length, folders: saved.folders.length, prompts: saved.prompts.length});
+    tx.onerror = () => done({error: String(tx.error)});
+};
+"""
+
+
+def _id():
+    return str(uuid.uuid4())
+
+
+def message(content, role="user"):
+    return {"role": role, "content": content, "id": _id(), "type": "prompt", "data": {}}
+
+
+def conversation(name, messages=(), folder=TODAY, tags=None, **fields):
+    """A local conversation; ``messages`` are strings (alternating user and
+    assistant, starting with user) or message() dicts. ``folder`` is a chat
+    folder name, None for no folder, or today's folder by default.
+    """
+    built = []
+    for i, item in enumerate(messages):
+        built.append(item if isinstance(item, dict) else message(item, "user" if i % 2 == 0 else "assistant"))
+    return {
+        "id": _id(),
+        "name": name,
+        "messages": built,
+        "prompt": fields.pop("prompt", ""),
+        "temperature": fields.pop("temperature", 1),
+        "folderName": None if folder is None else ("" if folder is TODAY else folder),
+        "promptTemplate": None,
+        "tags": list(tags or []),
+        "isLocal": True,
+        **fields,
+    }
+
+
+def folder(name, type="chat", pinned=False):
+    """A chat ("chat") or prompt ("prompt") folder"""
+    return {"id": _id(), "name": name, "type": type, "pinned": pinned}
+
+
+def prompt(name, content="", description="", folder=None):
+    """A prompt template; ``folder`` is the name of a prompt folder (created if missing)"""
+    return {
+        "id": _id(),
+        "name": name,
+        "description": description,
+        "content": content,
+        "type": "prompt",
+        "folderName": folder,
+    }
+
+
+def seed(driver, conversations=(), folders=(), prompts=(), replace=False):
+    """Write the items into client storage in one transaction, without reloading.
+
+    Returns the resulting number of conversations, folders and prompts.
+    """
+    # Folders sort by date, so seeded ones keep the order they were given in
+    now = datetime.datetime.now(datetime.timezone.utc)
+    dated = [
+        {"date": (now + datetime.timedelta(milliseconds=i)).isoformat(timespec="milliseconds").replace("+00:00", "Z"), **f}
+        for i, f in enumerate(folders)
+    ]
+    payload = {"conversations": list(conversations), "folders": dated, "prompts": list(prompts)}
+    result = driver.execute_async_script(_SEED_JS, payload, replace)
+    if "error" in result:
+        raise RuntimeError(f"Seeding client storage failed: {result['error']}")
+    return result
+
@@ -0,0 +1,111 @@
+"""Login cache shared by every browser in a test run.
+
+After one successful login the cookies and the localStorage/sessionStorage of
+the NEXTAUTH_URL origin are written to a file. New browsers load that file
+instead of going through the identity provider again; BaseTest falls back to
+the full login flow only when the saved session is expired or rejected.
+"""
+
+import contextlib
+import json
+import os
+import re
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process lock, workers may log in twice
+    fcntl = None
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".auth_session.json")
+
+
+def session_path():
+    path = os.getenv("AMPLIFY_SESSION_FILE", DEFAULT_PATH)
+    # Workers logged in as different users (tests/mocks/oidc.py) keep separate sessions
+    user = os.getenv("AMPLIFY_TEST_USER")
+    return f"{path}.{re.sub(r'[^A-Za-z0-9]+', '_', user)}" if user else path
+
+
+@contextlib.contextmanager
+def login_lock():
+    """Serialize logins so parallel workers do not all log in at once"""
+    if fcntl is None:
+        yield
+        return
+    with open(session_path() + ".lock", "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def load_session(origin):
+    """Return the saved session for ``origin``, or None if there is no usable one"""
+    try:
+        with open(session_path(), encoding="utf-8") as f:
+            session = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if session.get("origin") != origin.rstrip("/"):
+        return None
+    return session
+
+
+def save_session(driver, origin):
+    """Capture the cookies and web storage of the current (logged in) page"""
+    session = {
+        "origin": origin.rstrip("/"),
+        "saved_at": time.time(),
+        "cookies": driver.get_cookies(),
+        "localStorage": driver.execute_script(
+            "return Object.assign({}, window.localStorage);"
+        ),
+        "sessionStorage": driver.execute_script(
+            "return Object.assign({}, window.sessionStorage);"
+        ),
+    }
+    # Write atomically, other workers may be reading the file
+    path = session_path()
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(session, f)
+    os.replace(tmp_path, path)
+    return session
+
+
+def clear_session(session=None):
+    """Remove the saved session; with ``session`` only if it was not replaced since"""
+    if session is not None:
+        current = load_session(session["origin"])
+        if current is None or current["saved_at"] != session["saved_at"]:
+            return
+    try:
+        os.remove(session_path())
+    except FileNotFoundError:
+        pass
+
+
+def inject_session(driver, session):
+    """Load a saved session into a browser that is already on the session origin"""
+    now = time.time()
+    for cookie in session["cookies"]:
+        if cookie.get("expiry") and cookie["expiry"] < now:
+            continue
+        driver.add_cookie(cookie)
+
+    driver.execute_script(
+        """
+        const [local, session] = arguments;
+        for (const [key, value] of Object.entries(local)) {
+            window.localStorage.setItem(key, value);
+        }
+        for (const [key, value] of Object.entries(session)) {
+            window.sessionStorage.setItem(key, value);
+        }
+        """,
+        session["localStorage"],
+        session["sessionStorage"],
+    )
+    driver.refresh()
@@ -0,0 +1,218 @@
+"""Split the suite across machines and merge the per-machine results.
+
+``python3 -m tests.runner 1 --shard 2/4`` runs the second of four shards.
+Test classes are assigned to shards longest first, each to the shard with the
+least estimated time so far (see tests/durations.py), so every shard gets
+roughly the same wall time. The assignment only depends on the discovered
+classes and the durations database, so every machine computes the same split
+as long as they share the same database (AMPLIFY_DURATIONS_DB). Shards never
+write to it, ``merge --record`` updates it once every shard finished.
+
+Once every shard finished, combine their reports into one:
+
+    python3 -m tests.sharding merge shard-*.json --output test_results.json \\
+        --timings timings-*.json --timing-output test_timings.json
+"""
+
+import argparse
+import json
+import sys
+
+from tests import durations, timing
+
+
+def parse_shard(value):
+    """Parse "i/n" (1-based) into ``(i, n)``, raising ValueError when invalid"""
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise ValueError(f"Shard must look like i/n, e.g. 1/4, not {value!r}") from None
+    if count < 1 or not 1 <= index <= count:
+        raise ValueError(f"Shard index must be between 1 and {max(count, 1)}, got {value!r}")
+    return index, count
+
+
+def assign(units, count, estimator):
+    """Split work units into ``count`` shards with about the same estimated time.
+
+    Returns a list of ``count`` lists of units. Ties are broken by class id and
+    shard number so the result is the same on every machine.
+    """
+    shards = [[] for _ in range(count)]
+    loads = [0.0] * count
+    for unit in durations.longest_first(units, estimator):
+        index = min(range(count), key=lambda i: (loads[i], i))
+        shards[index].append(unit)
+        loads[index] += estimator.unit(unit)
+    return shards
+
+
+def select(units, index, count, estimator):
+    """Return the units of shard ``index`` (1-based) out of ``count``"""
+    return assign(units, count, estimator)[index - 1]
+
+
+def plan(units, count, estimator):
+    """Describe every shard: its estimated seconds and class ids"""
+    return [
+        {
+            "index": i + 1,
+            "estimate": round(sum(estimator.unit(unit) for unit in shard), 1),
+            "units": [unit["id"] for unit in shard],
+        }
+        for i, shard in enumerate(assign(units, count, estimator))
+    ]
+
+
+# ----------------- Merge -----------------
+def _load(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def merge_reports(reports):
+    """Combine runner reports of the shards of one run into a single report"""
+    from tests import runner
+
+    if not reports:
+        raise ValueError("No reports to merge")
+    counts = {report["shard"]["count"] for report in reports if report.get("shard")}
+    if len(counts) > 1:
+        raise ValueError(f"Reports come from runs with different shard counts: {sorted(counts)}")
+
+    records = []
+    shards = []
+    ran = {}  # test id -> indexes of the shards that reported it
+    suite = set()
+    for report in reports:
+        records.extend(report["tests"])
+        shard = report.get("shard") or {"index": 1, "count": 1}
+        for record in report["tests"]:
+            ran.setdefault(record["id"], set()).add(shard["index"])
+        suite.update(shard.get("suite", ()))
+        shards.append(
+            {
+                "index": shard["index"],
+                "count": shard["count"],
+                "workers": report["workers"],
+                "duration": report["duration"],
+                "estimate": shard.get("estimate"),
+                "summary": report["summary"],
+            }
+        )
+    shards.sort(key=lambda s: s["index"])
+
+    merged = {
+        "case": reports[0]["case"],
+        "workers": sum(report["workers"] for report in reports),
+        "started": min(report["started"] for report in reports),
+        # Shards run side by side, the slowest one is the wall time
+        "duration": max(report["duration"] for report in reports),
+        "summary": runner.summarize(records),
+        "tests": sorted(records, key=lambda r: r["id"]),
+        "shards": shards,
+    }
+    if counts:
+        count = counts.pop()
+        seen = {shard["index"] for shard in shards}
+        merged["missing_shards"] = [i for i in range(1, count + 1) if i not in seen]
+    # A split computed from different durations databases runs some tests twice and others never
+    merged["duplicated_tests"] = sorted(test_id for test_id, indexes in ran.items() if len(indexes) > 1)
+    # A class that failed to import reports one record under the class id
+    merged["unrun_tests"] = sorted(
+        test_id for test_id in suite if test_id not in ran and test_id.rsplit(".", 1)[0] not in ran
+    )
+    return merged
+
+
+def merge_timings(timing_reports, top=15):
+    """Combine timing reports (see tests/timing.py) and summarize them again"""
+    events = []
+    for report in timing_reports:
+        events.extend(report["events"])
+    return {"summary": timing.summarize(events, top), "events": events}
+
+
+def merge(report_paths, output, timing_paths=(), timing_output=None, top=15, record=False):
+    from tests import runner
+
+    report = merge_reports([_load(path) for path in report_paths])
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    runner.print_report(report)
+    for shard in report["shards"]:
+        print(
+            f"  shard {shard['index']}/{shard['count']}: {shard['summary']['total']} tests "
+            f"in {shard['duration']}s (estimated {shard['estimate']}s)"
+        )
+    if report.get("missing_shards"):
+        print(f"Missing results for shards: {report['missing_shards']}")
+    if report["duplicated_tests"]:
+        print(f"{len(report['duplicated_tests'])} tests ran in more than one shard:")
+        print("\n".join(f"  {test_id}" for test_id in report["duplicated_tests"]))
+    if report["unrun_tests"]:
+        print(f"{len(report['unrun_tests'])} tests ran in no shard:")
+        print("\n".join(f"  {test_id}" for test_id in report["unrun_tests"]))
+    print(f"Merged report written to {output}")
+
+    if timing_paths and timing_output:
+        timings = merge_timings([_load(path) for path in timing_paths], top)
+        with open(timing_output, "w", encoding="utf-8") as f:
+            json.dump(timings, f)
+        print(timing.format_summary(timings["summary"]))
+        print(f"Merged timing report written to {timing_output}")
+
+    if record:
+        # Keep the durations database used for the next split up to date
+        print(f"Recorded {durations.record(report['tests'])} test durations")
+    return report
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Plan shards or merge their results.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    plan_parser = commands.add_parser("plan", help="Print the classes assigned to each shard")
+    plan_parser.add_argument("case", type=int, help="Case number, same as tests.runner")
+    plan_parser.add_argument("count", type=int, help="Number of shards")
+
+    merge_parser = commands.add_parser("merge", help="Merge the reports of every shard")
+    merge_parser.add_argument("reports", nargs="+", help="Runner reports (--report) of the shards")
+    merge_parser.add_argument("--output", default="test_results.json")
+    merge_parser.add_argument("--timings", nargs="*", default=[], help="Timing reports of the shards")
+    merge_parser.add_argument("--timing-output", default="test_timings.json")
+    merge_parser.add_argument("--top", type=int, default=15)
+    merge_parser.add_argument(
+        "--record", action="store_true", help="Store the merged durations in the durations database"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    from tests import runner
+
+    args = parse_args(argv)
+    if args.command == "plan":
+        estimator = durations.Estimator()
+        for shard in plan(runner.discover(runner.CASES[args.case]), args.count, estimator):
+            print(f"Shard {shard['index']}/{args.count}: ~{shard['estimate']}s")
+            for unit_id in shard["units"]:
+                print(f"  {unit_id}")
+        return 0
+
+    report = merge(
+        args.reports, args.output, args.timings, args.timing_output, args.top, args.record
+    )
+    summary = report["summary"]
+    failed = (
+        summary["failed"]
+        or summary["error"]
+        or report.get("missing_shards")
+        or report["duplicated_tests"]
+        or report["unrun_tests"]
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
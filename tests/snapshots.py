@@ -0,0 +1,231 @@
+"""Golden snapshots of the app's client state for fast test setup.
+
+Many classes start from the same world (a few named chats, a folder, a known
+assistant) and rebuild it through the UI for every test. A snapshot builds it
+once, captures the browser's state, and restores that state for every later
+test in a fraction of the time:
+
+    def pokemon_world(test):
+        test.reset_state()
+        test.seed(folders=[seeding.folder("Pokemon")], conversations=[...])
+        test.right_sidebar.open().create_assistant("Professor Oak")
+
+    def setUp(self):
+        super().setUp()
+        self.restore_snapshot(pokemon_world)
+
+What is captured is everything the app reads on load: localStorage and the
+ChatUIStorage IndexedDB store (see utils/app/storage.ts). Snapshots are cached
+in tests/.snapshots/ under the builder's name, the test user and a hash of
+the builder's source code, so editing the builder rebuilds the snapshot on
+its next use and the outdated file is removed.
+
+Assistants live on the backend, not in the browser. A snapshot records the
+assistant ids its prompts refer to, and restoring checks them against
+/assistant/list; if one was deleted since (by reset_state, for example) the
+snapshot is rebuilt instead of restoring a dangling assistant. Conversations
+kept in the cloud are checked the same way with /state/conversation/get/multiple.
+"""
+
+import contextlib
+import glob
+import hashlib
+import inspect
+import json
+import os
+import re
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process lock, workers may build twice
+    fcntl = None
+
+SNAPSHOT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".snapshots")
+
+# Bump when the captured format changes, so every cached snapshot is rebuilt
+FORMAT_VERSION = 1
+
+_CAPTURE_JS = """
+const done = arguments[arguments.length - 1];
+const local = Object.assign({}, window.localStorage);
+const request = indexedDB.open('ChatUIStorage', 1);
+request.onupgradeneeded = () => {
+    if (!request.result.objectStoreNames.contains('keyvalue')) {
+        request.result.createObjectStore('keyvalue', {keyPath: 'key'});
+    }
+};
+request.onerror = () => done({error: String(request.error)});
+request.onsuccess = () => {
+    const getAll = request.result.transaction(['keyvalue'], 'readonly').objectStore('keyvalue').getAll();
+    getAll.onsuccess = () => done({localStorage: local, indexedDB: getAll.result});
+    getAll.onerror = () => done({error: String(getAll.error)});
+};
+"""
+
+# Replaces both stores with the snapshot in one IndexedDB transaction
+_RESTORE_JS = """
+const [snapshot, done] = [arguments[0], arguments[arguments.length - 1]];
+const request = indexedDB.open('ChatUIStorage', 1);
+request.onupgradeneeded = () => {
+    if (!request.result.objectStoreNames.contains('keyvalue')) {
+        request.result.createObjectStore('keyvalue', {keyPath: 'key'});
+    }
+};
+request.onerror = () => done({error: String(request.error)});
+request.onsuccess = () => {
+    const tx = request.result.transaction(['keyvalue'], 'readwrite');
+    const store = tx.objectStore('keyvalue');
+    store.clear();
+    for (const record of snapshot.indexedDB) store.put(record);
+    tx.oncomplete = () => {
+        window.localStorage.clear();
+        for (const [key, value] of Object.entries(snapshot.localStorage)) {
+            window.localStorage.setItem(key, value);
+        }
+        done({records: snapshot.indexedDB.length, keys: Object.keys(snapshot.localStorage).length});
+    };
+    tx.onerror = () => done({error: String(tx.error)});
+};
+"""
+
+# Which of the given assistant and cloud conversation ids the backend still has
+_SERVER_IDS_JS = """
+const [assistantIds, conversationIds, done] = [arguments[0], arguments[1], arguments[arguments.length - 1]];
+const encode = (data) => btoa(unescape(encodeURIComponent(JSON.stringify(data))));
+const decode = (data) => JSON.parse(decodeURIComponent(escape(atob(data))));
+const requestOp = async (op) => {
+    const response = await fetch('/api/requestOp', {
+        method: 'POST',
+        headers: {'Content-Type': 'application/json'},
+        body: JSON.stringify({data: op.data ? {...op, data: encode(op.data)} : op}),
+    });
+    if (!response.ok) throw new Error(`${op.path}${op.op}: ${response.statusText}`);
+    return decode((await response.json()).data);
+};
+(async () => {
+    const found = {assistants: [], conversations: []};
+    if (assistantIds.length) {
+        const listed = await requestOp({method: 'GET', path: '/assistant', op: '/list', service: 'assistant'});
+        const ids = new Set((listed.data || []).map((a) => a.assistantId));
+        found.assistants = assistantIds.filter((id) => ids.has(id));
+    }
+    if (conversationIds.length) {
+        const fetched = await requestOp({
+            method: 'POST', path: '/state/conversation', op: '/get/multiple',
+            data: {conversationIds: conversationIds}, service: 'conversation',
+        });
+        const gone = new Set([...(fetched.noSuchKeyConversations || []), ...(fetched.failed || [])]);
+        found.conversations = fetched.success ? conversationIds.filter((id) => !gone.has(id)) : [];
+    }
+    done(found);
+})().catch((e) => done({error: String(e)}));
+"""
+
+
+def builder_hash(builder):
+    """Hash of the builder's source, so any edit to it invalidates its snapshots"""
+    try:
+        source = inspect.getsource(builder)
+    except (OSError, TypeError):
+        source = builder.__qualname__
+    return hashlib.sha256(f"{FORMAT_VERSION}\n{source}".encode("utf-8")).hexdigest()[:16]
+
+
+def _slug(text):
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", text)
+
+
+def snapshot_path(builder, user):
+    user_hash = hashlib.sha256(user.encode("utf-8")).hexdigest()[:8]
+    name = _slug(f"{builder.__module__}.{builder.__qualname__}")
+    return os.path.join(SNAPSHOT_DIR, f"{name}-{user_hash}-{builder_hash(builder)}.json")
+
+
+@contextlib.contextmanager
+def build_lock(path):
+    """Let one worker build a snapshot while the others wait for its file"""
+    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+    if fcntl is None:
+        yield
+        return
+    with open(path + ".lock", "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _server_ids(snapshot):
+    """Assistant ids and cloud conversation ids the captured state refers to"""
+    records = {record["key"]: record["value"] for record in snapshot["indexedDB"]}
+
+    def stored(key):
+        raw = records.get(key, snapshot["localStorage"].get(key))
+        try:
+            return json.loads(raw) if raw else []
+        except ValueError:
+            return []
+
+    assistants = []
+    for prompt in stored("prompts"):
+        definition = ((prompt.get("data") or {}).get("assistant") or {}).get("definition") or {}
+        if definition.get("assistantId") and not prompt.get("groupId"):
+            if "amplify:system" not in (definition.get("tags") or []):
+                assistants.append(definition["assistantId"])
+    conversations = [c["id"] for c in stored("conversationHistory") if c.get("isLocal") is False]
+    return {"assistants": sorted(set(assistants)), "conversations": sorted(set(conversations))}
+
+
+def capture(driver):
+    state = driver.execute_async_script(_CAPTURE_JS)
+    if "error" in state:
+        raise RuntimeError(f"Capturing client storage failed: {state['error']}")
+    state["server"] = _server_ids(state)
+    state["captured_at"] = time.time()
+    return state
+
+
+def save(path, snapshot):
+    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+    temporary = f"{path}.{os.getpid()}.tmp"
+    with open(temporary, "w", encoding="utf-8") as f:
+        json.dump(snapshot, f)
+    os.replace(temporary, path)
+    # Snapshots of older versions of the same builder
+    prefix = path.rsplit("-", 1)[0] + "-"
+    for old in glob.glob(glob.escape(prefix) + "*.json"):
+        if old != path:
+            os.remove(old)
+
+
+def load(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def missing_server_items(driver, snapshot):
+    """Describe the backend items the snapshot needs that no longer exist"""
+    wanted = snapshot.get("server", {})
+    assistants = wanted.get("assistants", [])
+    conversations = wanted.get("conversations", [])
+    if not assistants and not conversations:
+        return []
+    found = driver.execute_async_script(_SERVER_IDS_JS, assistants, conversations)
+    if "error" in found:
+        return [f"could not check the backend: {found['error']}"]
+    missing = [f"assistant {a}" for a in assistants if a not in found["assistants"]]
+    missing += [f"conversation {c}" for c in conversations if c not in found["conversations"]]
+    return missing
+
+
+def restore(driver, snapshot):
+    """Replace localStorage and IndexedDB with the snapshot, without reloading"""
+    result = driver.execute_async_script(_RESTORE_JS, snapshot)
+    if "error" in result:
+        raise RuntimeError(f"Restoring client storage failed: {result['error']}")
+    return result
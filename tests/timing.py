@@ -0,0 +1,275 @@
+"""Per-step timing instrumentation for the Selenium suite.
+
+BaseTest records how long every WebDriver command, every ``wait.until`` and
+every raw ``time.sleep`` takes, together with the test, the helper function in
+the test module that issued it and the locator involved. Driver startup and
+login are recorded as their own steps, and every assistant reply waited for
+adds its time to first token, streaming time and total time ("reply" steps).
+
+Events are appended to ``$AMPLIFY_TIMING_DIR/timings-<pid>.jsonl`` after each
+test; the parallel runner sets that directory, merges the files into one JSON
+report and prints the top time sinks. A saved report can be summarized again:
+
+    python3 -m tests.timing test_timings.json
+"""
+
+import contextlib
+import glob
+import json
+import os
+import sys
+import time
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+_INFRA_FILES = {os.path.join(TESTS_DIR, name) for name in ("timing.py", "waits.py")}
+
+
+def _caller_helper(frame):
+    """Return "file:function" of the nearest test module frame, e.g. "test_Artifacts:create_chat" """
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename.startswith(TESTS_DIR) and os.path.basename(filename).startswith("test_"):
+            return f"{os.path.basename(filename)[:-3]}:{frame.f_code.co_name}"
+        frame = frame.f_back
+    return None
+
+
+def _readable_locator(using, value):
+    # Selenium sends By.ID as a CSS attribute selector
+    if using == "css selector" and value.startswith('[id="') and value.endswith('"]'):
+        return f"id={value[5:-2]}"
+    return f"{using}={value}"
+
+
+def condition_name(method):
+    # "presence_of_element_located.<locals>._predicate" -> "presence_of_element_located"
+    qualname = getattr(method, "__qualname__", None) or type(method).__name__
+    return qualname.split(".<locals>")[0]
+
+
+def condition_locator(method):
+    """Find the locator an expected condition (or a tests/waits.py condition) closes over"""
+    code = getattr(method, "__code__", None)
+    closure = getattr(method, "__closure__", None)
+    if code is None or not closure:
+        return None
+    for name, cell in zip(code.co_freevars, closure):
+        try:
+            value = cell.cell_contents
+        except ValueError:
+            continue
+        if name == "locator" and isinstance(value, tuple) and len(value) == 2:
+            using, target = value
+            return f"id={target}" if using == "id" else f"{using}={target}"
+        if name == "element_id" and isinstance(value, str):
+            return f"id={value}"
+    return None
+
+
+class Recorder:
+    """Collects timing events for the test that is currently running"""
+
+    def __init__(self):
+        self.current_test = None
+        self.events = []
+        self._depth = 0
+
+    def record(self, kind, name, seconds, locator=None, status="ok", helper=None):
+        if self.current_test is None:
+            return
+        self.events.append(
+            {
+                "test": self.current_test,
+                "kind": kind,
+                "name": name,
+                "locator": locator,
+                "helper": helper or _caller_helper(sys._getframe(1)),
+                "seconds": round(seconds, 4),
+                "status": status,
+            }
+        )
+
+    def record_reply(self, reply):
+        """Record the streaming times of a finished waits.AssistantReply"""
+        for name in ("time_to_first_token", "streaming_time", "total_time"):
+            self.record("reply", name, getattr(reply, name), reply.element_id)
+
+    @contextlib.contextmanager
+    def measure(self, kind, name, locator=None):
+        """Time a block; commands issued inside it are counted as part of it"""
+        helper = _caller_helper(sys._getframe(2))
+        status = "ok"
+        start = time.perf_counter()
+        self._depth += 1
+        try:
+            yield
+        except TimeoutException:
+            status = "timeout"
+            raise
+        except Exception:
+            status = "error"
+            raise
+        finally:
+            self._depth -= 1
+            if self._depth == 0:
+                self.record(kind, name, time.perf_counter() - start, locator, status, helper)
+
+    @property
+    def nested(self):
+        return self._depth > 0
+
+    def start_test(self, test_id):
+        self.current_test = test_id
+
+    def finish_test(self):
+        """Write the events of the finished test to $AMPLIFY_TIMING_DIR, if set"""
+        directory = os.getenv("AMPLIFY_TIMING_DIR")
+        if directory and self.events:
+            os.makedirs(directory, exist_ok=True)
+            path = os.path.join(directory, f"timings-{os.getpid()}.jsonl")
+            with open(path, "a", encoding="utf-8") as f:
+                f.writelines(json.dumps(event) + "\n" for event in self.events)
+        self.events = []
+        self.current_test = None
+
+
+recorder = Recorder()
+
+
+# ----------------- Hooks -----------------
+class TimedWebDriverWait(WebDriverWait):
+    """WebDriverWait that records how long each until/until_not call took"""
+
+    def until(self, method, message=""):
+        with recorder.measure("wait", condition_name(method), condition_locator(method)):
+            return super().until(method, message)
+
+    def until_not(self, method, message=""):
+        with recorder.measure("wait_not", condition_name(method), condition_locator(method)):
+            return super().until_not(method, message)
+
+
+def instrument_driver(driver):
+    """Record every WebDriver command sent by ``driver`` (once per driver)"""
+    if getattr(driver, "_timing_instrumented", False):
+        return driver
+    execute = driver.execute
+
+    def timed_execute(driver_command, params=None):
+        if recorder.nested:
+            return execute(driver_command, params)
+        locator = None
+        if params and "using" in params and "value" in params:
+            locator = _readable_locator(params["using"], params["value"])
+        with recorder.measure("command", driver_command, locator):
+            return execute(driver_command, params)
+
+    driver.execute = timed_execute
+    driver._timing_instrumented = True
+    return driver
+
+
+_original_sleep = None
+
+
+def instrument_sleep():
+    """Record raw time.sleep calls made from the tests/ package (once per process)"""
+    global _original_sleep
+    if _original_sleep is not None:
+        return
+    _original_sleep = time.sleep
+    original = _original_sleep
+
+    def timed_sleep(seconds):
+        # Skip wrappers such as the strict mode guard in tests/waits.py
+        frame = sys._getframe(1)
+        while frame.f_back is not None and frame.f_code.co_filename in _INFRA_FILES:
+            frame = frame.f_back
+        caller = frame.f_code.co_filename
+        if recorder.nested or not caller.startswith(TESTS_DIR) or caller in _INFRA_FILES:
+            return original(seconds)
+        start = time.perf_counter()
+        original(seconds)
+        recorder.record("sleep", f"time.sleep({seconds})", time.perf_counter() - start)
+
+    time.sleep = timed_sleep
+
+
+# ----------------- Reports -----------------
+def load_events(directory):
+    events = []
+    for path in sorted(glob.glob(os.path.join(directory, "timings-*.jsonl"))):
+        with open(path, encoding="utf-8") as f:
+            events.extend(json.loads(line) for line in f if line.strip())
+    return events
+
+
+def _aggregate(events, key):
+    groups = {}
+    for event in events:
+        group = groups.setdefault(key(event), {"count": 0, "seconds": 0.0, "max": 0.0})
+        group["count"] += 1
+        group["seconds"] += event["seconds"]
+        group["max"] = max(group["max"], event["seconds"])
+    return sorted(
+        (
+            {"key": k, "count": g["count"], "seconds": round(g["seconds"], 3), "max": round(g["max"], 3)}
+            for k, g in groups.items()
+        ),
+        key=lambda g: g["seconds"],
+        reverse=True,
+    )
+
+
+def summarize(events, top=15):
+    """Totals per step kind plus the top time sinks by step, locator and helper"""
+    # Reply times overlap the wait that produced them, keep them out of the sums per test
+    sinks = [e for e in events if e["kind"] != "reply"]
+    return {
+        "by_kind": _aggregate(events, lambda e: e["kind"]),
+        "top_steps": _aggregate(events, lambda e: f"{e['kind']} {e['name']}")[:top],
+        "top_locators": _aggregate(
+            [e for e in sinks if e["locator"]], lambda e: f"{e['kind']} {e['locator']}"
+        )[:top],
+        "top_helpers": _aggregate(
+            [e for e in sinks if e["helper"]], lambda e: e["helper"]
+        )[:top],
+        "top_tests": _aggregate(sinks, lambda e: e["test"])[:top],
+    }
+
+
+def format_summary(summary):
+    lines = []
+    titles = {
+        "by_kind": "Time by step kind",
+        "top_steps": "Slowest steps",
+        "top_locators": "Slowest locators",
+        "top_helpers": "Slowest helpers",
+        "top_tests": "Slowest tests",
+    }
+    for section, title in titles.items():
+        lines.append("")
+        lines.append(f"{title:<70} {'count':>7} {'total s':>9} {'max s':>8}")
+        lines.append("-" * 97)
+        for row in summary[section]:
+            lines.append(f"{row['key'][:70]:<70} {row['count']:>7} {row['seconds']:>9} {row['max']:>8}")
+    return "\n".join(lines)
+
+
+def write_report(events, path, top=15):
+    summary = summarize(events, top)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"summary": summary, "events": events}, f)
+    return summary
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Usage: python3 -m tests.timing <timing_report.json>")
+        sys.exit(1)
+    with open(sys.argv[1], encoding="utf-8") as f:
+        report = json.load(f)
+    print(format_summary(summarize(report["events"])))
@@ -0,0 +1,184 @@
+"""File upload helper that returns as soon as the attached file is usable.
+
+Attached files render as ``#attachedFile`` chips whose ``data-upload-state``
+goes from "uploading" (sending to storage) to "processing" (waiting on the
+document pipeline) to "ready". ``upload_file`` watches that chip instead of
+sleeping, and records how long each phase took per file.
+
+Set AMPLIFY_UPLOAD_REPORT to a path to append every upload as a JSON line,
+then summarize the times per file type with:
+
+    python3 -m tests.uploads upload_timings.jsonl
+"""
+
+import json
+import os
+import sys
+import time
+
+from selenium.common.exceptions import UnexpectedAlertPresentException
+
+from tests import reset, waits
+
+TEST_FILES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_files")
+
+# Every upload made by this process, see record_upload()
+upload_timings = []
+
+_CHIP_STATE_JS = """
+const name = arguments[0];
+const chips = [...document.querySelectorAll('[id="attachedFile"]')]
+    .filter((chip) => chip.dataset.fileName === name);
+const chip = chips[chips.length - 1];
+return [chips.length, chip ? chip.dataset.uploadState : null];
+"""
+
+
+def resolve_test_file(filename):
+    """Return the absolute path of ``filename``, relative paths are looked up in tests/test_files"""
+    path = filename if os.path.isabs(filename) else os.path.join(TEST_FILES_DIR, filename)
+    path = os.path.normpath(path)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Test file does not exist: {path}")
+    return path
+
+
+class _UploadWatcher:
+    """Condition that holds once the chip for ``name`` is ready, noting when processing began"""
+
+    def __init__(self, name, existing_chips):
+        self.name = name
+        self.existing_chips = existing_chips
+        self.processing_at = None
+
+    def __call__(self, driver):
+        try:
+            chips, state = driver.execute_script(_CHIP_STATE_JS, self.name)
+        except UnexpectedAlertPresentException as e:
+            # AttachFile alerts on "Upload failed" and on files without text
+            raise AssertionError(f"Upload of {self.name} failed: {e.alert_text}") from e
+        if chips <= self.existing_chips:
+            return False  # Only an earlier upload of the same file is showing
+        if state == "processing" and self.processing_at is None:
+            self.processing_at = time.monotonic()
+        return state == "ready"
+
+
+def upload_file(driver, filename, input_id="__attachFile", timeout=120):
+    """Attach ``filename`` through the file input ``input_id`` and wait until it is ready"""
+    path = resolve_test_file(filename)
+    name = os.path.basename(path)
+
+    # The chat input hides its file input (sr-only), make it interactable
+    file_input = waits.wait_for(driver, input_id)
+    driver.execute_script(
+        "arguments[0].classList.remove('sr-only'); arguments[0].style.display = 'block';",
+        file_input,
+    )
+
+    existing_chips, _ = driver.execute_script(_CHIP_STATE_JS, name)
+    start = time.monotonic()
+    file_input.send_keys(path)
+    watcher = _UploadWatcher(name, existing_chips)
+    waits.poll(driver, timeout).until(
+        watcher, f"{name} was not ready within {timeout}s"
+    )
+    end = time.monotonic()
+
+    # Without a processing phase (e.g. local extraction) everything counts as upload
+    upload_end = watcher.processing_at or end
+    return record_upload(path, upload_end - start, end - upload_end)
+
+
+_DELETE_JS = reset.REQUEST_OP_JS + """
+const [name, done] = [arguments[0], arguments[arguments.length - 1]];
+(async () => {
+    const found = await requestOp({
+        method: 'POST', path: '/files', op: '/query', data: {namePrefix: name, pageSize: 100}, service: 'file',
+    });
+    const items = found.success && found.data ? (found.data.items || []) : [];
+    const failed = [];
+    let deleted = 0;
+    for (const item of items.filter((item) => item.name === name)) {
+        const result = await requestOp({
+            method: 'POST', path: '/files', op: '/delete', data: {key: item.id}, service: 'file',
+        });
+        if (result.success) deleted += 1; else failed.push(`${item.id}: ${result.message || 'not deleted'}`);
+    }
+    if (!found.success) failed.push(`query: ${found.message}`);
+    done([deleted, failed]);
+})();
+"""
+
+
+def delete_uploaded(driver, name):
+    """Delete every file named ``name`` from the user's files, the way the file manager does"""
+    deleted, failed = driver.execute_async_script(_DELETE_JS, name)
+    if failed:
+        print(f"Could not delete every upload of {name}: {failed}")
+    return deleted
+
+
+def record_upload(path, upload_seconds, processing_seconds):
+    size = os.path.getsize(path)
+    total = upload_seconds + processing_seconds
+    record = {
+        "file": os.path.basename(path),
+        "type": os.path.splitext(path)[1].lstrip(".").lower(),
+        "bytes": size,
+        "upload_seconds": round(upload_seconds, 3),
+        "upload_mb_per_second": round(size / 1e6 / upload_seconds, 3) if upload_seconds else None,
+        "processing_seconds": round(processing_seconds, 3),
+        "total_seconds": round(total, 3),
+        "seconds_per_byte": total / size if size else None,
+    }
+    upload_timings.append(record)
+    print(
+        f"Uploaded {record['file']} ({size} bytes) in {total:.2f}s "
+        f"(upload {upload_seconds:.2f}s, processing {processing_seconds:.2f}s)"
+    )
+
+    report_path = os.getenv("AMPLIFY_UPLOAD_REPORT")
+    if report_path:
+        with open(report_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+    return record
+
+
+def summarize(records):
+    """Aggregate upload records per file type"""
+    by_type = {}
+    for record in records:
+        by_type.setdefault(record["type"], []).append(record)
+
+    summary = {}
+    for file_type, items in sorted(by_type.items()):
+        total_bytes = sum(r["bytes"] for r in items)
+        total_seconds = sum(r["total_seconds"] for r in items)
+        summary[file_type] = {
+            "uploads": len(items),
+            "mean_seconds": round(total_seconds / len(items), 3),
+            "mean_processing_seconds": round(
+                sum(r["processing_seconds"] for r in items) / len(items), 3
+            ),
+            "seconds_per_mb": round(total_seconds / (total_bytes / 1e6), 3) if total_bytes else None,
+            "upload_mb_per_second": round(
+                total_bytes / 1e6 / sum(r["upload_seconds"] for r in items), 3
+            ) if sum(r["upload_seconds"] for r in items) else None,
+        }
+    return summary
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Usage: python3 -m tests.uploads <upload_report.jsonl>")
+        sys.exit(1)
+    with open(sys.argv[1], encoding="utf-8") as f:
+        loaded = [json.loads(line) for line in f if line.strip()]
+    print(f"{'type':<6} {'uploads':>8} {'mean s':>8} {'processing s':>13} {'s/MB':>8} {'upload MB/s':>12}")
+    for file_type, stats in summarize(loaded).items():
+        print(
+            f"{file_type:<6} {stats['uploads']:>8} {stats['mean_seconds']:>8} "
+            f"{stats['mean_processing_seconds']:>13} {stats['seconds_per_mb'] or '-':>8} "
+            f"{stats['upload_mb_per_second'] or '-':>12}"
+        )
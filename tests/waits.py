@@ -0,0 +1,337 @@
+"""Condition-based waits to use instead of fixed ``time.sleep`` calls.
+
+Every helper polls the page with a short interval and returns as soon as its
+condition holds, raising TimeoutException otherwise. BaseTest exposes them as
+``self.settle()``, ``self.wait_for_text(...)`` and so on.
+
+Strict mode (AMPLIFY_STRICT_WAITS=warn or fail) records every raw
+``time.sleep`` made from a test module so the remaining ones can be found and
+replaced; "fail" turns them into test errors.
+"""
+
+import ast
+import inspect
+import os
+import time
+import warnings
+
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+
+from tests.timing import TimedWebDriverWait
+
+POLL_INTERVAL = 0.1
+DEFAULT_TIMEOUT = 10
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Counts DOM mutations on the page, installed on demand by settle()
+_MUTATION_COUNTER_JS = """
+if (!window.__amplifyMutations) {
+    window.__amplifyMutations = {count: 0};
+    new MutationObserver((records) => {
+        window.__amplifyMutations.count += records.length;
+    }).observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+}
+return [document.readyState, window.__amplifyMutations.count];
+"""
+
+
+def poll(driver, timeout=DEFAULT_TIMEOUT):
+    """WebDriverWait with the short polling interval used by every helper here"""
+    return TimedWebDriverWait(
+        driver,
+        timeout,
+        poll_frequency=POLL_INTERVAL,
+        ignored_exceptions=(StaleElementReferenceException,),
+    )
+
+
+class _Quiet:
+    """Condition that holds once ``probe`` returns the same value for ``quiet`` seconds"""
+
+    def __init__(self, probe, quiet):
+        self.probe = probe
+        self.quiet = quiet
+        self.last = None
+        self.since = None
+
+    def __call__(self, driver):
+        value = self.probe(driver)
+        now = time.monotonic()
+        if value is None or value != self.last:
+            self.last = value
+            self.since = now
+            return False
+        return now - self.since >= self.quiet and value
+
+
+# ----------------- Page -----------------
+def settle(driver, quiet=0.3, timeout=DEFAULT_TIMEOUT):
+    """Wait until the page has loaded and the DOM stopped changing for ``quiet`` seconds"""
+
+    def probe(d):
+        state, mutations = d.execute_script(_MUTATION_COUNTER_JS)
+        return (mutations,) if state == "complete" else None
+
+    poll(driver, timeout).until(
+        _Quiet(probe, quiet),
+        f"Page did not settle within {timeout}s",
+    )
+
+
+# ----------------- Elements -----------------
+def wait_for(driver, element_id, timeout=DEFAULT_TIMEOUT):
+    """Wait for the element with ``element_id`` to be present and return it"""
+    return poll(driver, timeout).until(
+        EC.presence_of_element_located((By.ID, element_id)),
+        f"#{element_id} did not appear within {timeout}s",
+    )
+
+
+def wait_for_clickable(driver, element_id, timeout=DEFAULT_TIMEOUT):
+    """Wait for the element with ``element_id`` to be visible and enabled and return it"""
+    return poll(driver, timeout).until(
+        EC.element_to_be_clickable((By.ID, element_id)),
+        f"#{element_id} was not clickable within {timeout}s",
+    )
+
+
+def wait_for_gone(driver, element_id, timeout=DEFAULT_TIMEOUT):
+    """Wait for the element with ``element_id`` to be removed or hidden"""
+    poll(driver, timeout).until(
+        EC.invisibility_of_element_located((By.ID, element_id)),
+        f"#{element_id} was still visible after {timeout}s",
+    )
+
+
+def wait_for_text(driver, element_id, text, timeout=DEFAULT_TIMEOUT):
+    """Wait until an element with ``element_id`` contains ``text`` and return it.
+
+    Ids are reused across list items in this app (chatName, dropName, ...), so
+    every element with the id is checked, not only the first one.
+    """
+
+    def has_text(d):
+        for element in d.find_elements(By.ID, element_id):
+            if text in element.text:
+                return element
+        return False
+
+    return poll(driver, timeout).until(
+        has_text, f"No #{element_id} contained {text!r} within {timeout}s"
+    )
+
+
+def wait_for_count(driver, element_id, count, timeout=DEFAULT_TIMEOUT):
+    """Wait until exactly ``count`` elements have ``element_id`` and return them"""
+
+    def has_count(d):
+        elements = d.find_elements(By.ID, element_id)
+        return elements if len(elements) == count else False
+
+    if count == 0:
+        poll(driver, timeout).until(
+            lambda d: not d.find_elements(By.ID, element_id),
+            f"#{element_id} elements were still present after {timeout}s",
+        )
+        return []
+    return poll(driver, timeout).until(
+        has_count, f"Expected {count} #{element_id} elements within {timeout}s"
+    )
+
+
+def wait_until_stable(driver, element_id, quiet=0.5, timeout=DEFAULT_TIMEOUT):
+    """Wait until the element's text and size stop changing for ``quiet`` seconds"""
+
+    def probe(d):
+        elements = d.find_elements(By.ID, element_id)
+        if not elements:
+            return None
+        element = elements[0]
+        return (element.text, element.size["width"], element.size["height"])
+
+    poll(driver, timeout).until(
+        _Quiet(probe, quiet), f"#{element_id} did not stop changing within {timeout}s"
+    )
+    return driver.find_element(By.ID, element_id)
+
+
+# ----------------- Chat -----------------
+# Reads the reply being waited for and whether the UI still reports streaming.
+# Without an index the reply is the last assistantMessage{n} that comes after
+# the last user message, i.e. the answer to the prompt that was just sent.
+_REPLY_STATE_JS = """
+const index = arguments[0];
+let reply = null;
+if (index !== null) {
+    reply = document.getElementById('assistantMessage' + index);
+} else {
+    const users = document.querySelectorAll('[id^="userMessage"]');
+    const replies = document.querySelectorAll('[id^="assistantMessage"]');
+    const lastUser = users[users.length - 1];
+    const last = replies[replies.length - 1];
+    if (last && (!lastUser || (lastUser.compareDocumentPosition(last) & Node.DOCUMENT_POSITION_FOLLOWING))) {
+        reply = last;
+    }
+}
+const send = document.getElementById('sendMessage');
+const standaloneInput = document.getElementById('assistantChatInput');
+const streaming = !!document.getElementById('stopGenerating')
+    || !!(send && send.querySelector('.animate-spin'))
+    || !!(standaloneInput && standaloneInput.disabled);
+return [reply ? reply.id : null, reply ? reply.innerText : '', streaming];
+"""
+
+
+class AssistantReply:
+    """A finished assistant reply; times are seconds since the message was sent"""
+
+    def __init__(self, element_id, text, time_to_first_token, streaming_time, total_time):
+        self.element_id = element_id
+        self.text = text
+        self.time_to_first_token = time_to_first_token
+        self.streaming_time = streaming_time
+        self.total_time = total_time
+
+    def __repr__(self):
+        return (
+            f"AssistantReply({self.element_id}, {len(self.text)} chars, "
+            f"ttft={self.time_to_first_token:.2f}s, streaming={self.streaming_time:.2f}s, "
+            f"total={self.total_time:.2f}s)"
+        )
+
+
+class _ReplyWatcher:
+    """Condition for wait_for_assistant_reply that also tracks streaming times"""
+
+    def __init__(self, index, quiet, sent_at):
+        self.index = index
+        self.quiet = quiet
+        self.sent_at = sent_at
+        self.last = None
+        self.changed_at = sent_at
+        self.first_token_at = None
+
+    def __call__(self, driver):
+        element_id, text, streaming = driver.execute_script(_REPLY_STATE_JS, self.index)
+        now = time.monotonic()
+        if element_id is None or not text.strip():
+            self.last = None
+            return False
+
+        # First text of this reply (the target can move on from an older reply)
+        if self.last is None or self.last[0] != element_id:
+            self.first_token_at = now
+        if (element_id, text) != self.last:
+            self.last = (element_id, text)
+            self.changed_at = now
+            return False
+        if streaming or now - self.changed_at < self.quiet:
+            return False
+
+        return AssistantReply(
+            element_id,
+            text,
+            time_to_first_token=self.first_token_at - self.sent_at,
+            streaming_time=self.changed_at - self.first_token_at,
+            total_time=now - self.sent_at,
+        )
+
+
+def wait_for_assistant_reply(driver, index=None, quiet=1.0, timeout=120, sent_at=None):
+    """Wait until the assistant finished answering and return an AssistantReply.
+
+    The reply is done once ``assistantMessage{index}`` (or, without an index,
+    the reply to the latest user message) has text, the chat no longer shows
+    it is streaming, and the text has not grown for ``quiet`` seconds.
+    ``sent_at`` is the time.monotonic() of the send click and defaults to now.
+    """
+    watcher = _ReplyWatcher(index, quiet, time.monotonic() if sent_at is None else sent_at)
+    target = f"assistantMessage{index}" if index is not None else "the assistant reply"
+    reply = poll(driver, timeout).until(
+        watcher, f"{target} did not finish streaming within {timeout}s"
+    )
+    return reply
+
+
+# ----------------- Strict mode -----------------
+def strict_mode():
+    """Return "warn", "fail" or None from AMPLIFY_STRICT_WAITS"""
+    mode = os.getenv("AMPLIFY_STRICT_WAITS", "").lower()
+    return mode if mode in ("warn", "fail") else None
+
+
+class SleepGuard:
+    """Records ``time.sleep`` calls made directly from test modules while installed"""
+
+    def __init__(self):
+        self.calls = []
+        self._original = None
+
+    def install(self):
+        self._original = time.sleep
+        original = self._original
+
+        def guarded_sleep(seconds):
+            caller = inspect.currentframe().f_back
+            filename = os.path.abspath(caller.f_code.co_filename)
+            if filename.startswith(TESTS_DIR) and os.path.basename(filename).startswith("test_"):
+                self.calls.append(
+                    (os.path.relpath(filename, TESTS_DIR), caller.f_lineno, seconds)
+                )
+            original(seconds)
+
+        time.sleep = guarded_sleep
+
+    def uninstall(self):
+        if self._original is not None:
+            time.sleep = self._original
+            self._original = None
+
+    def report(self):
+        lines = [f"{path}:{line} time.sleep({seconds})" for path, line, seconds in self.calls]
+        total = sum(seconds for _, _, seconds in self.calls)
+        return f"{len(self.calls)} raw time.sleep calls ({total}s):\n" + "\n".join(lines)
+
+    def check(self, mode):
+        """Warn or raise AssertionError for the recorded calls, depending on ``mode``"""
+        if not self.calls:
+            return
+        if mode == "fail":
+            raise AssertionError(self.report())
+        warnings.warn(self.report(), stacklevel=2)
+
+
+def scan_sleeps(root=TESTS_DIR):
+    """Statically list every ``time.sleep(...)`` call in the test modules under ``root``"""
+    calls = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith((".", "__")))
+        for filename in sorted(filenames):
+            if not (filename.startswith("test_") and filename.endswith(".py")):
+                continue
+            path = os.path.join(dirpath, filename)
+            with open(path, encoding="utf-8") as f:
+                tree = ast.parse(f.read(), filename=path)
+            for node in ast.walk(tree):
+                if (
+                    isinstance(node, ast.Call)
+                    and isinstance(node.func, ast.Attribute)
+                    and node.func.attr == "sleep"
+                    and isinstance(node.func.value, ast.Name)
+                    and node.func.value.id == "time"
+                ):
+                    arg = node.args[0] if node.args else None
+                    seconds = arg.value if isinstance(arg, ast.Constant) else None
+                    calls.append((os.path.relpath(path, root), node.lineno, seconds))
+    return calls
+
+
+if __name__ == "__main__":
+    found = scan_sleeps()
+    for path, line, seconds in found:
+        print(f"{path}:{line} time.sleep({seconds})")
+    total = sum(seconds for _, _, seconds in found if isinstance(seconds, (int, float)))
+    print(f"{len(found)} raw time.sleep calls, {total}s of fixed waiting")